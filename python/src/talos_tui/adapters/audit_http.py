@@ -2,10 +2,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional, Any
+from typing import Any, Dict, Optional
 import aiohttp
+import jsonschema
 from pydantic import ValidationError
+from ..core.contracts import ValidationPolicy
+from ..core.telemetry import TELEMETRY
 from ..domain.models import AuditPage, AuditEvent, VersionInfo, Health
+from ..ports.errors import TuiError
 from .base import BaseHttpAdapter
 
 
@@ -21,6 +25,7 @@ class HttpAuditAdapter(BaseHttpAdapter):
         session: aiohttp.ClientSession,
         validator: Optional[Any] = None,
         version: str = "0.1.0",
+        validation_policy: Optional[ValidationPolicy] = None,
         **kwargs: Any
     ):
         """
@@ -28,10 +33,12 @@ class HttpAuditAdapter(BaseHttpAdapter):
         @param session: The Client Session.
         @param validator: Functional Validator.
         @param version: API Version.
+        @param validation_policy: How many events to validate (default: all).
         """
         super().__init__(base_url, session, **kwargs)
 
         self.validator = validator
+        self.validation_policy = validation_policy or ValidationPolicy()
         self.headers = {"User-Agent": f"talos-tui/{version}"}
 
     async def get_version(self) -> VersionInfo:
@@ -53,7 +60,10 @@ class HttpAuditAdapter(BaseHttpAdapter):
         if before:
             params["before"] = before
 
-        data = await self._request("GET", "api/events", params=params)
+        # Payloads stay unredacted until inspected (see AuditEvent)
+        data = await self._request(
+            "GET", "api/events", params=params, keep_raw=("payload",)
+        )
 
         items_data = data.get("items", [])
         if not isinstance(items_data, list):
@@ -64,12 +74,18 @@ class HttpAuditAdapter(BaseHttpAdapter):
             try:
                 # Mechanized validation
                 if self.validator:
-                    self.validator.validate(
-                        "audit/audit_event.schema.json", i
-                    )
+                    with TELEMETRY.timer("audit.validate"):
+                        self.validation_policy.check(
+                            self.validator, "audit/audit_event.schema.json", i
+                        )
 
                 items.append(AuditEvent(**i))
-            except (ValidationError, TypeError, ValueError) as e:
+            except (
+                ValidationError,
+                jsonschema.ValidationError,
+                TypeError,
+                ValueError,
+            ) as e:
                 logger.error("Failed to parse or validate AuditEvent: %s", e)
 
         return AuditPage(
@@ -77,3 +93,36 @@ class HttpAuditAdapter(BaseHttpAdapter):
             next_cursor=data.get("next_cursor"),
             has_more=data.get("has_more", False)
         )
+
+    async def get_event(self, event_id: str) -> AuditEvent:
+        """Fetch one full audit event by id."""
+        if not event_id or "/" in event_id or event_id in (".", ".."):
+            raise TuiError(
+                kind="BAD_RESPONSE", message=f"Invalid event id {event_id!r}"
+            )
+        data = await self._request(
+            "GET",
+            f"api/events/{event_id}",
+            keep_raw=("payload",),
+            route="api/events/{id}",
+        )
+        try:
+            if self.validator:
+                self.validation_policy.check(
+                    self.validator, "audit/audit_event.schema.json", data
+                )
+            return AuditEvent(**data)
+        except (
+            ValidationError,
+            jsonschema.ValidationError,
+            TypeError,
+            ValueError,
+        ) as e:
+            raise TuiError(
+                kind="BAD_RESPONSE",
+                message=f"Invalid audit event {event_id}: {e}",
+            ) from e
+
+    def validation_stats(self) -> Dict[str, Any]:
+        """Validation counters (see ValidationPolicy.stats)."""
+        return self.validation_policy.stats()
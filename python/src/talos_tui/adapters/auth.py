@@ -0,0 +1,252 @@
+"""Bearer-token authentication with caching and refresh-ahead."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import shlex
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional
+
+import aiohttp
+
+from ..core.telemetry import TELEMETRY
+from ..ports.errors import TuiError
+from .config import TuiConfig
+
+logger = logging.getLogger(__name__)
+
+Clock = Callable[[], float]
+
+
+@dataclass(frozen=True)
+class Token:
+    """An issued credential; `expires_in` is None if it never expires."""
+
+    value: str
+    expires_in: Optional[float] = None
+
+
+TokenSource = Callable[[], Awaitable[Token]]
+
+
+class CachedTokenAuth:
+    """
+    AuthPort over a token issuer, shared by all adapters:
+    - The token is cached and sent as `<header>: <scheme> <token>`, so
+      polling costs no issuer round-trip per request.
+    - Refresh-ahead: from `refresh_ahead` seconds before expiry (jittered,
+      and never before half the lifetime) the cached token keeps being
+      served while one background refresh runs. A failed background
+      refresh is retried after `retry_interval` until the token expires.
+    - Single-flight: concurrent callers share one in-flight refresh.
+    - `invalidate()` (after a 401) drops the token it was given, so the
+      next caller fetches a new one.
+    """
+
+    def __init__(
+        self,
+        source: TokenSource,
+        header: str = "Authorization",
+        scheme: str = "Bearer",
+        refresh_ahead: float = 60.0,
+        retry_interval: float = 5.0,
+        clock: Clock = time.monotonic,
+    ):
+        self.source = source
+        self.header = header
+        self.scheme = scheme
+        self.refresh_ahead = refresh_ahead
+        self.retry_interval = retry_interval
+        self._clock = clock
+        self._headers: Dict[str, str] = {}
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._flight: Optional[asyncio.Future[None]] = None
+        self.refreshes = 0
+
+    def _valid(self) -> bool:
+        return bool(self._headers) and self._clock() < self._expires_at
+
+    def auth_headers(self) -> Mapping[str, str]:
+        """
+        The cached headers (empty without a valid token). Never waits;
+        starts a background refresh once the token is due for one.
+        """
+        if not self._valid():
+            return {}
+        if self._clock() >= self._refresh_at and self._flight is None:
+            self._refresh()
+        return self._headers
+
+    async def acquire_headers(self) -> Mapping[str, str]:
+        """The cached headers, waiting for a token only if none is valid."""
+        if not self._valid():
+            await asyncio.shield(self._refresh())
+        return self.auth_headers()
+
+    def invalidate(self, headers: Mapping[str, str]) -> None:
+        """Drop the token behind `headers` if it is still the cached one."""
+        if headers and headers == self._headers:
+            logger.info("Auth token rejected; refreshing")
+            self._headers = {}
+
+    def _refresh(self) -> asyncio.Future[None]:
+        if self._flight is None:
+            self._flight = asyncio.ensure_future(self._fetch())
+            self._flight.add_done_callback(self._land)
+        return self._flight
+
+    def _land(self, flight: asyncio.Future[None]) -> None:
+        self._flight = None
+        if not flight.cancelled() and flight.exception() is not None:
+            # Keep serving a still-valid token; retry the refresh later
+            self._refresh_at = self._clock() + self.retry_interval
+
+    async def _fetch(self) -> None:
+        try:
+            with TELEMETRY.timer("auth.refresh"):
+                token = await self.source()
+        except TuiError as e:
+            TELEMETRY.counter("auth.refresh_failures").inc()
+            logger.warning("Token refresh failed: %s", e.message)
+            raise
+        except Exception as e:
+            TELEMETRY.counter("auth.refresh_failures").inc()
+            logger.warning("Token refresh failed: %s", e)
+            raise TuiError(
+                kind="NETWORK",
+                message=f"Token refresh failed: {e}",
+                retryable=True,
+            ) from e
+
+        now = self._clock()
+        self.refreshes += 1
+        TELEMETRY.counter("auth.refreshes").inc()
+        value = f"{self.scheme} {token.value}" if self.scheme else token.value
+        self._headers = {self.header: value}
+        if token.expires_in is None:
+            self._expires_at = self._refresh_at = float("inf")
+            return
+        lifetime = token.expires_in
+        # Jitter keeps several clients from hitting the issuer together
+        ahead = self.refresh_ahead * random.uniform(0.8, 1.0)
+        self._expires_at = now + lifetime
+        self._refresh_at = now + max(lifetime / 2, lifetime - ahead)
+
+
+def _parse_token(data: Any) -> Token:
+    if isinstance(data, str):
+        return Token(data)
+    value = data.get("access_token") or data.get("token")
+    if not value:
+        raise TuiError(kind="AUTH", message="Issuer returned no token")
+    expires_in = data.get("expires_in")
+    return Token(
+        str(value), float(expires_in) if expires_in is not None else None
+    )
+
+
+def static_source(value: str) -> TokenSource:
+    """A fixed token (e.g. from TALOS_TUI_AUTH_TOKEN)."""
+
+    async def fetch() -> Token:
+        return Token(value)
+
+    return fetch
+
+
+def command_source(command: str, timeout: float = 30.0) -> TokenSource:
+    """
+    Run `command` for each refresh. It prints either the bare token or
+    JSON with `access_token` (or `token`) and optional `expires_in`.
+    """
+    argv = shlex.split(command)
+
+    async def fetch() -> Token:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            out, err = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            raise
+        if proc.returncode != 0:
+            raise TuiError(
+                kind="AUTH",
+                message=f"Token command failed ({proc.returncode}): "
+                        f"{err.decode(errors='replace').strip()[:200]}",
+            )
+        text = out.decode().strip()
+        return _parse_token(json.loads(text) if text[:1] == "{" else text)
+
+    return fetch
+
+
+def client_credentials_source(
+    session: aiohttp.ClientSession,
+    token_url: str,
+    client_id: str,
+    client_secret: str,
+    scope: str = "",
+) -> TokenSource:
+    """OAuth2 client-credentials grant against `token_url`."""
+
+    async def fetch() -> Token:
+        form = {"grant_type": "client_credentials"}
+        if scope:
+            form["scope"] = scope
+        async with session.post(
+            token_url,
+            data=form,
+            auth=aiohttp.BasicAuth(client_id, client_secret),
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as resp:
+            if resp.status in (400, 401, 403):
+                raise TuiError(
+                    kind="AUTH",
+                    message=f"Token request denied ({resp.status})",
+                    status_code=resp.status,
+                )
+            if resp.status >= 300:
+                raise TuiError(
+                    kind="NETWORK",
+                    message=f"Token endpoint error {resp.status}",
+                    status_code=resp.status,
+                    retryable=True,
+                )
+            return _parse_token(await resp.json())
+
+    return fetch
+
+
+def auth_from_config(
+    config: TuiConfig, session: aiohttp.ClientSession
+) -> Optional[CachedTokenAuth]:
+    """The configured token issuer, or None if auth is not configured."""
+    source: Optional[TokenSource] = None
+    if config.auth_token:
+        source = static_source(config.auth_token)
+    elif config.auth_command:
+        source = command_source(config.auth_command)
+    elif config.auth_token_url:
+        source = client_credentials_source(
+            session,
+            config.auth_token_url,
+            config.auth_client_id,
+            config.auth_client_secret,
+            config.auth_scope,
+        )
+    if source is None:
+        return None
+    return CachedTokenAuth(
+        source,
+        header=config.auth_header,
+        scheme=config.auth_scheme,
+        refresh_ahead=config.auth_refresh_ahead,
+    )
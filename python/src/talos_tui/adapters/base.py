@@ -5,62 +5,39 @@ import asyncio
 import logging
 import random
 import time
-import re
-from typing import Any, Dict, Optional, TypeVar
+from functools import partial
+from typing import (
+    Any, Callable, Dict, List, Mapping, Optional, Tuple, TypeVar, cast
+)
 import aiohttp
 from yarl import URL
 from aiohttp import ClientTimeout
 
-from ..ports.errors import TuiError
-
-
-logger = logging.getLogger(__name__)
-
-DENYLIST = {
-    "authorization", "token", "secret", "password", "private_key",
-    "api_key", "cookie", "set-cookie", "session", "ciphertext",
-    "header_b64u", "ciphertext_b64u", "nonce", "x-talos-token", "x-capability"
-}
-
-PEM_PATTERN = re.compile(
-    r"-----BEGIN [A-Z ]+-----(.*?)-----END [A-Z ]+-----", re.DOTALL
+from ..core.redaction import (  # noqa: F401 (re-exported)
+    DENYLIST,
+    JWT_PATTERN,
+    PEM_PATTERN,
+    redact_dict,
+    redact_value,
 )
-JWT_PATTERN = re.compile(
-    r"eyJ[a-zA-Z0-9-_]+\.eyJ[a-zA-Z0-9-_]+\.[a-zA-Z0-9-_]+"
+from ..core.telemetry import TELEMETRY
+from ..ports import AuthPort
+from ..ports.errors import TuiError
+from .resilience import (
+    CircuitBreaker,
+    CircuitState,
+    RateLimiter,
+    RetryBudget,
+    parse_retry_after,
 )
 
 
-def redact_dict(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Redact sensitive keys in a dictionary recursively."""
-
-    new_data = {}
-    for k, v in data.items():
-        if k.lower() in DENYLIST:
-            new_data[k] = "***REDACTED***"
-        else:
-            new_data[k] = redact_value(v)
-    return new_data
-
-
-def redact_value(v: Any) -> Any:
-    """Redact a single value based on type and content patterns."""
-
-    if isinstance(v, dict):
-        return redact_dict(v)
-    elif isinstance(v, list):
-        return [redact_value(i) for i in v]
-    elif isinstance(v, str):
-        if PEM_PATTERN.search(v):
-            return "***PEM REDACTED***"
-        if len(v) > 100 and JWT_PATTERN.match(v):  # Heuristic for JWT
-            return "***JWT REDACTED***"
-        if len(v) > 65536:  # Cap large fields
-            return v[:64] + "...(TRUNCATED)"
-    return v
-
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+RequestKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
 
 class BaseHttpAdapter:
     """
@@ -69,6 +46,14 @@ class BaseHttpAdapter:
     - Redacted structured logging
     - Hard timeouts and payload limits
     - Normalized error classification
+    - Per-endpoint circuit breakers and an optional shared retry budget
+    - Client-side rate limiting that honors Retry-After/X-RateLimit-*
+    - Single-flight GETs: concurrent identical requests share one call,
+      optionally memoized for `memo_ttl` seconds (expired results are
+      evicted as new ones land). Callers receive the same decoded dict
+      and must treat it as read-only.
+    - Optional `auth` (an AuthPort): its cached headers are sent with each
+      request; a 401 invalidates the token and retries once.
     """
 
     def __init__(
@@ -79,6 +64,16 @@ class BaseHttpAdapter:
         connect_timeout: float = 3.0,
         total_timeout: float = 10.0,
         max_response_size: int = 1_000_000,  # 1MB
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_failure_threshold: int = 5,
+        circuit_reset_timeout: float = 30.0,
+        rate_limit: Optional[float] = None,
+        rate_burst: float = 10.0,
+        max_rate_limit_wait: float = 30.0,
+        memo_ttl: float = 0.0,
+        backoff_base: float = 0.5,
+        backoff_max: float = 5.0,
+        auth: Optional[AuthPort] = None,
     ):
         self.base_url = URL(base_url)
         self.session = session
@@ -87,6 +82,64 @@ class BaseHttpAdapter:
             connect=connect_timeout, total=total_timeout
         )
         self.max_response_size = max_response_size
+        self.retry_budget = retry_budget
+        self.circuit_failure_threshold = circuit_failure_threshold
+        self.circuit_reset_timeout = circuit_reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._circuit_listeners: List[
+            Callable[[str, CircuitState], None]
+        ] = []
+        self.rate_limiter = RateLimiter(rate=rate_limit, burst=rate_burst)
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.memo_ttl = memo_ttl
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.auth = auth
+        self.headers: Dict[str, str] = {}
+        self._inflight: Dict[RequestKey, asyncio.Future[Dict[str, Any]]] = {}
+        self._memo: Dict[RequestKey, Tuple[float, Dict[str, Any]]] = {}
+        self.dedup_stats = {"requests": 0, "coalesced": 0, "memo_hits": 0}
+
+    def add_circuit_listener(
+        self, listener: Callable[[str, CircuitState], None]
+    ) -> None:
+        """Register a callback for circuit state changes per endpoint."""
+        self._circuit_listeners.append(listener)
+
+    def circuit_states(self) -> Dict[str, CircuitState]:
+        """Current circuit state per endpoint seen so far."""
+        return {name: b.state for name, b in self._breakers.items()}
+
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                endpoint,
+                failure_threshold=self.circuit_failure_threshold,
+                reset_timeout=self.circuit_reset_timeout,
+                on_change=self._notify_circuit,
+            )
+            self._breakers[endpoint] = breaker
+        return breaker
+
+    def _notify_circuit(self, endpoint: str, state: CircuitState) -> None:
+        for listener in self._circuit_listeners:
+            listener(endpoint, state)
+
+    def _can_retry(self, attempt: int, breaker: CircuitBreaker) -> bool:
+        if attempt >= self.max_attempts or not breaker.allow():
+            return False
+        return self.retry_budget is None or self.retry_budget.can_retry()
+
+    def _record_failure(self, breaker: CircuitBreaker) -> None:
+        breaker.record_failure()
+        if self.retry_budget is not None:
+            self.retry_budget.record_failure()
+
+    def _record_success(self, breaker: CircuitBreaker) -> None:
+        breaker.record_success()
+        if self.retry_budget is not None:
+            self.retry_budget.record_success()
 
     async def _request(
         self,
@@ -94,12 +147,102 @@ class BaseHttpAdapter:
         path: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
+        keep_raw: Tuple[str, ...] = (),
+        route: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send a request; concurrent identical GETs share one flight. Keys
+        named in `keep_raw`, of the body or of each of its `items`, are
+        left unredacted for the caller to redact on access. `route`, the
+        path template (e.g. `api/events/{id}`), keys the circuit breaker,
+        latency histogram and logs, so per-id paths share one of each.
+        """
+        if method != "GET" or json_data is not None:
+            return await self._send(
+                method, path, params, json_data, keep_raw, route
+            )
+
+        key: RequestKey = (
+            path.lstrip("/"),
+            tuple(sorted((k, str(v)) for k, v in (params or {}).items())),
+        )
+        self.dedup_stats["requests"] += 1
+
+        if self.memo_ttl > 0:
+            memo = self._memo.get(key)
+            if memo and time.monotonic() - memo[0] < self.memo_ttl:
+                self.dedup_stats["memo_hits"] += 1
+                TELEMETRY.counter("http.memo_hits").inc()
+                return memo[1]
+
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(
+                self._send(
+                    method, path, params, json_data, keep_raw, route
+                )
+            )
+            self._inflight[key] = flight
+            flight.add_done_callback(partial(self._land, key))
+        else:
+            self.dedup_stats["coalesced"] += 1
+            TELEMETRY.counter("http.coalesced").inc()
+
+        # Shielded so one caller's cancellation does not fail the others
+        return await asyncio.shield(flight)
+
+    def _land(
+        self, key: RequestKey, flight: asyncio.Future[Dict[str, Any]]
+    ) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        if (
+            self.memo_ttl > 0
+            and not flight.cancelled()
+            and flight.exception() is None
+        ):
+            now = time.monotonic()
+            # Re-inserted last, so the memo stays in landing order and
+            # expired entries (e.g. of past params) are evicted from the
+            # front rather than kept forever
+            self._memo.pop(key, None)
+            self._memo[key] = (now, flight.result())
+            while self._memo:
+                oldest = next(iter(self._memo))
+                if now - self._memo[oldest][0] < self.memo_ttl:
+                    break
+                del self._memo[oldest]
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        keep_raw: Tuple[str, ...] = (),
+        route: Optional[str] = None,
     ) -> Dict[str, Any]:
+        endpoint = (route or path).lstrip("/")
         url = self.base_url / path.lstrip("/")
+        breaker = self._breaker(endpoint)
+        if not breaker.allow():
+            raise TuiError(
+                kind="CIRCUIT_OPEN",
+                message=f"Circuit open for {endpoint}, "
+                        f"retry in {breaker.retry_in():.0f}s",
+                retryable=True,
+            )
 
         attempt = 0
+        reauthenticated = False
         while attempt < self.max_attempts:
             attempt += 1
+            await self.rate_limiter.acquire(self.max_rate_limit_wait)
+            headers = self.headers
+            credentials: Mapping[str, str] = {}
+            if self.auth is not None:
+                credentials = await self.auth.acquire_headers()
+                headers = {**self.headers, **credentials}
             start_time = time.perf_counter()
 
             try:
@@ -108,11 +251,14 @@ class BaseHttpAdapter:
                     url,
                     params=params,
                     json=json_data,
+                    headers=headers,
                     timeout=self.timeout
                 ) as resp:
-                    latency_ms = int((time.perf_counter() - start_time) * 1000)
+                    elapsed_ms = (time.perf_counter() - start_time) * 1000
+                    latency_ms = int(elapsed_ms)
+                    TELEMETRY.observe(f"http.latency[{endpoint}]", elapsed_ms)
 
-                    # Structured Log
+                    # Structured, sampled per-request log line
                     logger.info(
                         "HTTP %s %s -> %s (%sms) [Attempt %s]",
                         method,
@@ -120,18 +266,64 @@ class BaseHttpAdapter:
                         resp.status,
                         latency_ms,
                         attempt,
+                        extra={
+                            "sample": True,
+                            "fields": {
+                                "method": method,
+                                "endpoint": endpoint,
+                                "status": resp.status,
+                                "latency_ms": latency_ms,
+                                "attempt": attempt,
+                            },
+                        },
                     )
-                    if resp.status == 429:
+                    self.rate_limiter.update_from_headers(resp.headers)
+
+                    # Any answer below 500 proves the endpoint is alive
+                    if resp.status >= 500:
+                        self._record_failure(breaker)
+                    elif resp.status == 429:
+                        breaker.record_success()
+                        if self.retry_budget is not None:
+                            self.retry_budget.record_failure()
+                    else:
+                        self._record_success(breaker)
 
-                        retry_after = float(
-                            resp.headers.get("Retry-After", 1.0)
+                    if resp.status == 429:
+                        retry_after = parse_retry_after(
+                            resp.headers.get("Retry-After")
                         )
+                        if retry_after is None:
+                            retry_after = 1.0
+                        self.rate_limiter.block_for(retry_after)
+                        if (
+                            retry_after > self.max_rate_limit_wait
+                            or not self._can_retry(attempt, breaker)
+                        ):
+                            raise TuiError(
+                                kind="RATE_LIMIT",
+                                message=f"Rate limited, retry after "
+                                        f"{retry_after:.1f}s",
+                                status_code=resp.status,
+                                retryable=True,
+                            )
                         logger.warning(
-                            "Rate limited (429). Retrying after %ss",
+                            "Rate limited (429). Retrying after %.1fs",
                             retry_after,
                         )
+                        # The next acquire() waits out the block
+                        continue
 
-                        await asyncio.sleep(retry_after)
+                    if (
+                        resp.status == 401
+                        and self.auth is not None
+                        and not reauthenticated
+                    ):
+                        # Token revoked or expired early: refresh once,
+                        # without spending a retry attempt
+                        reauthenticated = True
+                        self.auth.invalidate(credentials)
+                        attempt -= 1
                         continue
 
                     if resp.status == 401 or resp.status == 403:
@@ -150,7 +342,7 @@ class BaseHttpAdapter:
                         )
 
                     if resp.status >= 500:
-                        if attempt < self.max_attempts:
+                        if self._can_retry(attempt, breaker):
                             await self._backoff(attempt)
                             continue
                         raise TuiError(
@@ -178,13 +370,16 @@ class BaseHttpAdapter:
                                     f"{self.max_response_size}",
                         )
 
-                    data = await resp.json()
+                    with TELEMETRY.timer("http.decode"):
+                        data = await resp.json()
                     # We assume JSON response is a dict for our use cases
-                    return redact_value(data)  # type: ignore
+                    with TELEMETRY.timer("http.redact"):
+                        return self._redact(data, keep_raw)
 
             except asyncio.TimeoutError as exc:
                 logger.warning("Timeout on %s (Attempt %s)", url, attempt)
-                if attempt < self.max_attempts:
+                self._record_failure(breaker)
+                if self._can_retry(attempt, breaker):
                     await self._backoff(attempt)
                     continue
                 raise TuiError(
@@ -197,8 +392,8 @@ class BaseHttpAdapter:
                 logger.warning(
                     "Network error on %s: %s (Attempt %s)", url, e, attempt
                 )
-
-                if attempt < self.max_attempts:
+                self._record_failure(breaker)
+                if self._can_retry(attempt, breaker):
                     await self._backoff(attempt)
                     continue
                 raise TuiError(
@@ -217,12 +412,33 @@ class BaseHttpAdapter:
             retryable=True,
         )
 
+    @staticmethod
+    def _redact(data: Any, keep_raw: Tuple[str, ...]) -> Dict[str, Any]:
+        if not keep_raw or not isinstance(data, dict):
+            # Typed as an object; list endpoints may return a bare array,
+            # which their callers accept
+            return cast(Dict[str, Any], redact_value(data))
+        items = data.get("items")
+        if not isinstance(items, list):
+            # A single item
+            return redact_dict(data, keep=keep_raw)
+        return {
+            **redact_dict(data, keep=("items",)),
+            "items": [
+                redact_dict(i, keep=keep_raw)
+                if isinstance(i, dict) else redact_value(i)
+                for i in items
+            ],
+        }
+
     async def _backoff(self, attempt: int) -> None:
         # Exponential backoff: base * 2^(attempt-1) + jitter
-        base_delay = 0.5
-        max_delay = 5.0
-        delay = min(max_delay, base_delay * (2 ** (attempt - 1)))
+        delay = min(
+            self.backoff_max, self.backoff_base * (2 ** (attempt - 1))
+        )
         jitter = random.uniform(0, 0.1 * delay)
         total_delay = delay + jitter
-        logger.info("Backing off for %.2fs...", total_delay)
+        logger.info(
+            "Backing off for %.2fs...", total_delay, extra={"sample": True}
+        )
         await asyncio.sleep(total_delay)
@@ -0,0 +1,339 @@
+"""Layered configuration: defaults < file < environment < CLI."""
+from __future__ import annotations
+
+import json
+import os
+import tomllib
+from dataclasses import dataclass, field, fields, replace
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from ..core.contracts import VALIDATION_MODES
+from ..core.export import EXPORT_FORMATS
+
+ENV_PREFIX = "TALOS_TUI_"
+CONFIG_ENV = "TALOS_TUI_CONFIG"
+REDACTED = "***REDACTED***"
+
+_TRUE = {"1", "true", "yes", "on"}
+_FALSE = {"0", "false", "no", "off", ""}
+
+
+def _cache_dir() -> Path:
+    return Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
+
+
+def default_config_path() -> Path:
+    """`$XDG_CONFIG_HOME/talos-tui/config.toml` (used if it exists)."""
+    root = Path(os.getenv("XDG_CONFIG_HOME", Path.home() / ".config"))
+    return root / "talos-tui" / "config.toml"
+
+
+def _env(name: str) -> Dict[str, str]:
+    return {"env": name}
+
+
+def _parse_bool(raw: Any) -> bool:
+    if isinstance(raw, bool):
+        return raw
+    value = str(raw).strip().lower()
+    if value in _TRUE:
+        return True
+    if value in _FALSE:
+        return False
+    raise ValueError(f"expected a boolean, got {raw!r}")
+
+
+def _parse_int(raw: Any) -> int:
+    if isinstance(raw, bool) or isinstance(raw, float):
+        raise ValueError(f"expected an integer, got {raw!r}")
+    return int(str(raw).replace("_", ""))
+
+
+def _parse_float(raw: Any) -> float:
+    if isinstance(raw, bool):
+        raise ValueError(f"expected a number, got {raw!r}")
+    return float(raw)
+
+
+def _parse_str(raw: Any) -> str:
+    if not isinstance(raw, (str, int, float)) or isinstance(raw, bool):
+        raise ValueError(f"expected a string, got {raw!r}")
+    return str(raw)
+
+
+_PARSERS: Dict[str, Callable[[Any], Any]] = {
+    "bool": _parse_bool,
+    "int": _parse_int,
+    "float": _parse_float,
+    "str": _parse_str,
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class TuiConfig:
+    """
+    Resolved, immutable settings. Every field can be set in the config
+    file, from the environment as `TALOS_TUI_<FIELD>` (a few keep their
+    historical names, e.g. `TALOS_GATEWAY_URL`) or from the CLI as
+    `--set field=value`.
+    """
+
+    # Services
+    gateway_url: str = field(
+        default="http://localhost:8000", metadata=_env("TALOS_GATEWAY_URL")
+    )
+    audit_url: str = field(
+        default="http://localhost:8001", metadata=_env("TALOS_AUDIT_URL")
+    )
+    use_mock: bool = field(default=False, metadata=_env("TALOS_TUI_MOCK"))
+    contracts_major: str = "1"  # required contracts major version
+    contracts_root: str = ""  # talos-contracts checkout ("" discovers it)
+
+    # Files ("" disables)
+    profile_path: str = field(default="", metadata=_env("TALOS_TUI_PROFILE"))
+    state_path: str = field(
+        default_factory=lambda: str(
+            _cache_dir() / "talos-tui" / "state.snapshot"
+        ),
+        metadata=_env("TALOS_TUI_STATE"),
+    )
+    contracts_cache_dir: str = field(
+        default_factory=lambda: str(_cache_dir() / "talos-tui")
+    )
+    log_file: str = "talos-tui.log"
+    log_json: bool = False
+    log_sample_every: int = field(
+        default=10, metadata=_env("TALOS_TUI_LOG_SAMPLE")
+    )
+
+    # Authentication (first set wins: token, command, client credentials)
+    auth_token: str = field(
+        default="", repr=False, metadata={"secret": True}
+    )
+    auth_command: str = ""  # prints a token or {"access_token", ...}
+    auth_token_url: str = ""  # OAuth2 client-credentials endpoint
+    auth_client_id: str = ""
+    auth_client_secret: str = field(
+        default="", repr=False, metadata={"secret": True}
+    )
+    auth_scope: str = ""
+    auth_header: str = "Authorization"
+    auth_scheme: str = "Bearer"
+    auth_refresh_ahead: float = 60.0  # refresh this long before expiry
+
+    # Audit contract validation: full, sampled or structural
+    validation_mode: str = "full"
+    validation_sample_every: int = 20  # sampled: validate 1 in N
+    validation_escalation: float = 300.0  # full validation after a failure
+
+    # Polling and handshake
+    poll_interval: float = 2.0
+    handshake_interval: float = 1.0
+    max_handshake_attempts: int = 5
+    audit_page_size: int = 50
+    max_resume_pages: int = 20
+
+    # Event-loop watchdog
+    watchdog_interval: float = 0.1
+    watchdog_threshold: float = 0.25  # stall (s) that captures a profile
+
+    # In-memory state
+    audit_ring_size: int = 1000  # audit events kept in the store
+    metrics_history: int = 120  # metrics samples kept in the store
+    audit_detail_cache: int = 256  # full events kept for the detail pane
+    audit_prefetch: int = 2  # rows either side of the cursor to prefetch
+    audit_history_size: int = 10_000  # older events kept for scrubbing
+    audit_scrub_step: float = 60.0  # seconds per scrub step
+    rollup_window: float = 60.0  # seconds per analytics window
+    rollup_windows: int = 60  # analytics windows kept
+
+    # Audit export: ndjson.gz, ndjson.zst or parquet
+    export_dir: str = ""  # "" is the working directory
+    export_format: str = "ndjson.gz"
+    export_chunk_size: int = 5000  # events encoded per worker step
+
+    # HTTP adapters
+    max_attempts: int = 5
+    connect_timeout: float = 3.0
+    total_timeout: float = 10.0
+    max_response_size: int = 1_000_000
+    backoff_base: float = 0.5
+    backoff_max: float = 5.0
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 30.0
+    retry_budget_tokens: float = 10.0
+    retry_budget_ratio: float = 0.1
+    rate_limit: float = 0.0  # requests/sec per adapter (0 disables)
+    rate_burst: float = 10.0
+    max_rate_limit_wait: float = 30.0
+    memo_ttl: float = 0.0
+    pool_limit: int = 100  # connections in total (0 is unlimited)
+    pool_limit_per_host: int = 0
+    keepalive_timeout: float = 15.0
+
+    # Snapshots and hub fan-out
+    snapshot_interval: float = 30.0
+    snapshot_audit_limit: int = 200
+    hub_max_queue: int = 1000
+
+    def __post_init__(self) -> None:
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, (int, float)) and not isinstance(
+                value, bool
+            ) and value < 0:
+                raise ValueError(f"{f.name} must be >= 0")
+        for name in (
+            "poll_interval",
+            "handshake_interval",
+            "watchdog_interval",
+            "audit_page_size",
+            "audit_ring_size",
+            "validation_sample_every",
+            "rollup_window",
+            "rollup_windows",
+            "export_chunk_size",
+            "max_attempts",
+            "total_timeout",
+            "max_response_size",
+            "snapshot_interval",
+            "hub_max_queue",
+        ):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive")
+        if self.validation_mode not in VALIDATION_MODES:
+            raise ValueError(
+                "validation_mode must be one of "
+                + ", ".join(VALIDATION_MODES)
+            )
+        if self.export_format not in EXPORT_FORMATS:
+            raise ValueError(
+                "export_format must be one of " + ", ".join(EXPORT_FORMATS)
+            )
+
+    @classmethod
+    def field_names(cls) -> List[str]:
+        """Names of the settable fields."""
+        return [f.name for f in fields(cls)]
+
+    @classmethod
+    def env_names(cls) -> Dict[str, str]:
+        """Field name -> environment variable."""
+        return {
+            f.name: f.metadata.get("env", ENV_PREFIX + f.name.upper())
+            for f in fields(cls)
+        }
+
+    def with_overrides(self, values: Mapping[str, Any]) -> TuiConfig:
+        """Return a copy with overrides (strings or TOML values) applied."""
+        types = {f.name: str(f.type) for f in fields(self)}
+        changes: Dict[str, Any] = {}
+        for name, raw in values.items():
+            if name not in types:
+                raise ValueError(f"Unknown config field: {name}")
+            try:
+                changes[name] = _PARSERS[types[name]](raw)
+            except ValueError as e:
+                raise ValueError(f"{name}: {e}") from e
+        return replace(self, **changes)
+
+    @staticmethod
+    def parse_pairs(pairs: Sequence[str]) -> Dict[str, str]:
+        """Parse `field=value` strings (CLI `--set`)."""
+        values = {}
+        for pair in pairs:
+            name, sep, raw = pair.partition("=")
+            if not sep:
+                raise ValueError(f"Expected field=value, got {pair!r}")
+            values[name.strip()] = raw.strip()
+        return values
+
+
+class LayeredConfig:
+    """
+    ConfigPort implementation. Layers, lowest precedence first:
+    - `TuiConfig` defaults
+    - a TOML file of top-level `field = value` pairs: `path`, else
+      `$TALOS_TUI_CONFIG`, else `default_config_path()` if it exists
+    - environment variables (see `TuiConfig.env_names()`)
+    - `overrides`, typically the CLI's `--set field=value`
+    The layers are read once, on first access; the result is frozen.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        environ: Optional[Mapping[str, str]] = None,
+        overrides: Optional[Mapping[str, str]] = None,
+    ):
+        self.environ = os.environ if environ is None else environ
+        if path is None and self.environ.get(CONFIG_ENV):
+            path = Path(self.environ[CONFIG_ENV])
+        self.explicit_path = path is not None
+        self.path = path if path is not None else default_config_path()
+        self.overrides = dict(overrides or {})
+        self.sources: Dict[str, str] = {}
+
+    def _read_file(self) -> Dict[str, Any]:
+        if not self.explicit_path and not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "rb") as f:
+                return tomllib.load(f)
+        except (OSError, tomllib.TOMLDecodeError) as e:
+            raise ValueError(f"Cannot read config {self.path}: {e}") from e
+
+    @cached_property
+    def config(self) -> TuiConfig:
+        """The resolved configuration."""
+        config = TuiConfig()
+        layers = [(f"file {self.path}", self._read_file())]
+        env_names = TuiConfig.env_names()
+        layers.append(("env", {
+            name: self.environ[var]
+            for name, var in env_names.items()
+            if var in self.environ
+        }))
+        layers.append(("cli", self.overrides))
+        for source, values in layers:
+            config = config.with_overrides(values)
+            for name in values:
+                self.sources[name] = (
+                    f"env {env_names[name]}" if source == "env" else source
+                )
+        return config
+
+    def load_config_readonly(self) -> Mapping[str, str]:
+        """Read-only string view of the resolved settings, secrets masked."""
+        return MappingProxyType({
+            name: str(value) for name, value in self._masked().items()
+        })
+
+    def inspect_env_presence(self) -> Mapping[str, bool]:
+        """Which configuration environment variables are set."""
+        return MappingProxyType({
+            var: var in self.environ
+            for var in TuiConfig.env_names().values()
+        })
+
+    def describe(self) -> str:
+        """The resolved settings as TOML, annotated with their source."""
+        lines = []
+        for name, value in self._masked().items():
+            source = self.sources.get(name, "default")
+            lines.append(f"{name} = {json.dumps(value)}  # {source}")
+        return "\n".join(lines)
+
+    def _masked(self) -> Dict[str, Any]:
+        config = self.config
+        return {
+            f.name: (
+                REDACTED
+                if f.metadata.get("secret") and getattr(config, f.name)
+                else getattr(config, f.name)
+            )
+            for f in fields(config)
+        }
@@ -1,69 +1,392 @@
+"""Mock adapters backed by a configurable synthetic load generator."""
 from __future__ import annotations
+
+import asyncio
+import math
+import os
 import random
-from typing import Sequence, Optional
+import time
+from collections import deque
+from dataclasses import dataclass, fields, replace
+from datetime import datetime, timezone
+from typing import (
+    Any, Callable, Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+)
 
 from talos_tui.domain.models import (
     Health, MetricsSummary, Peer, Session, VersionInfo, AuditPage, AuditEvent
 )
+from talos_tui.ports.errors import TuiError
 
+ENV_PREFIX = "TALOS_MOCK_"
+MAX_ENTITIES = 100_000
+MAX_PAYLOAD_BYTES = 1_000_000
 
-class MockGatewayAdapter:
-    async def get_version(self) -> VersionInfo:
-        return VersionInfo(
-            version="1.2.3-mock",  # alias for service_version
-            git_sha="deadbeef",
-            contracts_version="1.0.0",
-            api_version="v1"
+SCHEMA_IDS = ("login", "logout", "config_change", "key_rotation")
+OUTCOMES = ("OK", "DENY", "ERROR")
+OUTCOME_WEIGHTS = (0.9, 0.07, 0.03)
+
+VERSION = {
+    "version": "1.2.3-mock",
+    "git_sha": "deadbeef",
+    "contracts_version": "1.0.0",
+    "api_version": "v1",
+}
+HEALTH = {"status": "ok", "detail": "Running in Mock Mode"}
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    """
+    Shape of the synthetic load. Every field can be set from the
+    environment as `TALOS_MOCK_<FIELD>` (e.g. `TALOS_MOCK_EVENT_RATE=500`)
+    or from the CLI as `--load field=value`.
+    """
+
+    event_rate: float = 1.25  # steady audit events per second
+    burst_size: int = 0  # extra events delivered at once...
+    burst_every: float = 0.0  # ...every N seconds (0 disables bursts)
+    payload_bytes: int = 32  # median payload size
+    payload_sigma: float = 0.0  # log-normal spread of payload size
+    duplicate_ratio: float = 0.0  # share of page items re-delivered
+    history: int = 10_000  # events kept for paging with `before`
+    peers: int = 5
+    sessions: int = 3
+    latency_ms: float = 0.0  # injected per-call latency...
+    latency_jitter_ms: float = 0.0  # ...plus uniform jitter
+    error_rate: float = 0.0  # share of calls failing with a 503
+    rate_limit_rate: float = 0.0  # share of calls rejected with a 429
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        for name in ("duplicate_ratio", "error_rate", "rate_limit_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+        for name in ("peers", "sessions", "history"):
+            if not 0 <= getattr(self, name) <= MAX_ENTITIES:
+                raise ValueError(
+                    f"{name} must be between 0 and {MAX_ENTITIES}"
+                )
+        if self.event_rate < 0 or self.burst_size < 0:
+            raise ValueError("event_rate and burst_size must be >= 0")
+
+    @classmethod
+    def field_names(cls) -> List[str]:
+        """Names of the tunable fields."""
+        return [f.name for f in fields(cls)]
+
+    def with_overrides(self, values: Mapping[str, str]) -> LoadProfile:
+        """Return a copy with string overrides applied."""
+        defaults = LoadProfile()
+        changes: Dict[str, Any] = {}
+        for name, raw in values.items():
+            if name not in self.field_names():
+                raise ValueError(f"Unknown load profile field: {name}")
+            default = getattr(defaults, name)
+            if default is None or isinstance(default, int):
+                changes[name] = int(raw)
+            else:
+                changes[name] = float(raw)
+        return replace(self, **changes)
+
+    @classmethod
+    def from_env(
+        cls, environ: Optional[Mapping[str, str]] = None
+    ) -> LoadProfile:
+        """Build a profile from `TALOS_MOCK_*` environment variables."""
+        env = os.environ if environ is None else environ
+        values = {
+            name: env[ENV_PREFIX + name.upper()]
+            for name in cls.field_names()
+            if ENV_PREFIX + name.upper() in env
+        }
+        return cls().with_overrides(values)
+
+    @staticmethod
+    def parse_pairs(pairs: Sequence[str]) -> Dict[str, str]:
+        """Parse `field=value` strings (CLI `--load`)."""
+        values = {}
+        for pair in pairs:
+            name, sep, raw = pair.partition("=")
+            if not sep:
+                raise ValueError(f"Expected field=value, got {pair!r}")
+            values[name.strip()] = raw.strip()
+        return values
+
+
+def _iso(ts: float) -> str:
+    return (
+        datetime.fromtimestamp(ts, tz=timezone.utc)
+        .isoformat(timespec="milliseconds")
+        .replace("+00:00", "Z")
+    )
+
+
+class LoadGenerator:
+    """
+    Produces wire-format (plain dict) responses for a LoadProfile.
+    Shared by the in-process mock adapters and the stand-in HTTP server.
+    - Events accrue with wall-clock time at `event_rate`, plus bursts;
+      each has a unique, monotonically increasing id and timestamp.
+    - The newest `history` events are kept so pages can be served with
+      `before`; a page is newest-first like the real audit service.
+    - Peers and sessions are built once and reused.
+    """
+
+    def __init__(
+        self,
+        profile: Optional[LoadProfile] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.profile = profile or LoadProfile()
+        self._clock = clock
+        self._rng = random.Random(self.profile.seed)
+        self._carry = 0.0
+        self._last = clock()
+        # Unseeded runs continue the id sequence across restarts
+        self._seq = 0 if self.profile.seed is not None else int(
+            self._last * 1000
+        )
+        self._next_burst = self._last + self.profile.burst_every
+        self._history: Deque[Dict[str, Any]] = deque(
+            maxlen=max(1, self.profile.history)
+        )
+        # Payload text is sliced out of one random block
+        self._block = "".join(
+            self._rng.choice("abcdefghijklmnopqrstuvwxyz0123456789")
+            for _ in range(4096)
         )
+        self._peers: Optional[List[Dict[str, Any]]] = None
+        self._sessions: Optional[List[Dict[str, Any]]] = None
+        self.generated = 0
+
+    def latency(self) -> float:
+        """Injected latency for one call, in seconds."""
+        p = self.profile
+        if not p.latency_ms and not p.latency_jitter_ms:
+            return 0.0
+        jitter = self._rng.uniform(0, p.latency_jitter_ms)
+        return (p.latency_ms + jitter) / 1000
+
+    def fault(self) -> Optional[int]:
+        """HTTP status to fail this call with, if any (429 or 503)."""
+        roll = self._rng.random()
+        if roll < self.profile.rate_limit_rate:
+            return 429
+        if roll < self.profile.rate_limit_rate + self.profile.error_rate:
+            return 503
+        return None
+
+    def metrics(self) -> Dict[str, Any]:
+        """Metrics summary payload."""
+        p50 = self._rng.uniform(5.0, 50.0)
+        return {
+            "latency_p50_ms": p50,
+            "latency_p95_ms": p50 + self._rng.uniform(20.0, 100.0),
+            "connected_peers": self.profile.peers,
+            "active_sessions": self.profile.sessions,
+        }
+
+    def peers(self) -> List[Dict[str, Any]]:
+        """All peers (built once)."""
+        if self._peers is None:
+            self._peers = [
+                {"peer_id": f"peer-{i}", "services": ["gateway"]}
+                for i in range(self.profile.peers)
+            ]
+        return self._peers
+
+    def sessions(self) -> List[Dict[str, Any]]:
+        """All sessions (built once)."""
+        if self._sessions is None:
+            peers = max(1, self.profile.peers)
+            self._sessions = [
+                {"session_id": f"sess-{i}", "peer_id": f"peer-{i % peers}"}
+                for i in range(self.profile.sessions)
+            ]
+        return self._sessions
+
+    def _payload(self) -> Dict[str, Any]:
+        p = self.profile
+        size = p.payload_bytes
+        if p.payload_sigma > 0 and size > 0:
+            size = int(
+                self._rng.lognormvariate(math.log(size), p.payload_sigma)
+            )
+        size = min(max(0, size), MAX_PAYLOAD_BYTES)
+        reps, rest = divmod(size, len(self._block))
+        start = self._rng.randrange(len(self._block) - rest + 1)
+        data = self._block * reps + self._block[start:start + rest]
+        return {
+            "actor": f"peer-{self._rng.randrange(max(1, p.peers))}",
+            "data": data,
+        }
+
+    def _event(self, ts: float) -> Dict[str, Any]:
+        self._seq += 1
+        return {
+            "event_id": f"evt-{self._seq:012d}",
+            "ts": _iso(ts),
+            "schema_id": self._rng.choice(SCHEMA_IDS),
+            "outcome": self._rng.choices(OUTCOMES, OUTCOME_WEIGHTS)[0],
+            "payload": self._payload(),
+        }
+
+    def advance(self) -> int:
+        """Generate the events due since the last call; returns the count."""
+        now = self._clock()
+        p = self.profile
+        due = max(0.0, now - self._last) * p.event_rate + self._carry
+        count = int(due)
+        self._carry = due - count
+        if p.burst_every > 0:
+            while now >= self._next_burst:
+                count += p.burst_size
+                self._next_burst += p.burst_every
+        # Never generate more than the history can hold
+        count = min(count, self._history.maxlen or count)
+        span = now - self._last
+        for i in range(count):
+            self._history.append(
+                self._event(self._last + span * (i + 1) / count)
+            )
+        self._last = now
+        self.generated += count
+        return count
+
+    def event(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """One event still in the history, by id."""
+        history = self._history
+        if not history:
+            return None
+        try:
+            index = int(event_id[4:]) - int(history[0]["event_id"][4:])
+        except ValueError:
+            return None
+        if not 0 <= index < len(history):
+            return None
+        return history[index]
+
+    def events(
+        self, limit: int, before: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """A newest-first page of events, older than `before` if given."""
+        self.advance()
+        history = self._history
+        if not history:
+            return {"items": [], "next_cursor": None, "has_more": False}
+
+        end = len(history)
+        if before:
+            first_seq = int(history[0]["event_id"][4:])
+            try:
+                end = max(0, min(end, int(before[4:]) - first_seq))
+            except ValueError:
+                end = 0
+        start = max(0, end - max(0, limit))
+        items = [history[i] for i in range(end - 1, start - 1, -1)]
+        next_cursor = items[-1]["event_id"] if items else None
+
+        ratio = self.profile.duplicate_ratio
+        if ratio and items:
+            # Re-deliver recently seen events, as an at-least-once feed would
+            for i in range(len(items)):
+                if self._rng.random() < ratio:
+                    items[i] = history[self._rng.randrange(len(history))]
+
+        return {
+            "items": items,
+            "next_cursor": next_cursor,
+            "has_more": start > 0,
+        }
+
+
+class _MockAdapter:
+    def __init__(self, generator: Optional[LoadGenerator] = None):
+        self.generator = generator or LoadGenerator()
+
+    async def _serve(self) -> None:
+        """Apply the injected latency and faults for one call."""
+        delay = self.generator.latency()
+        if delay:
+            await asyncio.sleep(delay)
+        status = self.generator.fault()
+        if status == 429:
+            raise TuiError(
+                kind="RATE_LIMIT",
+                message="Mock rate limit",
+                status_code=429,
+                retryable=True,
+            )
+        if status is not None:
+            raise TuiError(
+                kind="NETWORK",
+                message="Mock server error",
+                status_code=status,
+                retryable=True,
+            )
+
+    async def get_version(self) -> VersionInfo:
+        await self._serve()
+        return VersionInfo(**VERSION)
 
     async def get_health(self) -> Health:
-        return Health(status="ok", detail="Running in Mock Mode")
+        await self._serve()
+        return Health(**HEALTH)
+
+
+class MockGatewayAdapter(_MockAdapter):
+    def __init__(self, generator: Optional[LoadGenerator] = None):
+        super().__init__(generator)
+        self._peers: Optional[List[Peer]] = None
+        self._sessions: Optional[List[Session]] = None
 
     async def get_metrics_summary(self) -> MetricsSummary:
-        return MetricsSummary(
-            latency_p50_ms=random.uniform(5.0, 50.0),
-            latency_p95_ms=random.uniform(50.0, 150.0),
-            connected_peers=random.randint(10, 50),
-            active_sessions=random.randint(1, 10)
-        )
+        await self._serve()
+        return MetricsSummary(**self.generator.metrics())
 
     async def list_peers(self) -> Sequence[Peer]:
-        return [
-            Peer(peer_id=f"peer-{i}", services=["gateway"]) for i in range(5)
-        ]
+        await self._serve()
+        if self._peers is None:
+            self._peers = [Peer(**p) for p in self.generator.peers()]
+        return self._peers
 
     async def list_sessions(self) -> Sequence[Session]:
-        return [Session(session_id=f"sess-{i}") for i in range(3)]
-
+        await self._serve()
+        if self._sessions is None:
+            self._sessions = [
+                Session(**s) for s in self.generator.sessions()
+            ]
+        return self._sessions
 
-class MockAuditAdapter:
-    async def get_version(self) -> VersionInfo:
-        return VersionInfo(
-            version="1.2.3-mock",
-            git_sha="deadbeef",
-            contracts_version="1.0.0",
-            api_version="v1"
-        )
 
+class MockAuditAdapter(_MockAdapter):
     async def list_events(
-        self, limit: int, before: Optional[str]
+        self, limit: int = 50, before: Optional[str] = None
     ) -> AuditPage:
-        # Generate random events
-        items = []
-        count = random.randint(0, 5)
-        for i in range(count):
-            items.append(AuditEvent(
-                event_id=f"evt-{random.randint(1000, 9999)}",
-                ts="2023-01-01T00:00:00Z",  # fixed for mock
-                schema_id=random.choice(
-                    ["login", "logout", "config_change", "key_rotation"]
-                ),
-                outcome="OK",
-                payload={"mock": True, "value": random.randint(1, 100)}
-            ))
-
+        await self._serve()
+        page = self.generator.events(limit, before)
         return AuditPage(
-            items=items,
-            next_cursor="mock_cursor",
-            has_more=True
+            items=[AuditEvent(**i) for i in page["items"]],
+            next_cursor=page["next_cursor"],
+            has_more=page["has_more"],
         )
+
+    async def get_event(self, event_id: str) -> AuditEvent:
+        await self._serve()
+        event = self.generator.event(event_id)
+        if event is None:
+            raise TuiError(
+                kind="BAD_RESPONSE",
+                message="Endpoint not found (404)",
+                status_code=404,
+            )
+        return AuditEvent(**event)
+
+
+def mock_adapters(
+    profile: Optional[LoadProfile] = None,
+) -> Tuple[MockGatewayAdapter, MockAuditAdapter]:
+    """Gateway and audit mocks sharing one generator."""
+    generator = LoadGenerator(profile)
+    return MockGatewayAdapter(generator), MockAuditAdapter(generator)
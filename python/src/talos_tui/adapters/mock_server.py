@@ -0,0 +1,111 @@
+"""Local aiohttp stand-in for the gateway and audit services."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+from aiohttp import web
+
+from .mock import HEALTH, VERSION, LoadGenerator, LoadProfile
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+GENERATOR_KEY = web.AppKey("generator", LoadGenerator)
+
+
+@web.middleware
+async def _inject_faults(
+    request: web.Request, handler: Handler
+) -> web.StreamResponse:
+    generator = request.app[GENERATOR_KEY]
+    delay = generator.latency()
+    if delay:
+        await asyncio.sleep(delay)
+    status = generator.fault()
+    if status == 429:
+        return web.json_response(
+            {"error": "rate limited"},
+            status=429,
+            headers={"Retry-After": "1", "X-RateLimit-Remaining": "0"},
+        )
+    if status is not None:
+        return web.json_response({"error": "unavailable"}, status=status)
+    return await handler(request)
+
+
+async def _version(request: web.Request) -> web.Response:
+    return web.json_response(VERSION)
+
+
+async def _health(request: web.Request) -> web.Response:
+    return web.json_response(HEALTH)
+
+
+async def _metrics(request: web.Request) -> web.Response:
+    return web.json_response(request.app[GENERATOR_KEY].metrics())
+
+
+async def _peers(request: web.Request) -> web.Response:
+    return web.json_response({"peers": request.app[GENERATOR_KEY].peers()})
+
+
+async def _sessions(request: web.Request) -> web.Response:
+    return web.json_response(
+        {"sessions": request.app[GENERATOR_KEY].sessions()}
+    )
+
+
+async def _events(request: web.Request) -> web.Response:
+    try:
+        limit = int(request.query.get("limit", "50"))
+    except ValueError:
+        raise web.HTTPBadRequest(text="limit must be an integer") from None
+    page = request.app[GENERATOR_KEY].events(
+        limit, request.query.get("before")
+    )
+    return web.json_response(page)
+
+
+async def _event(request: web.Request) -> web.Response:
+    event = request.app[GENERATOR_KEY].event(request.match_info["event_id"])
+    if event is None:
+        raise web.HTTPNotFound()
+    return web.json_response(event)
+
+
+def create_app(generator: Optional[LoadGenerator] = None) -> web.Application:
+    """
+    Build an app serving both the gateway and the audit API, so one
+    instance can stand in for both TALOS_GATEWAY_URL and TALOS_AUDIT_URL.
+    """
+    app = web.Application(middlewares=[_inject_faults])
+    app[GENERATOR_KEY] = generator or LoadGenerator()
+    app.router.add_get("/version", _version)
+    app.router.add_get("/health", _health)
+    app.router.add_get("/health/ready", _health)
+    app.router.add_get("/metrics/summary", _metrics)
+    app.router.add_get("/peers", _peers)
+    app.router.add_get("/sessions", _sessions)
+    app.router.add_get("/api/events", _events)
+    app.router.add_get("/api/events/{event_id}", _event)
+    return app
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    profile: Optional[LoadProfile] = None,
+) -> None:
+    """Serve until cancelled."""
+    runner = web.AppRunner(create_app(LoadGenerator(profile)))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    logger.info("Mock server listening on http://%s:%d", host, port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
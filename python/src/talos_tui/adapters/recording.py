@@ -0,0 +1,403 @@
+"""Record and replay of adapter traffic for offline reproduction."""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import (
+    Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, TextIO,
+    Tuple,
+)
+
+from pydantic import BaseModel
+
+from ..domain.models import (
+    AuditEvent, AuditPage, Health, MetricsSummary, Peer, Session, VersionInfo
+)
+from ..core.redaction import redact_audit_items
+from ..domain.timestamps import NS
+from ..ports.errors import TuiError
+
+logger = logging.getLogger(__name__)
+
+FORMAT_NAME = "talos-tui-recording"
+FORMAT_VERSION = 1
+
+
+def _dump(result: Any) -> Any:
+    # Audit payloads are held raw in memory; only redacted ones go to disk
+    if isinstance(result, AuditPage):
+        data = result.model_dump(by_alias=True)
+        data["items"] = redact_audit_items(data["items"])
+        return data
+    if isinstance(result, AuditEvent):
+        return redact_audit_items([result.model_dump(by_alias=True)])[0]
+    if isinstance(result, BaseModel):
+        return result.model_dump(by_alias=True)
+    if isinstance(result, (list, tuple)):
+        return [_dump(r) for r in result]
+    return result
+
+
+# How to rebuild each recorded call's result
+_LOADERS: Dict[str, Callable[[Any], Any]] = {
+    "get_version": lambda d: VersionInfo(**d),
+    "get_health": lambda d: Health(**d),
+    "get_metrics_summary": lambda d: MetricsSummary(**d),
+    "list_peers": lambda d: [Peer(**p) for p in d],
+    "list_sessions": lambda d: [Session(**s) for s in d],
+    "list_events": lambda d: AuditPage(**d),
+    "get_event": lambda d: AuditEvent(**d),
+}
+
+
+class TrafficRecorder:
+    """
+    Writes every adapter response, with timing, as gzip-compressed NDJSON.
+    The first line is a header; each following line is one call:
+    `{"t", "latency", "source", "call", "args", "ok", "result"|"error"}`
+    where `t` is seconds since recording started.
+    Lines are encoded on the loop and queued; a writer thread compresses
+    and writes whatever has queued up, so the loop never waits on gzip
+    or the disk. `close()` writes the rest.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._started = time.monotonic()
+        self._file: Optional[TextIO] = gzip.open(
+            path, "wt", encoding="utf-8", compresslevel=6
+        )
+        self._queue: queue.Queue[Optional[str]] = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._drain,
+            args=(self._file,),
+            name="traffic-recorder",
+            daemon=True,
+        )
+        self._writer.start()
+        self._write({
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "started_at": time.time(),
+        })
+        self.calls = 0
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        if self._file is not None:
+            self._queue.put_nowait(
+                json.dumps(entry, separators=(",", ":")) + "\n"
+            )
+
+    def _drain(self, file: TextIO) -> None:
+        done = False
+        while not done:
+            lines: List[str] = []
+            line = self._queue.get()
+            while line is not None:
+                lines.append(line)
+                try:
+                    line = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            done = line is None
+            if lines:
+                file.write("".join(lines))
+
+    async def capture(
+        self,
+        source: str,
+        call: str,
+        args: Dict[str, Any],
+        send: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run `send` and record its result or TuiError."""
+        start = time.monotonic()
+        entry: Dict[str, Any] = {"source": source, "call": call, "args": args}
+        try:
+            result = await send()
+        except TuiError as e:
+            entry.update(ok=False, error={
+                "kind": e.kind,
+                "message": e.message,
+                "status_code": e.status_code,
+                "retryable": e.retryable,
+            })
+            raise
+        else:
+            entry.update(ok=True, result=_dump(result))
+            return result
+        finally:
+            end = time.monotonic()
+            entry["t"] = round(end - self._started, 6)
+            entry["latency"] = round(end - start, 6)
+            if "ok" in entry:
+                self._write(entry)
+                self.calls += 1
+
+    def close(self) -> None:
+        """Write the calls queued so far and close the recording."""
+        if self._file is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._file.close()
+            self._file = None
+            logger.info("Recorded %d calls to %s", self.calls, self.path)
+
+
+class _RecordingAdapter:
+    def __init__(self, inner: Any, source: str, recorder: TrafficRecorder):
+        self.inner = inner
+        self.source = source
+        self.recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        # Non-port extras (circuit listeners, stats) come from the inner one
+        return getattr(self.inner, name)
+
+
+class RecordingGatewayAdapter(_RecordingAdapter):
+    """GatewayPort wrapper that records every response."""
+
+    async def get_version(self) -> VersionInfo:
+        """Get service version information."""
+        return await self.recorder.capture(  # type: ignore[no-any-return]
+            self.source, "get_version", {}, self.inner.get_version
+        )
+
+    async def get_health(self) -> Health:
+        """Get service health status."""
+        return await self.recorder.capture(  # type: ignore[no-any-return]
+            self.source, "get_health", {}, self.inner.get_health
+        )
+
+    async def get_metrics_summary(self) -> MetricsSummary:
+        """Retrieve metrics summary."""
+        return await self.recorder.capture(  # type: ignore[no-any-return]
+            self.source, "get_metrics_summary", {},
+            self.inner.get_metrics_summary,
+        )
+
+    async def list_peers(self) -> Sequence[Peer]:
+        """List connected peers."""
+        return await self.recorder.capture(  # type: ignore[no-any-return]
+            self.source, "list_peers", {}, self.inner.list_peers
+        )
+
+    async def list_sessions(self) -> Sequence[Session]:
+        """List active sessions."""
+        return await self.recorder.capture(  # type: ignore[no-any-return]
+            self.source, "list_sessions", {}, self.inner.list_sessions
+        )
+
+
+class RecordingAuditAdapter(_RecordingAdapter):
+    """AuditPort wrapper that records every response."""
+
+    async def get_version(self) -> VersionInfo:
+        """Get service version information."""
+        return await self.recorder.capture(  # type: ignore[no-any-return]
+            self.source, "get_version", {}, self.inner.get_version
+        )
+
+    async def get_health(self) -> Health:
+        """Get service health status."""
+        return await self.recorder.capture(  # type: ignore[no-any-return]
+            self.source, "get_health", {}, self.inner.get_health
+        )
+
+    async def list_events(
+        self, limit: int = 50, before: Optional[str] = None
+    ) -> AuditPage:
+        """List audit events with pagination."""
+        return await self.recorder.capture(  # type: ignore[no-any-return]
+            self.source, "list_events", {"limit": limit, "before": before},
+            lambda: self.inner.list_events(limit=limit, before=before),
+        )
+
+    async def get_event(self, event_id: str) -> AuditEvent:
+        """Fetch one full audit event by id."""
+        return await self.recorder.capture(  # type: ignore[no-any-return]
+            self.source, "get_event", {"event_id": event_id},
+            lambda: self.inner.get_event(event_id),
+        )
+
+
+class TrafficReplay:
+    """
+    Serves a recording back in order, per (source, call):
+    - Each response is released when its recorded arrival time, divided
+      by `speed`, has elapsed since the first call of the replay; that of
+      an on-demand call (`paced=False`, e.g. a user opening an event) is
+      served at once.
+    - A call passing `args` gets the first pending response recorded
+      with the same values for them (e.g. the event asked for by id).
+      If none was recorded, raises TuiError rather than serving
+      another call's.
+    """
+
+    def __init__(self, path: Path, speed: float = 1.0):
+        self.path = path
+        self.speed = speed
+        self._queues: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = (
+            defaultdict(deque)
+        )
+        self._origin: Optional[float] = None
+        self.started_at = 0.0
+        self.served = 0
+        self._load(path)
+
+    def _load(self, path: Path) -> None:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("format") != FORMAT_NAME:
+                raise ValueError(f"{path} is not a talos-tui recording")
+            self.started_at = header.get("started_at", time.time())
+            for line in f:
+                entry = json.loads(line)
+                self._queues[(entry["source"], entry["call"])].append(entry)
+
+    def clock(self) -> int:
+        """The recording's wall time (epoch-ns) at this point of the replay."""
+        elapsed = 0.0
+        if self._origin is not None:
+            elapsed = time.monotonic() - self._origin
+        return int((self.started_at + elapsed * self.speed) * NS)
+
+    def remaining(self) -> int:
+        """Number of responses not yet served."""
+        return sum(len(q) for q in self._queues.values())
+
+    async def next(
+        self,
+        source: str,
+        call: str,
+        args: Optional[Dict[str, Any]] = None,
+        paced: bool = True,
+    ) -> Any:
+        """Return (or raise) the next recorded response for a call."""
+        pending = self._queues.get((source, call))
+        if not pending:
+            raise TuiError(
+                kind="NETWORK",
+                message=f"Replay exhausted for {source}.{call}",
+            )
+        position = 0
+        if args:
+            position = next(
+                (
+                    i for i, entry in enumerate(pending)
+                    if all(
+                        entry.get("args", {}).get(name) == value
+                        for name, value in args.items()
+                    )
+                ),
+                -1,
+            )
+            if position < 0:
+                raise TuiError(
+                    kind="BAD_RESPONSE",
+                    message=f"Replay has no {source}.{call} recorded "
+                            f"for {args}",
+                )
+        entry = pending[position]
+        del pending[position]
+
+        now = time.monotonic()
+        if self._origin is None:
+            self._origin = now - entry["t"] / self.speed
+        delay = self._origin + entry["t"] / self.speed - now
+        if delay > 0 and paced:
+            await asyncio.sleep(delay)
+
+        self.served += 1
+        if not entry["ok"]:
+            err = entry["error"]
+            raise TuiError(
+                kind=err["kind"],
+                message=err["message"],
+                status_code=err.get("status_code"),
+                retryable=err.get("retryable", False),
+            )
+        return _LOADERS[call](entry["result"])
+
+
+class ReplayGatewayAdapter:
+    """GatewayPort served from a recording."""
+
+    def __init__(self, replay: TrafficReplay, source: str = "gateway"):
+        self.replay = replay
+        self.source = source
+
+    async def get_version(self) -> VersionInfo:
+        """Get service version information."""
+        return await self.replay.next(  # type: ignore[no-any-return]
+            self.source, "get_version"
+        )
+
+    async def get_health(self) -> Health:
+        """Get service health status."""
+        return await self.replay.next(  # type: ignore[no-any-return]
+            self.source, "get_health"
+        )
+
+    async def get_metrics_summary(self) -> MetricsSummary:
+        """Retrieve metrics summary."""
+        return await self.replay.next(  # type: ignore[no-any-return]
+            self.source, "get_metrics_summary"
+        )
+
+    async def list_peers(self) -> List[Peer]:
+        """List connected peers."""
+        return await self.replay.next(  # type: ignore[no-any-return]
+            self.source, "list_peers"
+        )
+
+    async def list_sessions(self) -> List[Session]:
+        """List active sessions."""
+        return await self.replay.next(  # type: ignore[no-any-return]
+            self.source, "list_sessions"
+        )
+
+
+class ReplayAuditAdapter:
+    """AuditPort served from a recording."""
+
+    def __init__(self, replay: TrafficReplay, source: str = "audit"):
+        self.replay = replay
+        self.source = source
+
+    async def get_version(self) -> VersionInfo:
+        """Get service version information."""
+        return await self.replay.next(  # type: ignore[no-any-return]
+            self.source, "get_version"
+        )
+
+    async def get_health(self) -> Health:
+        """Get service health status."""
+        return await self.replay.next(  # type: ignore[no-any-return]
+            self.source, "get_health"
+        )
+
+    async def list_events(
+        self, limit: int = 50, before: Optional[str] = None
+    ) -> AuditPage:
+        """List audit events with pagination."""
+        # Matched on the page asked for (the limit may differ by config);
+        # older pages are loaded on demand, the newest one is polled
+        return await self.replay.next(  # type: ignore[no-any-return]
+            self.source, "list_events", {"before": before},
+            paced=before is None,
+        )
+
+    async def get_event(self, event_id: str) -> AuditEvent:
+        """Fetch one full audit event by id."""
+        return await self.replay.next(  # type: ignore[no-any-return]
+            self.source, "get_event", {"event_id": event_id}, paced=False
+        )
@@ -0,0 +1,276 @@
+"""Failure isolation and rate limiting primitives for the HTTP adapters."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Callable, Mapping, Optional
+
+from ..ports.errors import TuiError
+
+logger = logging.getLogger(__name__)
+
+Clock = Callable[[], float]
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+    - CLOSED: requests flow; consecutive failures are counted.
+    - OPEN: requests fail fast until `reset_timeout` has elapsed.
+    - HALF_OPEN: a single probe is let through; success closes the
+      circuit, failure re-opens it. A probe that never reports back
+      (e.g. cancelled) expires after `reset_timeout`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Clock = time.monotonic,
+        on_change: Optional[Callable[[str, CircuitState], None]] = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._on_change = on_change
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_deadline = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving OPEN -> HALF_OPEN once the timeout passed."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._set_state(CircuitState.HALF_OPEN)
+            self._probe_deadline = 0.0
+        return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+    def allow(self) -> bool:
+        """Whether a request (or retry attempt) may be sent now."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN:
+            now = self._clock()
+            if now >= self._probe_deadline:
+                self._probe_deadline = now + self.reset_timeout
+                return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a response from the endpoint."""
+        self._failures = 0
+        if self._state != CircuitState.CLOSED:
+            self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a timeout, connection error or server error."""
+        self._failures += 1
+        if self._state == CircuitState.HALF_OPEN or (
+            self._state == CircuitState.CLOSED
+            and self._failures >= self.failure_threshold
+        ):
+            self._opened_at = self._clock()
+            self._set_state(CircuitState.OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        if state == self._state:
+            return
+        logger.warning(
+            "Circuit %s: %s -> %s", self.name, self._state.value, state.value
+        )
+        self._state = state
+        if self._on_change:
+            self._on_change(self.name, state)
+
+
+class RetryBudget:
+    """
+    Retry-token budget shared by all adapters of a process.
+    Follows the gRPC retry-throttling scheme: every failed attempt
+    withdraws one token, every success deposits `token_ratio` tokens, and
+    retries are only allowed while more than half the tokens remain. A
+    widespread outage therefore turns retries off globally instead of
+    multiplying load by `max_attempts`.
+    """
+
+    def __init__(self, max_tokens: float = 10.0, token_ratio: float = 0.1):
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self.tokens = max_tokens
+        self.denied = 0
+
+    def can_retry(self) -> bool:
+        """Whether a retry may be attempted now."""
+        if self.tokens > self.max_tokens / 2:
+            return True
+        self.denied += 1
+        return False
+
+    def record_failure(self) -> None:
+        """Withdraw a token for a failed attempt."""
+        self.tokens = max(0.0, self.tokens - 1)
+
+    def record_success(self) -> None:
+        """Deposit a fraction of a token for a successful request."""
+        self.tokens = min(self.max_tokens, self.tokens + self.token_ratio)
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """
+    Parse a Retry-After header into a delay in seconds.
+    Accepts both delta-seconds and HTTP-date forms; returns None when
+    the header is missing or malformed.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        return None
+    wall = time.time() if now is None else now
+    return max(0.0, when.timestamp() - wall)
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    raw = headers.get(name)
+    if raw is None:
+        return None
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Client-side token bucket for one service.
+    - `rate`/`burst` give a static budget (rate=None: no static limit).
+    - `X-RateLimit-Remaining`/`X-RateLimit-Reset` re-pace the bucket so the
+      remaining quota is spread over the rest of the server's window, and
+      an exhausted quota blocks until the reset.
+    - `Retry-After` blocks the bucket for the given delay.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: float = 10.0,
+        clock: Clock = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self._clock = clock
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+        self._server_rate: Optional[float] = None
+        self._server_rate_until = 0.0
+
+    def _effective_rate(self, now: float) -> Optional[float]:
+        if self._server_rate is not None and now < self._server_rate_until:
+            if self.rate is None:
+                return self._server_rate
+            return min(self.rate, self._server_rate)
+        return self.rate
+
+    def _refill(self, now: float) -> None:
+        rate = self._effective_rate(now)
+        if rate is None:
+            self.tokens = self.burst
+        else:
+            elapsed = now - self._updated_at
+            self.tokens = min(self.burst, self.tokens + elapsed * rate)
+        self._updated_at = now
+
+    def delay(self) -> float:
+        """Seconds until a request may be sent."""
+        now = self._clock()
+        self._refill(now)
+        wait = max(0.0, self._blocked_until - now)
+        if self.tokens < 1:
+            rate = self._effective_rate(now)
+            if rate:
+                wait = max(wait, (1 - self.tokens) / rate)
+        return wait
+
+    async def acquire(self, max_wait: float) -> None:
+        """
+        Wait for a token and consume it. Raises a RATE_LIMIT TuiError
+        instead of waiting longer than `max_wait` seconds.
+        The token is reserved before waiting (the bucket may go
+        negative), so concurrent callers queue up behind each other
+        rather than all taking the same token when they wake.
+        """
+        wait = self.delay()
+        if wait > max_wait:
+            raise TuiError(
+                kind="RATE_LIMIT",
+                message=f"Rate limited, next slot in {wait:.1f}s",
+                retryable=True,
+            )
+        self.tokens -= 1
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.tokens += 1  # give the reservation back
+                raise
+
+    def block_for(self, seconds: float) -> None:
+        """Hold all requests for `seconds` (e.g. from Retry-After)."""
+        self._blocked_until = max(
+            self._blocked_until, self._clock() + seconds
+        )
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Adopt the server's published budget from X-RateLimit-* headers."""
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        # Reset is either delta-seconds or an epoch timestamp
+        if reset > 1e9:
+            reset = reset - time.time()
+        reset = max(0.0, reset)
+
+        now = self._clock()
+        self._refill(now)
+        if remaining < 1:
+            self.block_for(reset)
+        elif reset > 0:
+            self._server_rate = remaining / reset
+            self._server_rate_until = now + reset
+        self.tokens = min(self.tokens, max(remaining, 0.0))
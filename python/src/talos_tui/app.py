@@ -1,47 +1,41 @@
 """
 Talos TUI Application Entry Point.
 """
-import os
 import logging
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional
 
 from textual.app import App
 from textual.binding import Binding
 from textual.theme import Theme
 
-from talos_tui.core.state import StateStore
+from talos_tui import cli
+from talos_tui.core.state import (
+    LifecycleChanged,
+    StateStore,
+    TuiEvent,
+    iter_events,
+)
 from talos_tui.core.coordinator import Coordinator, TuiState
-from talos_tui.core.contracts import ContractValidator
-
-from talos_tui.adapters.gateway_http import HttpGatewayAdapter
-from talos_tui.adapters.audit_http import HttpAuditAdapter
-from talos_tui.adapters.mock import MockGatewayAdapter, MockAuditAdapter
+from talos_tui.core.details import AuditDetailCache
+from talos_tui.core.rollups import AuditRollups
+from talos_tui.core.timeline import AuditHistory
+from talos_tui.adapters.config import TuiConfig
+from talos_tui.adapters.mock import LoadProfile
+from talos_tui.domain.models import AuditEvent, AuditPage
+from talos_tui.hub import HubClient
+from talos_tui.ports import AuditPort
+from talos_tui.ports.errors import TuiError
+from talos_tui.runtime import Runtime
 
 from talos_tui.ui.screens.dashboard import StatusDashboard
 from talos_tui.ui.screens.audit import AuditViewer
+from talos_tui.ui.screens.analytics import AuditAnalytics
 from talos_tui.ui.screens.startup import StartupScreen
+from talos_tui.ui.screens.perf import PerfOverlay
 
-# Configure logging early and REDIRECT to file
-for handler in logging.root.handlers[:]:
-    logging.root.removeHandler(handler)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    filename="talos-tui.log",
-    filemode="a"
-)
 logger = logging.getLogger(__name__)
 
-# Constants
-GATEWAY_URL = os.getenv("TALOS_GATEWAY_URL", "http://localhost:8000")
-AUDIT_URL = os.getenv("TALOS_AUDIT_URL", "http://localhost:8001")
-USE_MOCK = os.getenv("TALOS_TUI_MOCK", "0") == "1"
-CONTRACTS_ROOT = (
-    Path(__file__).parent.parent.parent.parent.parent / "contracts"
-)
-
 TALOS_COMMAND_CENTER = Theme(
     name="talos-command-center",
     primary="#14FFEC",
@@ -69,97 +63,178 @@ class TalosTuiApp(App[None]):
     BINDINGS = [
         Binding("d", "show_dashboard", "Dashboard"),
         Binding("a", "show_audit", "Audit Logs"),
+        Binding("n", "show_analytics", "Analytics"),
+        Binding("p", "toggle_perf", "Perf"),
         Binding("q", "quit", "Quit"),
     ]
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        config: Optional[TuiConfig] = None,
+        record_path: Optional[Path] = None,
+        replay_path: Optional[Path] = None,
+        replay_speed: float = 1.0,
+        load_profile: Optional[LoadProfile] = None,
+        attach_path: Optional[Path] = None,
+    ) -> None:
         super().__init__()
-        self.store = StateStore()
-        self.validator = ContractValidator(CONTRACTS_ROOT / "schemas")
-
-        self.gateway: Any = None
-        self.audit: Any = None
+        self.config = config or TuiConfig()
+        self.store = StateStore(
+            max_audit_events=self.config.audit_ring_size,
+            max_metrics_history=self.config.metrics_history,
+            audit_rollups=AuditRollups(
+                self.config.rollup_window, self.config.rollup_windows
+            ),
+        )
+        self.record_path = record_path
+        self.replay_path = replay_path
+        self.replay_speed = replay_speed
+        self.load_profile = load_profile
+        self.attach_path = attach_path
 
+        self.runtime: Optional[Runtime] = None
         self.coordinator: Optional[Coordinator] = None
         self.dashboard_screen = StatusDashboard(self.store)
-        self.audit_screen = AuditViewer(self.store)
-
-        if not USE_MOCK:
-            # Type hint for mypy, though we import aiohttp later
-            self._session: Any = None
+        self.details = AuditDetailCache(
+            self._fetch_audit_event,
+            max_entries=self.config.audit_detail_cache,
+        )
+        self.history = AuditHistory(
+            self.store,
+            self._list_audit_events,
+            page_size=self.config.audit_page_size,
+            max_items=self.config.audit_history_size,
+        )
+        self.audit_screen = AuditViewer(
+            self.store,
+            self.details,
+            prefetch=self.config.audit_prefetch,
+            history=self.history,
+            scrub_step=self.config.audit_scrub_step,
+            export_dir=self.config.export_dir,
+            export_format=self.config.export_format,
+            export_chunk_size=self.config.export_chunk_size,
+        )
+        self.analytics_screen = AuditAnalytics(self.store)
 
     async def on_mount(self) -> None:
         """Initialize theme and start coordinator."""
         self.register_theme(TALOS_COMMAND_CENTER)
         self.theme = "talos-command-center"
 
-        if USE_MOCK:
-            self.gateway = MockGatewayAdapter()
-            self.audit = MockAuditAdapter()
-        else:
-            import aiohttp  # pylint: disable=import-outside-toplevel
-            # Shared session for all adapters
-            self._session = aiohttp.ClientSession()
-            self.gateway = HttpGatewayAdapter(
-                GATEWAY_URL, self._session, validator=self.validator
-            )
-            self.audit = HttpAuditAdapter(
-                AUDIT_URL, self._session, validator=self.validator
-            )
-
-        self.coordinator = Coordinator(
-            self.store,
-            self.gateway,
-            self.audit,
-            contracts_version_gate="1"
-        )
-
         self.install_screen(self.dashboard_screen, name="dashboard")
         self.install_screen(self.audit_screen, name="audit")
+        self.install_screen(self.analytics_screen, name="analytics")
+
+        # Navigation follows coordinator transitions as they are published
+        self.store.subscribe(self._on_store_event)
+
+        if self.attach_path is not None:
+            # Thin client: the hub owns the coordinator and adapters, and
+            # streams events with their payloads
+            self.details.fetch = None
+            self.history.list_events = None
+            self.push_screen(StartupScreen(self.store))
+            client = HubClient(self.store, self.attach_path)
+            self.run_worker(client.run(), name="hub-client", exclusive=True)
+            return
 
-        self.push_screen(StartupScreen(self.store))
-        await self.coordinator.start()
+        self.runtime = Runtime(
+            self.config,
+            self.store,
+            load_profile=self.load_profile,
+            record_path=self.record_path,
+            replay_path=self.replay_path,
+            replay_speed=self.replay_speed,
+        )
+        if self.runtime.warm_start():
+            # Last-known state (marked stale) while the handshake runs
+            self.push_screen("dashboard")
+        else:
+            self.push_screen(StartupScreen(self.store))
+        try:
+            self.coordinator = await self.runtime.start()
+        except TuiError:
+            # Published to the store as FATAL; the startup screen explains
+            return
 
-        # Monitor coordinator state to trigger screen transitions
-        self.set_interval(0.5, self._check_transitions)
+    def _audit_port(self) -> AuditPort:
+        if self.runtime is None or self.runtime.audit is None:
+            raise TuiError(kind="NOT_READY", message="Audit not connected")
+        return self.runtime.audit
+
+    async def _fetch_audit_event(self, event_id: str) -> AuditEvent:
+        """Fetch an event the store only holds a summary of."""
+        return await self._audit_port().get_event(event_id)
+
+    async def _list_audit_events(
+        self, limit: int, before: Optional[str]
+    ) -> AuditPage:
+        """Fetch older audit history for scrubbing."""
+        return await self._audit_port().list_events(
+            limit=limit, before=before
+        )
 
-    def _check_transitions(self) -> None:
-        """Check for state changes to trigger navigation."""
-        if not self.coordinator:
-            return
-        if (
-            self.coordinator.state == TuiState.RUNNING and
-            self.screen.__class__.__name__ == "StartupScreen"
-        ):
-            logger.info("Transitioning to dashboard")
+    def _on_store_event(self, event: TuiEvent) -> None:
+        for e in iter_events(event):
+            if isinstance(e, LifecycleChanged):
+                self.call_later(self._on_lifecycle, TuiState[e.state])
+
+    def _on_lifecycle(self, state: TuiState) -> None:
+        """
+        Navigate in response to a coordinator state transition. The perf
+        overlay may be on top of the screen navigated from; it is closed
+        first, so navigation never replaces or stacks over it.
+        """
+        on_startup = any(
+            isinstance(screen, StartupScreen) for screen in self.screen_stack
+        )
+        to_dashboard = on_startup and state in (
+            TuiState.RUNNING, TuiState.DEGRADED
+        )
+        to_startup = state == TuiState.FATAL and not on_startup
+        overlaid = isinstance(self.screen, PerfOverlay)
+        if (to_dashboard or to_startup) and overlaid:
             self.pop_screen()
+        if to_dashboard:
+            logger.info("Transitioning to dashboard")
             self.switch_screen("dashboard")
+        elif state == TuiState.DEGRADED:
+            self.notify(
+                "Degraded: showing last known data", severity="warning"
+            )
+        elif to_startup:
+            # The startup screen doubles as the fatal remediation screen
+            self.push_screen(StartupScreen(self.store))
 
     def action_show_dashboard(self) -> None:
         """Switch to dashboard screen."""
-        if self.coordinator and self.coordinator.state in (
-            TuiState.RUNNING,
-            TuiState.DEGRADED,
-        ):
+        if self.store.lifecycle in ("RUNNING", "DEGRADED"):
             self.switch_screen("dashboard")
 
     def action_show_audit(self) -> None:
         """Switch to audit screen."""
-        if self.coordinator and self.coordinator.state in (
-            TuiState.RUNNING,
-            TuiState.DEGRADED,
-        ):
+        if self.store.lifecycle in ("RUNNING", "DEGRADED"):
             self.switch_screen("audit")
 
+    def action_show_analytics(self) -> None:
+        """Switch to audit analytics screen."""
+        if self.store.lifecycle in ("RUNNING", "DEGRADED"):
+            self.switch_screen("analytics")
+
+    def action_toggle_perf(self) -> None:
+        """Show or hide the performance overlay."""
+        if isinstance(self.screen, PerfOverlay):
+            self.pop_screen()
+        else:
+            self.push_screen(PerfOverlay())
+
     async def on_unmount(self) -> None:
         """Cleanup resources on exit."""
-        if self.coordinator:
-            await self.coordinator.stop()
-        if not USE_MOCK and hasattr(self, "_session"):
-            await self._session.close()
+        if self.runtime:
+            await self.runtime.stop()
 
 
 def main() -> None:
     """Entry point for the application."""
-    app = TalosTuiApp()
-    app.run()
+    cli.main()
@@ -0,0 +1,226 @@
+"""Command-line entry point for the Talos TUI."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import sys
+from pathlib import Path
+from typing import Optional, Sequence, TextIO, Tuple
+
+from talos_tui.adapters.config import LayeredConfig, TuiConfig
+from talos_tui.adapters.mock import LoadProfile
+from talos_tui.hub import DEFAULT_HUB_SOCKET
+from talos_tui.logs import configure_logging
+from talos_tui.ports.errors import TuiError
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the `talos-tui` argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="talos-tui", description="Talos Protocol command center"
+    )
+    settings = parser.add_argument_group("configuration")
+    settings.add_argument(
+        "--config",
+        type=Path,
+        metavar="FILE",
+        help="TOML settings file (default: $TALOS_TUI_CONFIG, else "
+        "~/.config/talos-tui/config.toml if present)",
+    )
+    settings.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="FIELD=VALUE",
+        help="setting override, repeatable; beats the file and "
+        "TALOS_TUI_<FIELD> (see --print-config for the fields)",
+    )
+    settings.add_argument(
+        "--print-config",
+        action="store_true",
+        help="print the resolved settings and where each came from, "
+        "then exit",
+    )
+    traffic = parser.add_mutually_exclusive_group()
+    traffic.add_argument(
+        "--record",
+        type=Path,
+        metavar="FILE",
+        help="capture every gateway/audit response to FILE (gzip NDJSON)",
+    )
+    traffic.add_argument(
+        "--replay",
+        type=Path,
+        metavar="FILE",
+        help="drive the TUI from a recording instead of live services",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        metavar="N",
+        help="replay speed multiplier (default: 1.0)",
+    )
+    parser.add_argument(
+        "--mock",
+        action="store_true",
+        help="use the in-process synthetic load generator "
+        "(same as TALOS_TUI_MOCK=1)",
+    )
+    parser.add_argument(
+        "--mock-server",
+        metavar="[HOST:]PORT",
+        help="serve the synthetic gateway/audit API over HTTP until "
+        "Ctrl-C instead of starting the UI",
+    )
+    parser.add_argument(
+        "--load",
+        action="append",
+        default=[],
+        metavar="FIELD=VALUE",
+        help="load generator setting, repeatable; overrides "
+        "TALOS_MOCK_<FIELD> (fields: "
+        + ", ".join(LoadProfile.field_names())
+        + ")",
+    )
+    headless = parser.add_argument_group("headless collector")
+    headless.add_argument(
+        "--headless",
+        action="store_true",
+        help="run the collector without the UI (Textual is not loaded)",
+    )
+    headless.add_argument(
+        "--output",
+        metavar="FILE",
+        help="stream state changes as NDJSON to FILE ('-' for stdout; "
+        "the default unless --socket or --hub is given)",
+    )
+    headless.add_argument(
+        "--socket",
+        type=Path,
+        metavar="PATH",
+        help="serve JSON state snapshots on a Unix socket at PATH",
+    )
+    shared = parser.add_argument_group("shared collector")
+    shared.add_argument(
+        "--hub",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_HUB_SOCKET,
+        metavar="PATH",
+        help="run a headless hub that publishes state to attached TUIs "
+        f"(default socket: {DEFAULT_HUB_SOCKET})",
+    )
+    shared.add_argument(
+        "--attach",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_HUB_SOCKET,
+        metavar="PATH",
+        help="start the TUI as a thin client of a running hub",
+    )
+    return parser
+
+
+def _run_headless(
+    args: argparse.Namespace, config: TuiConfig, profile: LoadProfile
+) -> None:
+    # pylint: disable=import-outside-toplevel
+    from talos_tui.headless import run_headless
+    from talos_tui.runtime import Runtime
+
+    runtime = Runtime(
+        config,
+        load_profile=profile if args.mock else None,
+        record_path=args.record,
+        replay_path=args.replay,
+        replay_speed=args.speed,
+    )
+    # NDJSON goes to stdout unless another output was asked for
+    quiet = args.socket is not None or args.hub is not None
+    target = args.output or (None if quiet else "-")
+    with contextlib.ExitStack() as stack:
+        output: Optional[TextIO] = None
+        if target == "-":
+            output = sys.stdout
+        elif target is not None:
+            output = stack.enter_context(
+                open(target, "a", encoding="utf-8")
+            )
+        asyncio.run(
+            run_headless(runtime, output, args.socket, hub_path=args.hub)
+        )
+
+
+def _split_address(value: str) -> Tuple[str, int]:
+    host, _, port = value.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Entry point for the application."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+    try:
+        layered = LayeredConfig(
+            args.config, overrides=TuiConfig.parse_pairs(args.set)
+        )
+        config = layered.config
+        profile = LoadProfile.from_env().with_overrides(
+            LoadProfile.parse_pairs(args.load)
+        )
+        address = (
+            _split_address(args.mock_server) if args.mock_server else None
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    if args.print_config:
+        print(layered.describe())
+        return
+    if (args.output or args.socket) and not (args.headless or args.hub):
+        parser.error("--output and --socket require --headless or --hub")
+    if args.attach and (args.headless or args.hub or args.replay):
+        parser.error("--attach cannot be combined with a local collector")
+
+    # Logging goes through a queue so file I/O never runs on the loop
+    listener = configure_logging(
+        config.log_file,
+        json_format=config.log_json,
+        sample_every=config.log_sample_every,
+    )
+    try:
+        if address is not None:
+            # pylint: disable-next=import-outside-toplevel
+            from talos_tui.adapters.mock_server import serve
+            host, port = address
+            print(f"Mock gateway/audit API on http://{host}:{port}")
+            try:
+                asyncio.run(serve(host, port, profile))
+            except KeyboardInterrupt:
+                pass
+            return
+        if args.headless or args.hub:
+            try:
+                _run_headless(args, config, profile)
+            except TuiError as e:
+                sys.exit(f"talos-tui: {e}")
+            return
+
+        # Imported late: Textual is only needed once we run the UI
+        from talos_tui.app import (  # pylint: disable=import-outside-toplevel
+            TalosTuiApp,
+        )
+        app = TalosTuiApp(
+            config,
+            record_path=args.record,
+            replay_path=args.replay,
+            replay_speed=args.speed,
+            load_profile=profile if args.mock else None,
+            attach_path=args.attach,
+        )
+        app.run()
+    finally:
+        listener.stop()
@@ -0,0 +1,192 @@
+"""Time-ordered audit event storage that tolerates late arrivals."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from itertools import chain, islice
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, overload
+)
+
+from ..domain.timestamps import parse_ts
+
+Item = Dict[str, Any]
+
+# Items per chunk before it is split in two
+CHUNK_SIZE = 512
+
+
+def event_key(item: Item) -> int:
+    """Sort key of a stored item: newest first, by `ts_ns`."""
+    return -int(item["ts_ns"])
+
+
+def _keyed(item: Item) -> Item:
+    """`item` with its `ts_ns` sort key (parsed if it lacks one)."""
+    if "ts_ns" in item:
+        return item
+    return {**item, "ts_ns": parse_ts(item.get("ts"))}
+
+
+def _event_id(item: Item) -> Optional[str]:
+    return item.get("event_id") or item.get("id")
+
+
+class AuditLog(Sequence[Item]):
+    """
+    Audit items kept newest first by event time, not by arrival:
+    - Items live in sorted chunks of up to 2 * CHUNK_SIZE, indexed by
+      each chunk's oldest key, so an insert anywhere (a late or
+      out-of-order arrival, or a merge of sources) costs a binary search
+      plus a bounded shift: O(log n), not O(n) as a flat list would.
+    - Items with equal times keep arrival order: a later batch first,
+      and within a batch, the order it was received in.
+    - Ids are unique; `add` skips ids already held, and `trim` drops the
+      oldest items, so the id index stays bounded with the log.
+    Reads behave like a (read-only) newest-first list.
+    """
+
+    def __init__(self, items: Iterable[Item] = ()):
+        self._chunks: List[List[Item]] = []
+        self._maxes: List[int] = []  # key of each chunk's last item
+        self._ids: Set[str] = set()
+        self._len = 0
+        # Start index of each chunk, rebuilt lazily after a change
+        self._offsets: Optional[List[int]] = None
+        self.late = 0  # items that landed behind a newer one
+        self.add(list(items))
+
+    def has(self, event_id: str) -> bool:
+        """Whether an item with this id is held."""
+        return event_id in self._ids
+
+    def add(self, items: Sequence[Item]) -> List[Item]:
+        """
+        Insert a newest-first batch; returns the new items (those whose
+        id was not held yet), in the order given.
+        """
+        added: List[Item] = []
+        # Oldest first, each placed ahead of equal keys
+        for item in reversed(items):
+            eid = _event_id(item)
+            if not eid or eid in self._ids:
+                continue
+            item = _keyed(item)
+            self._ids.add(eid)
+            self._insert(item)
+            added.append(item)
+        added.reverse()
+        return added
+
+    def _insert(self, item: Item) -> None:
+        key = event_key(item)
+        self._len += 1
+        self._offsets = None
+        if not self._chunks:
+            self._chunks.append([item])
+            self._maxes.append(key)
+            return
+        i = bisect_left(self._maxes, key)
+        if i == len(self._chunks):
+            # Older than everything held
+            i -= 1
+            self.late += 1
+            self._chunks[i].append(item)
+            self._maxes[i] = key
+        else:
+            chunk = self._chunks[i]
+            at = bisect_left(chunk, key, key=event_key)
+            if at or i:
+                self.late += 1
+            chunk.insert(at, item)
+        if len(self._chunks[i]) > 2 * CHUNK_SIZE:
+            chunk = self._chunks[i]
+            self._chunks[i:i + 1] = [chunk[:CHUNK_SIZE], chunk[CHUNK_SIZE:]]
+            self._maxes[i:i + 1] = [
+                event_key(chunk[CHUNK_SIZE - 1]), event_key(chunk[-1])
+            ]
+
+    def trim(self, max_items: int) -> None:
+        """Drop the oldest items beyond `max_items`."""
+        excess = self._len - max_items
+        while excess > 0 and self._chunks:
+            chunk = self._chunks[-1]
+            drop = chunk[-excess:] if excess < len(chunk) else chunk
+            for item in drop:
+                # Only items with an id are ever added
+                eid = _event_id(item)
+                if eid:
+                    self._ids.discard(eid)
+            if drop is chunk:
+                self._chunks.pop()
+                self._maxes.pop()
+            else:
+                del chunk[-excess:]
+                self._maxes[-1] = event_key(chunk[-1])
+            excess -= len(drop)
+            self._len -= len(drop)
+            self._offsets = None
+
+    def index_at(self, ts_ns: int) -> int:
+        """Index of the first (newest) item at or before `ts_ns`."""
+        i = bisect_left(self._maxes, -ts_ns)
+        if i == len(self._chunks):
+            return self._len
+        at = bisect_left(self._chunks[i], -ts_ns, key=event_key)
+        return self._positions()[i] + at
+
+    def _positions(self) -> List[int]:
+        if self._offsets is None:
+            offsets, total = [], 0
+            for chunk in self._chunks:
+                offsets.append(total)
+                total += len(chunk)
+            self._offsets = offsets
+        return self._offsets
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        positions = self._positions()
+        i = bisect_right(positions, index) - 1
+        return i, index - positions[i]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Item]:
+        return chain.from_iterable(self._chunks)
+
+    @overload
+    def __getitem__(self, index: int) -> Item: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Item]: ...
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                return list(self)[index]
+            if start >= stop:
+                return []
+            i, at = self._locate(start)
+            return list(islice(
+                chain(self._chunks[i][at:], *self._chunks[i + 1:]),
+                stop - start,
+            ))
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("audit log index out of range")
+        if index == 0:
+            return self._chunks[0][0]
+        if index == self._len - 1:
+            return self._chunks[-1][-1]
+        i, at = self._locate(index)
+        return self._chunks[i][at]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (AuditLog, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"AuditLog({len(self)} items)"
@@ -1,21 +1,241 @@
 from __future__ import annotations
+import asyncio
+import hashlib
 import json
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import (
+    Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+)
 import jsonschema
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+from referencing import Registry, Resource
+from referencing.jsonschema import DRAFT202012
+
+from .telemetry import TELEMETRY
+from ..ports.errors import TuiError
 
 logger = logging.getLogger(__name__)
 
+# Schemas the adapters validate against; the bundle must contain them
+REQUIRED_SCHEMAS = ("audit/audit_event.schema.json",)
+
+BUNDLE_CACHE_VERSION = 1
+
+VALIDATION_MODES = ("full", "sampled", "structural")
+
+Fingerprint = List[Tuple[str, int, int]]
+
+
+def find_contracts_root(
+    configured: str = "", start: Sequence[Path] = ()
+) -> Optional[Path]:
+    """
+    The talos-contracts checkout: `configured` if set, else the nearest
+    `contracts/` directory with a `schemas/` folder above this package
+    or the working directory (monorepo layout).
+    """
+    if configured:
+        return Path(configured).expanduser()
+    starts = list(start) or [Path(__file__).resolve(), Path.cwd()]
+    for origin in starts:
+        for parent in (origin, *origin.parents):
+            candidate = parent / "contracts"
+            if (candidate / "schemas").is_dir():
+                return candidate
+    return None
+
+
+@dataclass(frozen=True)
+class ContractBundle:
+    """
+    Every schema under a `schemas/` root, parsed and checked, keyed by its
+    relative path, plus a SHA-256 digest of their contents.
+    """
+
+    root: Path
+    digest: str
+    schemas: Dict[str, Dict[str, Any]]
+
+    @classmethod
+    def load(
+        cls,
+        schemas_root: Path,
+        cache_dir: Optional[Path] = None,
+        required: Iterable[str] = REQUIRED_SCHEMAS,
+        max_workers: int = 8,
+    ) -> ContractBundle:
+        """
+        Load the bundle (blocking; run it off the loop). Files are read
+        and parsed concurrently. With `cache_dir`, the parsed bundle is
+        cached there and reused while no schema file has changed (same
+        paths, sizes and mtimes), so later launches skip re-parsing and
+        re-checking. Raises TuiError(CONTRACT) if a required schema is
+        missing or a schema is invalid.
+        """
+        if not schemas_root.is_dir():
+            raise TuiError(
+                kind="CONTRACT",
+                message=f"Contract schemas not found at {schemas_root}",
+            )
+        paths = sorted(schemas_root.rglob("*.json"))
+        fingerprint: Fingerprint = []
+        for path in paths:
+            st = path.stat()
+            fingerprint.append((
+                path.relative_to(schemas_root).as_posix(),
+                st.st_size,
+                st.st_mtime_ns,
+            ))
+
+        cache = cache_dir / "contracts.bundle.json" if cache_dir else None
+        bundle = cls._from_cache(cache, schemas_root, fingerprint)
+        if bundle is None:
+            with TELEMETRY.timer("contracts.parse"):
+                bundle = cls._parse(schemas_root, paths, max_workers)
+            if cache is not None:
+                bundle._save(cache, fingerprint)
+
+        missing = [name for name in required if name not in bundle.schemas]
+        if missing:
+            raise TuiError(
+                kind="CONTRACT",
+                message=f"Required schemas missing from {schemas_root}: "
+                        f"{', '.join(missing)}",
+            )
+        logger.info(
+            "Loaded %d contract schemas (digest %s)",
+            len(bundle.schemas), bundle.digest[:12],
+        )
+        return bundle
+
+    @classmethod
+    def _parse(
+        cls, schemas_root: Path, paths: List[Path], max_workers: int
+    ) -> ContractBundle:
+        def read(path: Path) -> Tuple[str, bytes, Dict[str, Any]]:
+            raw = path.read_bytes()
+            name = path.relative_to(schemas_root).as_posix()
+            try:
+                schema = json.loads(raw)
+                validator_for(schema).check_schema(schema)
+            except (ValueError, jsonschema.SchemaError) as e:
+                raise TuiError(
+                    kind="CONTRACT", message=f"Invalid schema {name}: {e}"
+                ) from e
+            return name, raw, schema
+
+        with ThreadPoolExecutor(max_workers) as pool:
+            loaded = list(pool.map(read, paths))
+
+        digest = hashlib.sha256()
+        schemas: Dict[str, Dict[str, Any]] = {}
+        for name, raw, schema in loaded:
+            digest.update(name.encode() + b"\0" + raw + b"\0")
+            schemas[name] = schema
+        return cls(schemas_root, digest.hexdigest(), schemas)
+
+    @classmethod
+    def _from_cache(
+        cls,
+        cache: Optional[Path],
+        schemas_root: Path,
+        fingerprint: Fingerprint,
+    ) -> Optional[ContractBundle]:
+        if cache is None:
+            return None
+        try:
+            data = json.loads(cache.read_bytes())
+            if (
+                data["version"] != BUNDLE_CACHE_VERSION
+                or data["root"] != str(schemas_root)
+                or [tuple(f) for f in data["fingerprint"]] != fingerprint
+            ):
+                return None
+            TELEMETRY.counter("contracts.cache_hits").inc()
+            return cls(schemas_root, data["digest"], data["schemas"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring contract cache %s: %s", cache, e)
+            return None
+
+    def _save(self, cache: Path, fingerprint: Fingerprint) -> None:
+        data = {
+            "version": BUNDLE_CACHE_VERSION,
+            "root": str(self.root),
+            "digest": self.digest,
+            "fingerprint": fingerprint,
+            "schemas": self.schemas,
+        }
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache.with_name(cache.name + ".tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp, cache)
+        except OSError as e:
+            logger.warning("Could not cache contracts in %s: %s", cache, e)
+
+
+async def preload_contracts(
+    contracts_root: Path, cache_dir: Optional[Path] = None
+) -> ContractValidator:
+    """
+    Load the contract bundle and compile its validators in a worker
+    thread; see ContractBundle.
+    """
+
+    def load() -> ContractValidator:
+        bundle = ContractBundle.load(contracts_root / "schemas", cache_dir)
+        return ContractValidator.from_bundle(bundle)
+
+    return await asyncio.to_thread(load)
+
 
 class ContractValidator:
     """
     Mechanized contract validation using JSON schemas from talos-contracts.
+    Built from a preloaded ContractBundle, every schema is compiled up
+    front (with `$ref`s resolved within the bundle) and validation never
+    touches the filesystem; otherwise schemas load lazily on first use.
     """
 
     def __init__(self, schemas_root: Path):
         self.schemas_root = schemas_root
         self._cache: Dict[str, Dict[str, Any]] = {}
+        self._validators: Dict[str, Validator] = {}
+        self._required: Dict[str, Tuple[str, ...]] = {}
+
+    @classmethod
+    def from_bundle(cls, bundle: ContractBundle) -> ContractValidator:
+        """A validator with every schema of `bundle` compiled."""
+        validator = cls(bundle.root)
+        resources: List[Tuple[str, Resource[Any]]] = []
+        compiled: Dict[str, Dict[str, Any]] = {}
+        for name, schema in bundle.schemas.items():
+            # Schemas without an $id are addressed by their file URI, so
+            # relative $refs between files resolve
+            file_uri = (bundle.root / name).as_uri()
+            schema = {"$id": file_uri, **schema}
+            resource = Resource.from_contents(
+                schema, default_specification=DRAFT202012
+            )
+            resources.append((file_uri, resource))
+            if schema["$id"] != file_uri:
+                resources.append((schema["$id"], resource))
+            compiled[name] = schema
+        registry: Registry[Any] = Registry().with_resources(resources)
+        for name, schema in compiled.items():
+            validator._cache[name] = bundle.schemas[name]
+            validator._validators[name] = validator_for(schema)(
+                schema, registry=registry
+            )
+        return validator
 
     def _load_schema(self, schema_path: str) -> Dict[str, Any]:
         if schema_path in self._cache:
@@ -23,7 +243,7 @@ class ContractValidator:
 
         full_path = self.schemas_root / schema_path
         if not full_path.exists():
-            logger.error(f"Schema not found: {full_path}")
+            logger.error("Schema not found: %s", full_path)
             raise FileNotFoundError(
                 f"Schema {schema_path} not found at {full_path}"
             )
@@ -33,18 +253,147 @@ class ContractValidator:
             self._cache[schema_path] = schema
             return schema
 
+    def required_fields(self, schema_path: str) -> Tuple[str, ...]:
+        """Top-level `required` properties of a schema."""
+        fields_ = self._required.get(schema_path)
+        if fields_ is None:
+            schema = self._load_schema(schema_path)
+            fields_ = tuple(schema.get("required", ()))
+            self._required[schema_path] = fields_
+        return fields_
+
+    def validate_structure(self, schema_path: str, data: Any) -> None:
+        """
+        Fast check that `data` is an object with the schema's required
+        fields. Throws jsonschema.ValidationError.
+        """
+        if not isinstance(data, dict):
+            raise jsonschema.ValidationError(
+                f"expected an object, got {type(data).__name__}"
+            )
+        for name in self.required_fields(schema_path):
+            if name not in data:
+                raise jsonschema.ValidationError(
+                    f"{name!r} is a required property"
+                )
+
     def validate(self, schema_path: str, data: Any) -> None:
         """
         Validate data against a schema. Throws jsonschema.ValidationError.
         """
         try:
+            compiled = self._validators.get(schema_path)
+            if compiled is not None:
+                compiled.validate(data)
+                return
             schema = self._load_schema(schema_path)
             jsonschema.validate(instance=data, schema=schema)
         except jsonschema.ValidationError as e:
             logger.error(
-                f"Contract validation failed for {schema_path}: {e.message}"
+                "Contract validation failed for %s: %s", schema_path, e.message
             )
             raise
         except Exception as e:
-            logger.error(f"Error loading/validating schema {schema_path}: {e}")
+            logger.error(
+                "Error loading/validating schema %s: %s", schema_path, e
+            )
             raise
+
+
+class ValidationPolicy:
+    """
+    How much validation each ingested item gets:
+    - full: every item against its schema.
+    - sampled: 1 in `sample_every` items, plus every item of a
+      `schema_id` not seen before; the rest get the structural check.
+    - structural: only the schema's required fields are checked.
+    Any failure escalates to full validation for `escalation_seconds`.
+    Counts items fully `validated`, `skipped` (structural check only)
+    and `failed`.
+    """
+
+    def __init__(
+        self,
+        mode: str = "full",
+        sample_every: int = 20,
+        escalation_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if mode not in VALIDATION_MODES:
+            raise ValueError(
+                f"validation mode must be one of {', '.join(VALIDATION_MODES)}"
+            )
+        self.mode = mode
+        self.sample_every = max(1, sample_every)
+        self.escalation_seconds = escalation_seconds
+        self._clock = clock
+        self._escalated_until = 0.0
+        self._seen_schema_ids: Set[str] = set()
+        self._count = 0
+        self.validated = 0
+        self.skipped = 0
+        self.failed = 0
+
+    @property
+    def escalated(self) -> bool:
+        """Whether a recent failure forces full validation."""
+        return self._clock() < self._escalated_until
+
+    @property
+    def effective_mode(self) -> str:
+        """The mode currently applied."""
+        return "full" if self.escalated else self.mode
+
+    def _wants_full(self, item: Any) -> bool:
+        mode = self.effective_mode
+        if mode == "full":
+            return True
+        if mode == "structural":
+            return False
+        self._count += 1
+        schema_id = item.get("schema_id") if isinstance(item, dict) else None
+        if schema_id is not None and schema_id not in self._seen_schema_ids:
+            self._seen_schema_ids.add(schema_id)
+            return True
+        return self._count % self.sample_every == 0
+
+    def check(
+        self, validator: ContractValidator, schema_path: str, item: Any
+    ) -> None:
+        """
+        Validate `item` as the policy dictates. Throws
+        jsonschema.ValidationError (after escalating).
+        """
+        full = self._wants_full(item)
+        try:
+            if full:
+                validator.validate(schema_path, item)
+            else:
+                validator.validate_structure(schema_path, item)
+        except jsonschema.ValidationError:
+            self.failed += 1
+            TELEMETRY.counter("validation.failed").inc()
+            if self.mode != "full" and not self.escalated:
+                logger.warning(
+                    "Contract violation; validating every event for %.0fs",
+                    self.escalation_seconds,
+                )
+            self._escalated_until = self._clock() + self.escalation_seconds
+            raise
+        if full:
+            self.validated += 1
+            TELEMETRY.counter("validation.validated").inc()
+        else:
+            self.skipped += 1
+            TELEMETRY.counter("validation.skipped").inc()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and mode, as published to the store."""
+        return {
+            "mode": self.mode,
+            "effective_mode": self.effective_mode,
+            "sample_every": self.sample_every,
+            "validated": self.validated,
+            "skipped": self.skipped,
+            "failed": self.failed,
+        }
@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from enum import Enum, auto
-from typing import Any, Dict, Set, Coroutine
+from typing import Any, Callable, Dict, List, Optional, Set, Coroutine
 
 from .state import (
     StateStore,
@@ -12,8 +12,13 @@ from .state import (
     VersionUpdated,
     MetricsUpdated,
     AuditEventsReceived,
-    ErrorOccurred
+    ErrorOccurred,
+    LifecycleChanged,
+    CircuitChanged,
+    TuiEvent,
+    ValidationStatsUpdated,
 )
+from .watchdog import LoopWatchdog
 from ..ports.errors import TuiError
 
 
@@ -48,7 +53,13 @@ class Coordinator:
         gateway_adapter: Any,
         audit_adapter: Any,
         contracts_version_gate: str = "0",
-        max_handshake_attempts: int = 5
+        max_handshake_attempts: int = 5,
+        watchdog: Optional[LoopWatchdog] = None,
+        poll_interval: float = 2.0,
+        handshake_interval: float = 1.0,
+        max_resume_pages: int = 20,
+        audit_page_size: int = 50,
+        validation_stats: Optional[Callable[[], Dict[str, Any]]] = None,
     ):
         self.store = store
         self.gateway = gateway_adapter
@@ -56,23 +67,50 @@ class Coordinator:
         self.state = TuiState.BOOT
         self.contracts_version_gate = contracts_version_gate
         self.max_handshake_attempts = max_handshake_attempts
+        self.watchdog = watchdog or LoopWatchdog()
+        self.poll_interval = poll_interval
+        self.handshake_interval = handshake_interval
+        self.max_resume_pages = max_resume_pages
+        self.audit_page_size = audit_page_size
+        self.validation_stats = validation_stats
 
         self._tasks: Set[asyncio.Task[Any]] = set()
         self._handshake_attempts: Dict[str, int] = {"gateway": 0, "audit": 0}
         self._stop_event = asyncio.Event()
 
+    def on_circuit_change(
+        self, source: str, endpoint: str, state: Any
+    ) -> None:
+        """Adapter circuit listener: mirror breaker state into the store."""
+        self.store.reduce(
+            CircuitChanged(
+                source=source,
+                endpoint=endpoint,
+                state=getattr(state, "value", str(state)),
+            )
+        )
+
     async def start(self) -> None:
         """Start the TUI lifecycle."""
         logger.info("Coordinator starting...")
         self.transition(TuiState.HANDSHAKE_GATEWAY)
         self.spawn(self._handshake_loop())
+        self.watchdog.start()
+        self.spawn(self.watchdog.heartbeat())
 
     def transition(self, new_state: TuiState) -> None:
-        """Transition to a new state."""
-        logger.info("Transition: %s -> %s", self.state.name, new_state.name)
+        """
+        Transition to a new state and publish it as a LifecycleChanged
+        event, so subscribers (screens, navigation) react immediately.
+        """
+        if new_state == self.state:
+            return
+        previous = self.state
+        logger.info("Transition: %s -> %s", previous.name, new_state.name)
         self.state = new_state
-        if new_state == TuiState.FATAL:
-            self.store.is_fatal = True
+        self.store.reduce(
+            LifecycleChanged(previous=previous.name, state=new_state.name)
+        )
 
     def spawn(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
         """Spawn a background task."""
@@ -87,6 +125,7 @@ class Coordinator:
         self.transition(TuiState.STOPPING)
 
         self._stop_event.set()
+        self.watchdog.stop()
         for task in list(self._tasks):
             task.cancel()
         if self._tasks:
@@ -110,7 +149,7 @@ class Coordinator:
             elif self.state == TuiState.FATAL:
                 return
 
-            await asyncio.sleep(1.0)
+            await asyncio.sleep(self.handshake_interval)
 
     async def _do_handshake(self, source: str) -> None:
         if self._handshake_attempts[source] >= self.max_handshake_attempts:
@@ -209,7 +248,7 @@ class Coordinator:
         while not self._stop_event.is_set():
             try:
                 metrics = await self.gateway.get_metrics_summary()
-                self.store.reduce(MetricsUpdated(metrics=metrics.dict()))
+                self.store.reduce(MetricsUpdated(metrics=metrics.model_dump()))
                 if (
                     self.state == TuiState.DEGRADED
                     and self.store.gateway.health_ok
@@ -226,19 +265,60 @@ class Coordinator:
             except Exception as e:  # pylint: disable=broad-exception-caught
                 logger.error("Metrics polling error: %s", e)
 
-            await asyncio.sleep(2.0)
+            await asyncio.sleep(self.poll_interval)
+
+    async def _resume_audit(self) -> None:
+        """
+        After a warm start, page back from the head only until reaching an
+        event we already hold, instead of re-fetching history.
+        """
+        items: List[Dict[str, Any]] = []
+        cursor: Optional[str] = None
+        for _ in range(self.max_resume_pages):
+            page = await self.audit.list_events(
+                limit=self.audit_page_size, before=cursor
+            )
+            for item in page.items:
+                if self.store.has_audit_event(item.id):
+                    break
+                items.append(item.model_dump())
+            else:
+                if page.has_more and page.next_cursor:
+                    cursor = page.next_cursor
+                    continue
+            break
+        logger.info("Resumed audit ingestion with %d new events", len(items))
+        # Pages arrive newest-first; reduce them as one batch
+        self.store.reduce(
+            AuditEventsReceived(
+                items=items, next_cursor=self.store.audit_cursor
+            )
+        )
 
     async def _poll_audit(self) -> None:
+        if self.store.audit_events:
+            try:
+                await self._resume_audit()
+            except TuiError as e:
+                logger.warning("Audit resume failed: %s", e.message)
+
         while not self._stop_event.is_set():
 
             try:
-                page = await self.audit.list_events(limit=50)
-                self.store.reduce(
+                page = await self.audit.list_events(
+                    limit=self.audit_page_size
+                )
+                events: List[TuiEvent] = [
                     AuditEventsReceived(
-                        items=[item.dict() for item in page.items],
+                        items=[item.model_dump() for item in page.items],
                         next_cursor=page.next_cursor
                     )
-                )
+                ]
+                if self.validation_stats is not None:
+                    events.append(
+                        ValidationStatsUpdated(stats=self.validation_stats())
+                    )
+                self.store.reduce_many(events)
             except TuiError as e:
                 audit_err = ErrorOccurred(
                     source="audit", kind=e.kind, message=e.message
@@ -248,4 +328,4 @@ class Coordinator:
             except Exception as e:  # pylint: disable=broad-exception-caught
                 logger.error("Audit polling error: %s", e)
 
-            await asyncio.sleep(2.0)
+            await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,143 @@
+"""Full audit event details for the detail pane, fetched on demand."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import (
+    Any, Awaitable, Callable, Dict, Iterable, Mapping, Optional, Set
+)
+
+from .redaction import audit_payload
+from .telemetry import TELEMETRY
+from ..ports.errors import TuiError
+
+logger = logging.getLogger(__name__)
+
+Detail = Dict[str, Any]
+FetchEvent = Callable[[str], Awaitable[Any]]
+
+
+def event_id_of(item: Mapping[str, Any]) -> str:
+    """The id of a stored audit item ("" if it has none)."""
+    return str(item.get("event_id") or item.get("id") or "")
+
+
+def is_complete(item: Mapping[str, Any]) -> bool:
+    """Whether a stored item holds its payload (else it is a summary)."""
+    # Every ingested item has `payload_raw`; it is "" for a summary
+    return bool(item.get("payload_raw")) or "payload" in item
+
+
+def materialize(item: Mapping[str, Any]) -> Detail:
+    """The full, redacted event for a complete stored or fetched item."""
+    return {
+        "event_id": event_id_of(item),
+        "ts": item.get("ts"),
+        "schema_id": item.get("event_type") or item.get("schema_id"),
+        "outcome": item.get("outcome", "OK"),
+        "payload": audit_payload(item),
+    }
+
+
+class AuditDetailCache:
+    """
+    Materialized audit events, by id:
+    - Events held in full locally are parsed and redacted in place; only
+      summaries are fetched from the audit service (`fetch`, by id).
+    - Details are kept in an LRU of `max_entries`, so moving the cursor
+      back and forth never re-parses or re-fetches.
+    - Concurrent requests for one id share a single fetch, and at most
+      `max_concurrency` fetches run at once.
+    - `prefetch()` warms the rows around the cursor in the background.
+    """
+
+    def __init__(
+        self,
+        fetch: Optional[FetchEvent] = None,
+        max_entries: int = 256,
+        max_concurrency: int = 4,
+    ):
+        self.fetch = fetch
+        self.max_entries = max_entries
+        self._details: OrderedDict[str, Detail] = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future[Detail]] = {}
+        self._failed: Set[str] = set()
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self.hits = 0
+        self.fetches = 0
+
+    def __len__(self) -> int:
+        return len(self._details)
+
+    def resolve(self, item: Mapping[str, Any]) -> Optional[Detail]:
+        """The detail for `item` if available without a fetch."""
+        eid = event_id_of(item)
+        detail = self._details.get(eid)
+        if detail is not None:
+            self.hits += 1
+            TELEMETRY.counter("details.hits").inc()
+            self._details.move_to_end(eid)
+            return detail
+        if not is_complete(item):
+            return None
+        detail = materialize(item)
+        self._remember(eid, detail)
+        return detail
+
+    async def get(self, item: Mapping[str, Any]) -> Detail:
+        """The detail for `item`, fetching it by id if only a summary."""
+        detail = self.resolve(item)
+        if detail is not None:
+            return detail
+        # Shielded so a cancelled caller does not abort the shared fetch
+        return await asyncio.shield(self._fetch(event_id_of(item)))
+
+    def prefetch(self, items: Iterable[Mapping[str, Any]]) -> None:
+        """Start background fetches for the summaries among `items`."""
+        if self.fetch is None:
+            return
+        for item in items:
+            eid = event_id_of(item)
+            if (
+                eid
+                and eid not in self._details
+                and eid not in self._failed
+                and not is_complete(item)
+            ):
+                self._fetch(eid)
+
+    def _fetch(self, eid: str) -> asyncio.Future[Detail]:
+        flight = self._inflight.get(eid)
+        if flight is None:
+            flight = asyncio.ensure_future(self._load(eid))
+            self._inflight[eid] = flight
+            flight.add_done_callback(lambda f: self._land(eid, f))
+        return flight
+
+    def _land(self, eid: str, flight: asyncio.Future[Detail]) -> None:
+        self._inflight.pop(eid, None)
+        if not flight.cancelled() and flight.exception() is not None:
+            # Not retried by prefetch; an explicit get() tries again
+            self._failed.add(eid)
+
+    async def _load(self, eid: str) -> Detail:
+        if self.fetch is None:
+            raise TuiError(
+                kind="NOT_READY",
+                message="Event details cannot be fetched in this mode",
+            )
+        async with self._slots:
+            self.fetches += 1
+            with TELEMETRY.timer("details.fetch"):
+                event = await self.fetch(eid)
+        detail = materialize(event.model_dump())
+        self._failed.discard(eid)
+        self._remember(eid, detail)
+        return detail
+
+    def _remember(self, eid: str, detail: Detail) -> None:
+        self._details[eid] = detail
+        self._details.move_to_end(eid)
+        if len(self._details) > self.max_entries:
+            self._details.popitem(last=False)
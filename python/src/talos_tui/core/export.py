@@ -0,0 +1,196 @@
+"""Background export of audit events to compressed files."""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import (
+    Any, Callable, Dict, Iterable, List, Mapping, Optional, Protocol
+)
+
+from .details import materialize
+from .telemetry import TELEMETRY
+
+logger = logging.getLogger(__name__)
+
+Item = Dict[str, Any]
+
+# File formats by suffix; zstd needs `zstandard`, parquet `pyarrow`
+EXPORT_FORMATS = ("ndjson.gz", "ndjson.zst", "parquet")
+# Columns of a parquet export, as in each NDJSON record
+EXPORT_FIELDS = ("event_id", "ts", "schema_id", "outcome", "payload")
+
+
+def export_format(path: Path) -> str:
+    """The export format of `path`, from its suffix."""
+    for fmt in EXPORT_FORMATS:
+        if path.name.endswith("." + fmt):
+            return fmt
+    raise ValueError(
+        f"{path.name}: export to one of "
+        + ", ".join("*." + fmt for fmt in EXPORT_FORMATS)
+    )
+
+
+def export_path(directory: str, fmt: str) -> Path:
+    """A new, timestamped export file name in `directory`."""
+    stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    return Path(directory or ".") / f"talos-audit-{stamp}.{fmt}"
+
+
+class _Writer(Protocol):
+    def write(self, records: List[Item]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class _NdjsonWriter:
+    """One redacted event per line, compressed with gzip or zstd."""
+
+    def __init__(self, path: Path, fmt: str):
+        self._file: Any  # GzipFile or a zstd stream writer
+        if fmt == "ndjson.zst":
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ValueError(
+                    "zstd export needs the `zstandard` package"
+                ) from e
+            raw = open(path, "wb")
+            self._file = zstandard.ZstdCompressor(level=3).stream_writer(raw)
+        else:
+            self._file = gzip.open(path, "wb", compresslevel=6)
+        self._encoder = json.JSONEncoder(separators=(",", ":"), default=str)
+
+    def write(self, records: List[Item]) -> None:
+        encode = self._encoder.encode
+        self._file.write(
+            "".join(encode(r) + "\n" for r in records).encode()
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """Columnar: a row group per chunk; payloads as JSON strings."""
+
+    def __init__(self, path: Path, fmt: str):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ValueError(
+                "parquet export needs the `pyarrow` package"
+            ) from e
+        self._pa = pa
+        self._schema = pa.schema(
+            [(name, pa.string()) for name in EXPORT_FIELDS]
+        )
+        self._writer = pq.ParquetWriter(
+            path, self._schema, compression="zstd"
+        )
+
+    def write(self, records: List[Item]) -> None:
+        columns: Dict[str, List[Any]] = {name: [] for name in EXPORT_FIELDS}
+        for r in records:
+            for name in EXPORT_FIELDS[:-1]:
+                columns[name].append(r[name])
+            columns["payload"].append(
+                json.dumps(r["payload"], separators=(",", ":"), default=str)
+            )
+        self._writer.write_table(
+            self._pa.table(columns, schema=self._schema)
+        )
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class AuditExport:
+    """
+    Export of a set of audit items, newest first:
+    - The set is fixed when `run()` starts (a copy of the item
+      references, taken on the loop); events ingested meanwhile are
+      not included.
+    - Items are redacted, encoded and compressed `chunk_size` at a
+      time in a worker thread, so the loop keeps running throughout.
+      `match`, if given, selects the items written.
+    - Progress is `done` of `total` items; `written` were exported.
+    - The file is written under a temporary name and renamed when
+      complete; a failed or cancelled export leaves nothing behind.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Item],
+        path: Path,
+        chunk_size: int = 5000,
+        match: Optional[Callable[[Mapping[str, Any]], bool]] = None,
+    ):
+        self.format = export_format(path)
+        self.path = path
+        self.chunk_size = max(1, chunk_size)
+        self.match = match
+        self._source = items
+        self.total = 0
+        self.done = 0
+        self.written = 0
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the set processed so far."""
+        return self.done / self.total if self.total else 0.0
+
+    async def run(self) -> Path:
+        """Write the export; returns its path."""
+        items = list(self._source)
+        self.total = len(items)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        writer_type: Callable[[Path, str], _Writer] = (
+            _ParquetWriter if self.format == "parquet" else _NdjsonWriter
+        )
+        writer = await asyncio.to_thread(writer_type, tmp, self.format)
+        complete = False
+        try:
+            with TELEMETRY.timer("export.run"):
+                for start in range(0, self.total, self.chunk_size):
+                    chunk = items[start:start + self.chunk_size]
+                    job = asyncio.ensure_future(
+                        asyncio.to_thread(self._write, writer, chunk)
+                    )
+                    try:
+                        await asyncio.shield(job)
+                    except asyncio.CancelledError:
+                        # The thread still holds the file; let it finish
+                        await job
+                        raise
+                    self.done += len(chunk)
+            complete = True
+        finally:
+            await asyncio.to_thread(writer.close)
+            if complete:
+                os.replace(tmp, self.path)
+            else:
+                tmp.unlink(missing_ok=True)
+        TELEMETRY.counter("export.events").inc(self.written)
+        logger.info(
+            "Exported %d audit events to %s", self.written, self.path
+        )
+        return self.path
+
+    def _write(self, writer: _Writer, chunk: List[Item]) -> None:
+        match = self.match
+        records = [
+            materialize(item)
+            for item in chunk
+            if match is None or match(item)
+        ]
+        if records:
+            writer.write(records)
+        self.written += len(records)
@@ -0,0 +1,94 @@
+"""Secret redaction, applied to responses and to payloads on access."""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Collection, Dict, List, Mapping
+
+DENYLIST = {
+    "authorization", "token", "secret", "password", "private_key",
+    "api_key", "cookie", "set-cookie", "session", "ciphertext",
+    "header_b64u", "ciphertext_b64u", "nonce", "x-talos-token", "x-capability"
+}
+
+PEM_PATTERN = re.compile(
+    r"-----BEGIN [A-Z ]+-----(.*?)-----END [A-Z ]+-----", re.DOTALL
+)
+JWT_PATTERN = re.compile(
+    r"eyJ[a-zA-Z0-9-_]+\.eyJ[a-zA-Z0-9-_]+\.[a-zA-Z0-9-_]+"
+)
+
+
+def redact_dict(
+    data: Dict[str, Any], keep: Collection[str] = ()
+) -> Dict[str, Any]:
+    """
+    Redact sensitive keys in a dictionary recursively. Top-level keys in
+    `keep` are passed through untouched (redacted later, on access).
+    """
+
+    new_data = {}
+    for k, v in data.items():
+        if k in keep:
+            new_data[k] = v
+        elif k.lower() in DENYLIST:
+            new_data[k] = "***REDACTED***"
+        else:
+            new_data[k] = redact_value(v)
+    return new_data
+
+
+def redact_value(v: Any) -> Any:
+    """Redact a single value based on type and content patterns."""
+
+    if isinstance(v, dict):
+        return redact_dict(v)
+    elif isinstance(v, list):
+        return [redact_value(i) for i in v]
+    elif isinstance(v, str):
+        if PEM_PATTERN.search(v):
+            return "***PEM REDACTED***"
+        if len(v) > 100 and JWT_PATTERN.match(v):  # Heuristic for JWT
+            return "***JWT REDACTED***"
+        if len(v) > 65536:  # Cap large fields
+            return v[:64] + "...(TRUNCATED)"
+    return v
+
+
+def load_payload(raw: str) -> Any:
+    """Parse and redact a raw audit payload (see `AuditEvent.payload_raw`)."""
+    if not raw:
+        return {}
+    return redact_value(json.loads(raw))
+
+
+def redact_payload_raw(raw: str) -> str:
+    """The raw payload with its secrets redacted, still as compact JSON."""
+    if not raw:
+        return raw
+    return json.dumps(load_payload(raw), separators=(",", ":"))
+
+
+def redact_audit_items(
+    items: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Audit items safe to leave the process (snapshots, sinks, the hub)."""
+    return [
+        {
+            **item,
+            "payload_raw": redact_payload_raw(item["payload_raw"]),
+            # Picked out of the payload, so redacted with it
+            "peer": redact_value(item.get("peer", "")),
+        }
+        if item.get("payload_raw") else item
+        for item in items
+    ]
+
+
+def audit_payload(item: Mapping[str, Any]) -> Any:
+    """The redacted payload of a stored audit item, parsed on demand."""
+    raw = item.get("payload_raw")
+    if raw is not None:
+        return load_payload(raw)
+    # Items captured before payloads were kept raw
+    return redact_value(item.get("payload") or {})
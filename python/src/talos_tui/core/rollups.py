@@ -0,0 +1,166 @@
+"""Incremental audit rollups: event counts over tumbling time windows."""
+from __future__ import annotations
+
+import time
+from array import array
+from collections import Counter
+from typing import (
+    Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+)
+
+from ..domain.models import payload_peer
+from ..domain.timestamps import NS, parse_ts
+from .redaction import redact_value
+
+Series = Tuple[str, str]  # (schema_id, outcome)
+
+OK = "OK"
+
+
+def failing_peer(item: Mapping[str, Any]) -> Optional[str]:
+    """
+    The peer an audit item is about: its `peer`, picked out when the
+    model was built, else from a parsed `payload`. `payload_raw` is
+    never parsed here.
+    """
+    peer = item.get("peer")
+    if peer is None:
+        payload = item.get("payload")
+        peer = payload_peer(payload) if isinstance(payload, dict) else ""
+    return str(redact_value(peer)) if peer else None
+
+
+class AuditRollups:
+    """
+    Audit event counts by event time, maintained as events are ingested:
+    - Time is cut into tumbling windows of `window` seconds; the newest
+      `windows` of them are kept, in ring slots of fixed-size arrays,
+      one array per (schema_id, outcome).
+    - Each event costs O(1): one counter bump (plus, for a failure, one
+      for its `peer`; the payload itself is not parsed). Moving into a
+      new window clears the slot it reuses, once per window rather than
+      per event.
+    - Events older than the oldest window kept, or more than a window
+      ahead of `clock` (a skewed clock or a bad timestamp, which would
+      otherwise recycle every window), are counted as `dropped`.
+    Reads are over at most `windows` slots, never over the events. They
+    first roll over to `clock`'s window, so the counts of a quiet period
+    drop to zero rather than the last busy window staying newest.
+    """
+
+    def __init__(
+        self,
+        window: float = 60.0,
+        windows: int = 60,
+        clock: Callable[[], int] = time.time_ns,
+    ):
+        if window <= 0 or windows <= 0:
+            raise ValueError("window and windows must be positive")
+        self.window = window
+        self.windows = windows
+        self._width = max(1, int(window * NS))
+        self.clock = clock
+        self._series: Dict[Series, array[int]] = {}
+        self._peers: List[Counter[str]] = [Counter() for _ in range(windows)]
+        self.peer_failures: Counter[str] = Counter()
+        self.head = -1  # index of the newest window (ts_ns // width)
+        self.counted = 0
+        self.dropped = 0
+
+    def add(self, items: Iterable[Mapping[str, Any]]) -> None:
+        """Count ingested audit items (dicts as stored)."""
+        newest = self.clock() // self._width + 1
+        for item in items:
+            ts_ns = item.get("ts_ns")
+            if ts_ns is None:
+                ts_ns = parse_ts(item.get("ts"))
+            index = int(ts_ns) // self._width
+            if index > newest:
+                self.dropped += 1
+                continue
+            if index > self.head:
+                self._advance(index)
+            elif index <= self.head - self.windows:
+                self.dropped += 1
+                continue
+            slot = index % self.windows
+            outcome = item.get("outcome") or OK
+            key = (
+                item.get("event_type") or item.get("schema_id") or "?",
+                outcome,
+            )
+            counts = self._series.get(key)
+            if counts is None:
+                counts = self._series[key] = array("L", [0]) * self.windows
+            counts[slot] += 1
+            self.counted += 1
+            if outcome != OK:
+                peer = failing_peer(item)
+                if peer is not None:
+                    self._peers[slot][peer] += 1
+                    self.peer_failures[peer] += 1
+
+    def _advance(self, index: int) -> None:
+        """Make `index` the newest window, clearing the slots it reuses."""
+        for old in range(max(self.head + 1, index - self.windows + 1),
+                         index + 1):
+            slot = old % self.windows
+            for counts in self._series.values():
+                counts[slot] = 0
+            peers = self._peers[slot]
+            for peer, count in peers.items():
+                left = self.peer_failures[peer] - count
+                if left:
+                    self.peer_failures[peer] = left
+                else:
+                    del self.peer_failures[peer]
+            peers.clear()
+        self.head = index
+
+    def _catch_up(self) -> None:
+        """Advance to the current window if no event has done so."""
+        index = self.clock() // self._width
+        if 0 <= self.head < index:
+            self._advance(index)
+
+    def starts(self) -> List[int]:
+        """Start time (epoch-ns) of each window kept, oldest first."""
+        self._catch_up()
+        first = self.head - self.windows + 1
+        return [(first + i) * self._width for i in range(self.windows)]
+
+    def by_series(self) -> Dict[Series, List[int]]:
+        """Counts per window, oldest first, of each series."""
+        self._catch_up()
+        # The slot after the newest window's holds the oldest
+        shift = (self.head + 1) % self.windows
+        return {
+            key: counts[shift:].tolist() + counts[:shift].tolist()
+            for key, counts in sorted(self._series.items())
+        }
+
+    def series(
+        self,
+        schema_id: Optional[str] = None,
+        outcome: Optional[str] = None,
+    ) -> List[int]:
+        """Counts per window, oldest first, summed over matching series."""
+        totals = [0] * self.windows
+        for (schema, out), counts in self.by_series().items():
+            if schema_id in (None, schema) and outcome in (None, out):
+                totals = [a + b for a, b in zip(totals, counts, strict=True)]
+        return totals
+
+    def totals(self) -> Dict[Series, int]:
+        """Event count per (schema_id, outcome) over the windows kept."""
+        self._catch_up()
+        return {
+            key: total
+            for key, counts in sorted(self._series.items())
+            if (total := sum(counts))
+        }
+
+    def top_peers(self, n: int = 5) -> List[Tuple[str, int]]:
+        """The `n` peers with the most failures over the windows kept."""
+        self._catch_up()
+        return self.peer_failures.most_common(n)
@@ -0,0 +1,128 @@
+"""Compact on-disk StateStore snapshots for fast warm starts."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import mmap
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .state import StateStore
+from .telemetry import TELEMETRY
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"TALOS-TUI-SNAPSHOT 1\n"
+
+
+def write_snapshot(path: Path, data: Dict[str, Any]) -> int:
+    """
+    Atomically write a snapshot (magic line + compact JSON), readable by
+    the owner only; returns the size in bytes. Safe to call from a
+    worker thread.
+    """
+    body = SNAPSHOT_MAGIC + json.dumps(
+        data, separators=(",", ":"), default=str
+    ).encode()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    # Created 0o600 whatever the umask: snapshots hold audit events.
+    # A leftover temp file is removed first, as O_CREAT keeps its mode.
+    tmp.unlink(missing_ok=True)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(body)
+    os.replace(tmp, path)
+    return len(body)
+
+
+def read_snapshot(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Memory-map and decode a snapshot; None if missing or unreadable.
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            if mm[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+                logger.warning("Ignoring %s: not a state snapshot", path)
+                return None
+            data: Dict[str, Any] = json.loads(mm[len(SNAPSHOT_MAGIC):])
+            return data
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable snapshot %s: %s", path, e)
+        return None
+
+
+def warm_start(
+    store: StateStore, path: Path, max_age: float = 24 * 3600
+) -> bool:
+    """
+    Restore the last-known state from `path`, marked stale via
+    `store.restored_at`. The lifecycle is not restored: the coordinator
+    still starts from BOOT and handshakes as usual.
+    """
+    with TELEMETRY.timer("snapshot.load"):
+        data = read_snapshot(path)
+    if data is None:
+        return False
+    saved_at = data.get("saved_at", 0.0)
+    if time.time() - saved_at > max_age:
+        logger.info("Snapshot %s is too old; starting cold", path)
+        return False
+    try:
+        store.restore({**data, "lifecycle": store.lifecycle})
+    except (KeyError, TypeError) as e:
+        logger.warning("Ignoring incompatible snapshot %s: %s", path, e)
+        return False
+    store.is_fatal = False
+    store.global_error = None
+    store.restored_at = saved_at
+    logger.info(
+        "Warm start from %s (%d audit events, %.0fs old)",
+        path, len(store.audit_events), time.time() - saved_at,
+    )
+    return True
+
+
+class SnapshotWriter:
+    """
+    Periodically saves a compact snapshot: versions, health, metrics
+    history, cursor and the newest `audit_limit` audit events.
+    The snapshot is taken on the loop; encoding and I/O run in a thread.
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        path: Path,
+        interval: float = 30.0,
+        audit_limit: int = 200,
+    ):
+        self.store = store
+        self.path = path
+        self.interval = interval
+        self.audit_limit = audit_limit
+
+    async def save(self) -> None:
+        """Write one snapshot now."""
+        data = self.store.snapshot(self.audit_limit)
+        data["saved_at"] = time.time()
+        try:
+            size = await asyncio.to_thread(write_snapshot, self.path, data)
+        except OSError as e:
+            logger.warning("Could not save snapshot to %s: %s", self.path, e)
+            return
+        TELEMETRY.counter("snapshot.saves").inc()
+        logger.debug("Saved %d byte snapshot to %s", size, self.path)
+
+    async def run(self) -> None:
+        """Save every `interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.save()
@@ -1,18 +1,34 @@
 """TUI State Management."""
 from __future__ import annotations
+import logging
 import time
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from dataclasses import asdict, dataclass, field, fields
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+)
 
+from .auditlog import AuditLog
+from .redaction import redact_audit_items
+from .rollups import AuditRollups
+from .telemetry import TELEMETRY
 
-@dataclass(frozen=True, kw_only=True)
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TuiEvent:
     """Base class for all TUI state change events"""
 
     timestamp: float = field(default_factory=time.time)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-data form for NDJSON streams: `{"type": <event>, ...}`."""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["type"] = type(self).__name__
+        return data
 
-@dataclass(frozen=True, kw_only=True)
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class HealthUpdated(TuiEvent):
     """Event for health status updates."""
 
@@ -21,7 +37,7 @@ class HealthUpdated(TuiEvent):
     status_msg: str = ""
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VersionUpdated(TuiEvent):
     """Event for version updates."""
 
@@ -30,22 +46,28 @@ class VersionUpdated(TuiEvent):
     contracts_version: str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MetricsUpdated(TuiEvent):
     """Event for metrics updates."""
 
     metrics: Dict[str, Any]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AuditEventsReceived(TuiEvent):
     """Event for received audit logs."""
 
     items: List[Dict[str, Any]]
     next_cursor: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-data form with the raw payloads redacted."""
+        data = TuiEvent.to_dict(self)
+        data["items"] = redact_audit_items(self.items)
+        return data
+
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorOccurred(TuiEvent):
     """Event for errors."""
 
@@ -55,6 +77,53 @@ class ErrorOccurred(TuiEvent):
     is_fatal: bool = False
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class LifecycleChanged(TuiEvent):
+    """Event for coordinator state machine transitions."""
+
+    previous: str
+    state: str
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CircuitChanged(TuiEvent):
+    """Event for adapter circuit breaker transitions."""
+
+    source: str
+    endpoint: str
+    state: str  # "CLOSED", "OPEN" or "HALF_OPEN"
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ValidationStatsUpdated(TuiEvent):
+    """Event for audit contract validation counters."""
+
+    stats: Dict[str, Any]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class EventBatch(TuiEvent):
+    """A burst of events applied together (see `StateStore.reduce_many`)."""
+
+    events: Tuple[TuiEvent, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-data form with the batched events nested."""
+        return {
+            "type": "EventBatch",
+            "timestamp": self.timestamp,
+            "events": [e.to_dict() for e in self.events],
+        }
+
+
+def iter_events(event: TuiEvent) -> Iterator[TuiEvent]:
+    """Yield `event`, or each event of an EventBatch."""
+    if isinstance(event, EventBatch):
+        yield from event.events
+    else:
+        yield event
+
+
 @dataclass(kw_only=True)
 class SourceState:
     """State of a single data source."""
@@ -65,6 +134,52 @@ class SourceState:
     contracts_version: Optional[str] = None
     last_updated_at: float = 0
     error: Optional[str] = None
+    circuits: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def circuit_state(self) -> str:
+        """Worst circuit state across the source's endpoints."""
+        states = self.circuits.values()
+        if "OPEN" in states:
+            return "OPEN"
+        if "HALF_OPEN" in states:
+            return "HALF_OPEN"
+        return "CLOSED"
+
+
+EVENT_TYPES: Dict[str, Type[TuiEvent]] = {
+    cls.__name__: cls
+    for cls in (
+        HealthUpdated,
+        VersionUpdated,
+        MetricsUpdated,
+        AuditEventsReceived,
+        ErrorOccurred,
+        LifecycleChanged,
+        CircuitChanged,
+        ValidationStatsUpdated,
+        EventBatch,
+    )
+}
+
+
+def event_from_dict(data: Dict[str, Any]) -> TuiEvent:
+    """Inverse of `TuiEvent.to_dict`."""
+    fields_ = dict(data)
+    cls = EVENT_TYPES.get(fields_.pop("type", ""))
+    if cls is None:
+        raise ValueError(f"Unknown event type: {data.get('type')!r}")
+    if cls is EventBatch:
+        fields_["events"] = tuple(
+            event_from_dict(e) for e in fields_["events"]
+        )
+    return cls(**fields_)
+
+
+StoreListener = Callable[[TuiEvent], None]
+
+METRICS_HISTORY = 120
+MAX_AUDIT_EVENTS = 1000
 
 
 @dataclass(kw_only=True)
@@ -76,56 +191,184 @@ class StateStore:
     gateway: SourceState = field(default_factory=SourceState)
     audit: SourceState = field(default_factory=SourceState)
     metrics: Dict[str, Any] = field(default_factory=dict)
-    audit_events: List[Dict[str, Any]] = field(default_factory=list)
+    # Newest first by event time (see AuditLog)
+    audit_events: AuditLog = field(default_factory=AuditLog)
     audit_cursor: Optional[str] = None
+    # Counts over every event ingested, not just those still held
+    audit_rollups: AuditRollups = field(default_factory=AuditRollups)
 
-    _seen_audit_ids: Set[str] = field(default_factory=set)
     global_error: Optional[str] = None
     is_fatal: bool = False
+    lifecycle: str = "BOOT"
+    metrics_history: List[Dict[str, Any]] = field(default_factory=list)
+    # Audit contract validation counters (ValidationPolicy.stats)
+    validation: Dict[str, Any] = field(default_factory=dict)
+    # Set while showing a warm-start snapshot, until fresh metrics arrive
+    restored_at: Optional[float] = None
+
+    # Retention limits (TuiConfig.audit_ring_size / metrics_history)
+    max_audit_events: int = field(
+        default=MAX_AUDIT_EVENTS, repr=False, compare=False
+    )
+    max_metrics_history: int = field(
+        default=METRICS_HISTORY, repr=False, compare=False
+    )
+
+    _listeners: List[StoreListener] = field(
+        default_factory=list, repr=False, compare=False
+    )
+
+    def subscribe(self, listener: StoreListener) -> Callable[[], None]:
+        """
+        Register a change listener, called after every reduced event.
+        Returns a callable that removes the listener again.
+        """
+        self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return unsubscribe
+
+    def snapshot(self, audit_limit: Optional[int] = 50) -> Dict[str, Any]:
+        """
+        Plain-data view of the state with the newest `audit_limit` audit
+        events (all of them when None).
+        """
+        return {
+            "lifecycle": self.lifecycle,
+            "is_fatal": self.is_fatal,
+            "global_error": self.global_error,
+            "gateway": asdict(self.gateway),
+            "audit": asdict(self.audit),
+            "metrics": dict(self.metrics),
+            "metrics_history": list(self.metrics_history),
+            "audit_cursor": self.audit_cursor,
+            "audit_event_count": len(self.audit_events),
+            "audit_events": redact_audit_items(
+                self.audit_events[:audit_limit]
+            ),
+            "restored_at": self.restored_at,
+            "validation": dict(self.validation),
+        }
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Replace the state with a `snapshot()`; listeners are not notified.
+        """
+        self.lifecycle = snapshot["lifecycle"]
+        self.is_fatal = snapshot["is_fatal"]
+        self.global_error = snapshot["global_error"]
+        self.gateway = SourceState(**snapshot["gateway"])
+        self.audit = SourceState(**snapshot["audit"])
+        self.metrics = dict(snapshot["metrics"])
+        self.metrics_history = list(snapshot.get("metrics_history", ()))
+        self.audit_cursor = snapshot["audit_cursor"]
+        self.audit_events = AuditLog(snapshot["audit_events"])
+        rollups = self.audit_rollups
+        self.audit_rollups = AuditRollups(
+            rollups.window, rollups.windows, rollups.clock
+        )
+        self.audit_rollups.add(self.audit_events)
+        self.restored_at = snapshot.get("restored_at")
+        self.validation = dict(snapshot.get("validation", {}))
+
+    def has_audit_event(self, event_id: str) -> bool:
+        """Whether an audit event id is held."""
+        return self.audit_events.has(event_id)
 
     def reduce(self, event: TuiEvent) -> None:
-        """Apply a pure event to the state"""
-        if isinstance(event, HealthUpdated):
-            source = getattr(self, event.source)
-            source.health_ok = event.is_ok
-            source.status_msg = event.status_msg
-            source.last_updated_at = event.timestamp
-            if event.is_ok:
-                source.error = None
-
-        elif isinstance(event, VersionUpdated):
-            source = getattr(self, event.source)
-            source.version = event.version
-            source.contracts_version = event.contracts_version
-            source.last_updated_at = event.timestamp
-
-        elif isinstance(event, MetricsUpdated):
-            self.metrics = event.metrics
-            self.gateway.last_updated_at = event.timestamp
-
-        elif isinstance(event, AuditEventsReceived):
-            # deduplicate and append
-            new_items = []
-            for item in event.items:
-                eid = item.get("event_id") or item.get("id")
-                if eid and eid not in self._seen_audit_ids:
-                    new_items.append(item)
-                    self._seen_audit_ids.add(eid)
-                    new_items.append(item)
-                    self._seen_audit_ids.add(eid)
-
-            # Keep only last 1000 items in memory
-            self.audit_events = (new_items + self.audit_events)[:1000]
-            self.audit_cursor = event.next_cursor
-            self.audit.last_updated_at = event.timestamp
-
-        elif isinstance(event, ErrorOccurred):
-            source = getattr(self, event.source)
-            source.error = event.message
-            source.last_updated_at = event.timestamp
-            if event.is_fatal:
-                self.global_error = f"FATAL [{event.source}]: {event.message}"
-                self.is_fatal = True
+        """Apply a pure event to the state and notify listeners"""
+        start = time.perf_counter_ns()
+        reducer, metric = _dispatch(type(event))
+        reducer(self, event)
+        TELEMETRY.observe(metric, (time.perf_counter_ns() - start) / 1e6)
+        for listener in tuple(self._listeners):
+            try:
+                listener(event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("State listener failed")
+
+    def reduce_many(self, events: Iterable[TuiEvent]) -> None:
+        """
+        Apply a burst of events in order with a single change
+        notification: listeners receive one EventBatch (or the event
+        itself for a burst of one).
+        """
+        batch = tuple(events)
+        if batch:
+            self.reduce(batch[0] if len(batch) == 1 else EventBatch(
+                events=batch
+            ))
+
+    def _reduce_batch(self, event: EventBatch) -> None:
+        # The audit ring is trimmed once for the whole batch
+        audit = False
+        for inner in event.events:
+            if type(inner) is AuditEventsReceived:
+                self.audit_rollups.add(self.audit_events.add(inner.items))
+                self.audit_cursor = inner.next_cursor
+                self.audit.last_updated_at = inner.timestamp
+                audit = True
+            else:
+                _dispatch(type(inner))[0](self, inner)
+        if audit:
+            self.audit_events.trim(self.max_audit_events)
+
+    def _reduce_health(self, event: HealthUpdated) -> None:
+        source = getattr(self, event.source)
+        source.health_ok = event.is_ok
+        source.status_msg = event.status_msg
+        source.last_updated_at = event.timestamp
+        if event.is_ok:
+            source.error = None
+
+    def _reduce_version(self, event: VersionUpdated) -> None:
+        source = getattr(self, event.source)
+        source.version = event.version
+        source.contracts_version = event.contracts_version
+        source.last_updated_at = event.timestamp
+
+    def _reduce_metrics(self, event: MetricsUpdated) -> None:
+        self.metrics = event.metrics
+        self.gateway.last_updated_at = event.timestamp
+        self.metrics_history.append({"ts": event.timestamp, **event.metrics})
+        del self.metrics_history[:-self.max_metrics_history]
+        self.restored_at = None
+
+    def _reduce_audit(self, event: AuditEventsReceived) -> None:
+        # Placed by event time, so late and out-of-order arrivals (or a
+        # merge of sources) land where they belong
+        added = self.audit_events.add(event.items)
+        if added:
+            self.audit_rollups.add(added)
+            self.audit_events.trim(self.max_audit_events)
+        self.audit_cursor = event.next_cursor
+        self.audit.last_updated_at = event.timestamp
+
+    def _reduce_circuit(self, event: CircuitChanged) -> None:
+        source = getattr(self, event.source)
+        if event.state == "CLOSED":
+            source.circuits.pop(event.endpoint, None)
+        else:
+            source.circuits[event.endpoint] = event.state
+
+    def _reduce_validation(self, event: ValidationStatsUpdated) -> None:
+        self.validation = event.stats
+
+    def _reduce_lifecycle(self, event: LifecycleChanged) -> None:
+        self.lifecycle = event.state
+        if event.state == "FATAL":
+            self.is_fatal = True
+
+    def _reduce_error(self, event: ErrorOccurred) -> None:
+        source = getattr(self, event.source)
+        source.error = event.message
+        source.last_updated_at = event.timestamp
+        if event.is_fatal:
+            self.global_error = f"FATAL [{event.source}]: {event.message}"
+            self.is_fatal = True
 
     def get_stale_since(self, source: str) -> float:
         """Returns how many seconds since the last update for a source"""
@@ -133,3 +376,40 @@ class StateStore:
         if s.last_updated_at == 0:
             return float('inf')
         return float(time.time() - s.last_updated_at)
+
+
+Reducer = Callable[[StateStore, Any], None]
+
+# Event type -> reducer; subclasses resolve through their MRO (see _dispatch)
+_REDUCERS: Dict[Type[TuiEvent], Reducer] = {
+    HealthUpdated: StateStore._reduce_health,
+    VersionUpdated: StateStore._reduce_version,
+    MetricsUpdated: StateStore._reduce_metrics,
+    AuditEventsReceived: StateStore._reduce_audit,
+    CircuitChanged: StateStore._reduce_circuit,
+    ValidationStatsUpdated: StateStore._reduce_validation,
+    LifecycleChanged: StateStore._reduce_lifecycle,
+    ErrorOccurred: StateStore._reduce_error,
+    EventBatch: StateStore._reduce_batch,
+}
+
+_DISPATCH: Dict[type, Tuple[Reducer, str]] = {}
+
+
+def _ignore(_store: StateStore, _event: Any) -> None:
+    """Reducer for event types that carry no state."""
+
+
+def _dispatch(event_type: type) -> Tuple[Reducer, str]:
+    """The reducer and telemetry name for an event type (cached)."""
+    try:
+        return _DISPATCH[event_type]
+    except KeyError:
+        pass
+    reducer = next(
+        (_REDUCERS[t] for t in event_type.__mro__ if t in _REDUCERS),
+        _ignore,
+    )
+    entry = (reducer, f"store.reduce[{event_type.__name__}]")
+    _DISPATCH[event_type] = entry
+    return entry
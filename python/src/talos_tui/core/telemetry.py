@@ -0,0 +1,150 @@
+"""Low-overhead in-process counters and latency histograms."""
+from __future__ import annotations
+
+import json
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, Tuple
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is open.
+BUCKET_BOUNDS_MS: Tuple[float, ...] = (
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250,
+    500, 1000, 2500, 5000, 10000,
+)
+
+
+class Counter:
+    """Monotonic counter."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self, n: int = 1) -> None:
+        """Increment the counter."""
+        self.value += n
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram in milliseconds.
+    Observing is a bisect plus three additions; percentiles are
+    estimated from bucket upper bounds.
+    """
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        """Record one sample."""
+        self.buckets[bisect_left(BUCKET_BOUNDS_MS, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def percentile(self, q: float) -> float:
+        """Estimate the q-th percentile (0-100) in ms."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                if i < len(BUCKET_BOUNDS_MS):
+                    return min(BUCKET_BOUNDS_MS[i], self.max)
+                return self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, float]:
+        """Summary statistics for display and export."""
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max,
+        }
+
+
+class Telemetry:
+    """Registry of named counters, histograms and recent notable events."""
+
+    def __init__(self, max_events: int = 50) -> None:
+        self.counters: Dict[str, Counter] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self.started_at = time.time()
+
+    def counter(self, name: str) -> Counter:
+        """Get or create a counter."""
+        c = self.counters.get(name)
+        if c is None:
+            c = self.counters[name] = Counter()
+        return c
+
+    def histogram(self, name: str) -> Histogram:
+        """Get or create a histogram."""
+        h = self.histograms.get(name)
+        if h is None:
+            h = self.histograms[name] = Histogram()
+        return h
+
+    def observe(self, name: str, value_ms: float) -> None:
+        """Record a sample on the named histogram."""
+        self.histogram(name).observe(value_ms)
+
+    def record_event(self, kind: str, detail: Dict[str, Any]) -> None:
+        """Keep a notable event (e.g. a loop stall) for display and export."""
+        self.events.append({"ts": time.time(), "kind": kind, **detail})
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Time the enclosed block into the named histogram."""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.histogram(name).observe(
+                (time.perf_counter_ns() - start) / 1e6
+            )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All metrics as plain data."""
+        return {
+            "uptime_s": time.time() - self.started_at,
+            "counters": {
+                k: c.value for k, c in sorted(self.counters.items())
+            },
+            "histograms": {
+                k: h.snapshot() for k, h in sorted(self.histograms.items())
+            },
+            "events": list(self.events),
+        }
+
+    def dump_json(self, path: Path) -> Path:
+        """Write a snapshot as JSON for offline analysis."""
+        path.write_text(json.dumps(self.snapshot(), indent=2), "utf-8")
+        return path
+
+    def reset(self) -> None:
+        """Drop all metrics."""
+        self.counters.clear()
+        self.histograms.clear()
+        self.events.clear()
+        self.started_at = time.time()
+
+
+# Process-wide registry used by the adapters, the store and the UI.
+TELEMETRY = Telemetry()
@@ -0,0 +1,241 @@
+"""Timestamp index and time-travel over retained audit history."""
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import chain
+from typing import (
+    Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set
+)
+
+from ..domain.timestamps import parse_ts
+from .auditlog import AuditLog
+from .details import event_id_of
+from .state import StateStore
+from .telemetry import TELEMETRY
+
+logger = logging.getLogger(__name__)
+
+Item = Dict[str, Any]
+ListEvents = Callable[[int, Optional[str]], Awaitable[Any]]
+
+
+def ts_key(item: Item) -> int:
+    """The sort key of a stored audit item: its time in epoch-ns."""
+    ts_ns = item.get("ts_ns")
+    return int(ts_ns) if ts_ns is not None else parse_ts(item.get("ts"))
+
+
+def _seek(items: List[Item], ts_ns: int) -> int:
+    """Index of the first item at or before `ts_ns` in a newest-first list."""
+    return bisect_left(items, -ts_ns, key=lambda item: -ts_key(item))
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """Events around a point in time, newest first."""
+
+    at: int  # the requested time, epoch-ns
+    items: List[Item]
+    anchor: int  # index in `items` of the first event at or before `at`
+    complete: bool  # False if older history could not be loaded
+
+
+class AuditHistory:
+    """
+    Time-travel view over the store's audit ring plus older history:
+    - The ring (`store.audit_events`) and the older events are both kept
+      newest first, so seeking to a time is a binary search over them,
+      O(log n) timestamp comparisons.
+    - Older events are loaded lazily, page by page, when a window
+      reaches past the oldest event held; at most `max_items` are kept.
+    - Only cursors the service issued are passed as `before`: paging
+      starts from the store's `audit_cursor` (the one issued with the
+      latest poll), skipping the events the ring holds, then follows
+      each page's `next_cursor`. History ends where none is issued.
+    - When the ring trims events newer than the loaded history, the gap
+      is bridged on the next seek, paging down from the poll cursor
+      again; loaded history it cannot reach is dropped and reloaded on
+      demand.
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        list_events: Optional[ListEvents] = None,
+        page_size: int = 50,
+        max_items: int = 10_000,
+        max_pages: int = 20,
+    ):
+        self.store = store
+        self.list_events = list_events
+        self.page_size = page_size
+        self.max_items = max_items
+        self.max_pages = max_pages
+        self.older: List[Item] = []
+        self._older_ids: Set[str] = set()
+        # The ring event `older` continues from
+        self._joined_to: Optional[str] = None
+        self._cursor: Optional[str] = None
+        self._paging = False  # whether `_cursor` continues `older`
+        self.exhausted = False
+        self.pages_loaded = 0
+
+    def __len__(self) -> int:
+        return len(self.store.audit_events) + len(self.older)
+
+    def held(self) -> Iterator[Item]:
+        """Every event held, newest first: the ring, then older ones."""
+        return chain(self.store.audit_events, self.older)
+
+    def _slice(self, start: int, stop: int) -> List[Item]:
+        live = self.store.audit_events
+        return live[start:stop] + self.older[
+            max(0, start - len(live)):max(0, stop - len(live))
+        ]
+
+    def index_at(self, ts_ns: int) -> int:
+        """Index of the first held event at or before `ts_ns`."""
+        live = self.store.audit_events
+        if live and ts_key(live[-1]) <= ts_ns:
+            if isinstance(live, AuditLog):
+                return live.index_at(ts_ns)
+            return _seek(live, ts_ns)
+        return len(live) + _seek(self.older, ts_ns)
+
+    def window(self, ts_ns: int, radius: int = 25) -> TimeWindow:
+        """The held events around `ts_ns`, without loading any."""
+        anchor = self.index_at(ts_ns)
+        start = max(0, anchor - radius)
+        return TimeWindow(
+            at=ts_ns,
+            items=self._slice(start, anchor + radius),
+            anchor=anchor - start,
+            complete=self.exhausted or anchor + radius <= len(self),
+        )
+
+    async def seek(self, ts_ns: int, radius: int = 25) -> TimeWindow:
+        """
+        The events around `ts_ns`, first loading older pages (at most
+        `max_pages`) until `radius` events at or before it are held or
+        history runs out.
+        """
+        with TELEMETRY.timer("timeline.seek"):
+            if self.list_events is not None:
+                await self._bridge()
+                for _ in range(self.max_pages):
+                    if (
+                        self.exhausted
+                        or self.index_at(ts_ns) + radius <= len(self)
+                        or len(self.older) >= self.max_items
+                    ):
+                        break
+                    await self._load_older()
+            return self.window(ts_ns, radius)
+
+    def _reset(self) -> None:
+        self.older.clear()
+        self._older_ids.clear()
+        self._joined_to = None
+        self._cursor = None
+        self._paging = False
+        self.exhausted = False
+
+    async def _fetch(self, before: Optional[str]) -> List[Item]:
+        """One page older than `before`; sets `_cursor` to the next one."""
+        assert self.list_events is not None
+        page = await self.list_events(self.page_size, before)
+        self.pages_loaded += 1
+        TELEMETRY.counter("timeline.pages").inc()
+        self._cursor = page.next_cursor
+        if not page.has_more or not self._cursor:
+            self.exhausted = True
+        return [item.model_dump() for item in page.items]
+
+    def _held(self, item: Item) -> bool:
+        eid = event_id_of(item)
+        return eid in self._older_ids or self.store.has_audit_event(eid)
+
+    async def _bridge(self) -> None:
+        """Reload the events trimmed from the ring since `older` loaded."""
+        live = self.store.audit_events
+        if not self.older or not live:
+            return
+        tail = event_id_of(live[-1])
+        if tail == self._joined_to:
+            return
+        floor, ceiling = ts_key(self.older[0]), ts_key(live[-1])
+        if ceiling < floor:
+            # The ring reaches into `older`; start over from the ring
+            self._reset()
+            return
+        bridged: List[Item] = []
+        exhausted, cursor = self.exhausted, self._cursor
+        before, joined = self.store.audit_cursor, False
+        for _ in range(self.max_pages):
+            if before is None:
+                break
+            for item in await self._fetch(before):
+                if event_id_of(item) in self._older_ids or (
+                    ts_key(item) < floor
+                ):
+                    joined = True
+                    break
+                if ts_key(item) <= ceiling and not self._held(item):
+                    bridged.append(item)
+            if joined or self.exhausted:
+                break
+            before = self._cursor
+        self.exhausted, self._cursor = exhausted, cursor
+        if not joined:
+            logger.info("Dropping audit history the ring lost touch with")
+            self._reset()
+            return
+        self._add(bridged, front=True)
+        self._joined_to = tail
+        logger.info("Bridged %d trimmed audit events", len(bridged))
+
+    async def _load_older(self) -> None:
+        """Load the next page older than every event held."""
+        live = self.store.audit_events
+        if not self._paging:
+            self._paging = True
+            self._joined_to = event_id_of(live[-1]) if live else None
+            # With no poll cursor, the ring is all there is (or, empty,
+            # history starts at the head)
+            self._cursor = self.store.audit_cursor
+            if live and self._cursor is None:
+                self.exhausted = True
+                return
+        elif self._cursor is None:
+            self.exhausted = True
+            return
+        oldest = self.older[-1] if self.older else (
+            live[-1] if live else None
+        )
+        floor = ts_key(oldest) if oldest is not None else None
+        items = await self._fetch(self._cursor)
+        # Pages start above the ring's oldest event, and an at-least-once
+        # feed may re-deliver newer events
+        self._add([
+            i for i in items
+            if not self._held(i) and (floor is None or ts_key(i) <= floor)
+        ])
+
+    def _add(self, items: List[Item], front: bool = False) -> None:
+        if front:
+            self.older[:0] = items
+        else:
+            self.older.extend(items)
+        self._older_ids.update(event_id_of(i) for i in items)
+        self._trim()
+
+    def _trim(self) -> None:
+        if len(self.older) > self.max_items:
+            for item in self.older[self.max_items:]:
+                self._older_ids.discard(event_id_of(item))
+            del self.older[self.max_items:]
+            # No cursor was issued for the new oldest event
+            self._cursor = None
+            self.exhausted = False
@@ -0,0 +1,147 @@
+"""Event-loop lag watchdog and sampling profiler."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter as Tally
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+from .telemetry import TELEMETRY, Telemetry
+
+logger = logging.getLogger(__name__)
+
+
+def collapse_stack(frame: Optional[FrameType]) -> str:
+    """Render a frame chain as a collapsed stack (root first, `;`-joined)."""
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+class LoopWatchdog:
+    """
+    Detects event-loop stalls and names the code that caused them.
+    - A heartbeat coroutine on the loop records scheduling lag into
+      `loop.lag` and stamps a heartbeat every `interval`.
+    - A daemon monitor thread notices when the heartbeat stops for longer
+      than `interval + threshold` and captures the loop thread's stack
+      while the offending callback (decode, redaction, refresh_view,
+      reduce...) is still running.
+    - When the loop recovers, the stall is reported to telemetry (the
+      performance overlay) and the log with the captured stack.
+    - With `profile_path`, the monitor thread also samples the loop
+      thread's stack every `sample_interval` and writes collapsed stacks
+      (flamegraph.pl / speedscope format) on stop.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        threshold: float = 0.25,
+        profile_path: Optional[Path] = None,
+        sample_interval: float = 0.005,
+        telemetry: Telemetry = TELEMETRY,
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self.profile_path = profile_path
+        self.sample_interval = sample_interval
+        self.telemetry = telemetry
+        self.samples: Tally[str] = Tally()
+
+        self._beat = time.monotonic()
+        self._beat_seq = 0
+        self._captured_seq = -1
+        self._captured_stack = ""
+        self._loop_thread_id: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the monitor thread; must be called on the loop thread."""
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._monitor, name="talos-loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop monitoring and write the profile, if enabled."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self.profile_path is not None and self.samples:
+            self.write_profile(self.profile_path)
+
+    async def heartbeat(self) -> None:
+        """Loop-side coroutine; run it as a background task."""
+        loop = asyncio.get_running_loop()
+        lag_hist = self.telemetry.histogram("loop.lag")
+        while not self._stop.is_set():
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            lag_hist.observe(lag * 1000)
+            if lag >= self.threshold:
+                self._report_stall(lag)
+            self._beat = time.monotonic()
+            self._beat_seq += 1
+
+    def _report_stall(self, lag: float) -> None:
+        stack = (
+            self._captured_stack
+            if self._captured_seq == self._beat_seq
+            else "<stack not captured>"
+        )
+        self.telemetry.counter("loop.stalls").inc()
+        self.telemetry.observe("loop.stall", lag * 1000)
+        self.telemetry.record_event(
+            "loop.stall", {"duration_ms": round(lag * 1000, 1), "stack": stack}
+        )
+        logger.warning(
+            "Event loop stalled for %.0fms in:\n%s", lag * 1000, stack
+        )
+
+    def _loop_frame(self) -> Optional[FrameType]:
+        if self._loop_thread_id is None:
+            return None
+        return sys._current_frames().get(self._loop_thread_id)
+
+    def _monitor(self) -> None:
+        stall_after = self.interval + self.threshold
+        check = self.sample_interval if self.profile_path else min(
+            0.05, self.threshold / 4
+        )
+        while not self._stop.wait(check):
+            if self.profile_path is not None:
+                self.samples[collapse_stack(self._loop_frame())] += 1
+
+            seq = self._beat_seq
+            if (
+                seq != self._captured_seq
+                and time.monotonic() - self._beat > stall_after
+            ):
+                frame = self._loop_frame()
+                self._captured_stack = (
+                    "".join(traceback.format_stack(frame)) if frame else ""
+                )
+                self._captured_seq = seq
+
+    def write_profile(self, path: Path) -> Path:
+        """Write sampled stacks as `stack count` lines."""
+        lines = [f"{stack} {n}" for stack, n in self.samples.most_common()]
+        path.write_text("\n".join(lines) + "\n", "utf-8")
+        logger.info("Wrote %d collapsed stacks to %s", len(lines), path)
+        return path
@@ -1,8 +1,28 @@
 """Domain models for Talos TUI."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, ConfigDict
+import json
+import sys
+from typing import Any, List, Mapping, Optional
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+
+from .timestamps import parse_ts
+
+
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"))
+# Few distinct values, repeated on every event
+_INTERNED = ("schema_id", "event_type", "outcome")
+# Payload fields naming the peer an event is about, first match wins
+PEER_FIELDS = ("peer_id", "actor")
+
+
+def payload_peer(payload: Mapping[str, Any]) -> str:
+    """The peer named in a parsed audit payload, or ""."""
+    for name in PEER_FIELDS:
+        peer = payload.get(name)
+        if isinstance(peer, str) and peer:
+            return peer
+    return ""
 
 
 class ViewModel(BaseModel):
@@ -61,14 +81,47 @@ class Session(ViewModel):
 
 
 class AuditEvent(ViewModel):
-    """Audit event model."""
+    """
+    Audit event model. Only the summary fields are materialized, once, at
+    ingest: `ts` is parsed to the integer sort key `ts_ns` (epoch-ns) and
+    the low-cardinality strings are interned. The payload is kept as
+    compact, unredacted JSON in `payload_raw` and only parsed (and
+    redacted) when an event is inspected; the peer it names is picked
+    out as `peer` on the way, for analytics.
+    """
 
     id: str = Field(alias="event_id")
 
     ts: str
+    ts_ns: int = 0
     event_type: str = Field(alias="schema_id")
     outcome: str = "OK"
-    payload: Dict[str, Any] = Field(default_factory=dict)
+    payload_raw: str = ""
+    peer: str = ""
+
+    @model_validator(mode="before")
+    @classmethod
+    def _ingest(cls, data: Any) -> Any:
+        """Derive the sort key, intern labels and keep the payload raw."""
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+        data["ts_ns"] = parse_ts(data.get("ts"))
+        for name in _INTERNED:
+            value = data.get(name)
+            if type(value) is str:
+                data[name] = sys.intern(value)
+        if "payload" in data:
+            payload = data.pop("payload")
+            if not isinstance(payload, dict):
+                raise ValueError("payload must be an object")
+            if "payload_raw" not in data:
+                # "" is kept for summaries, which carry no payload at all
+                data["payload_raw"] = (
+                    _COMPACT_JSON.encode(payload) if payload else "{}"
+                )
+            data.setdefault("peer", payload_peer(payload))
+        return data
 
 
 class AuditPage(ViewModel):
@@ -0,0 +1,47 @@
+"""Audit timestamps: ISO 8601 strings and integer epoch-ns keys."""
+from __future__ import annotations
+
+import calendar
+import re
+import time
+from typing import Any
+
+NS = 1_000_000_000
+
+_TS_PATTERN = re.compile(
+    r"(\d{4})-(\d\d)-(\d\d)[T ](\d\d):(\d\d):(\d\d)"
+    r"(?:[.,](\d{1,9}))?\d*"
+    r"(Z|[+-]\d\d:?\d\d)?$",
+    re.IGNORECASE,
+)
+
+
+def parse_ts(ts: Any) -> int:
+    """
+    An ISO 8601 timestamp as integer nanoseconds since the epoch (UTC if
+    it has no offset); 0, which sorts oldest, if it cannot be parsed.
+    """
+    m = _TS_PATTERN.match(ts) if isinstance(ts, str) else None
+    if m is None:
+        return 0
+    year, month, day, hour, minute, second, frac, zone = m.groups()
+    try:
+        seconds = calendar.timegm((
+            int(year), int(month), int(day),
+            int(hour), int(minute), int(second),
+        ))
+    except (ValueError, OverflowError):
+        return 0
+    if zone and zone.upper() != "Z":
+        sign = -1 if zone[0] == "+" else 1
+        digits = zone[1:].replace(":", "")
+        seconds += sign * (int(digits[:2]) * 3600 + int(digits[2:]) * 60)
+    nanos = int(frac.ljust(9, "0")) if frac else 0
+    return seconds * NS + nanos
+
+
+def format_ts(ts_ns: int) -> str:
+    """Nanoseconds since the epoch as ISO 8601 UTC, to the millisecond."""
+    seconds, nanos = divmod(ts_ns, NS)
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+    return f"{stamp}.{nanos // 1_000_000:03d}Z"
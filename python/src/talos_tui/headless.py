@@ -0,0 +1,178 @@
+"""
+Headless collector: runs the coordinator and pollers without Textual.
+State changes stream as NDJSON; snapshots are served on a Unix socket.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import queue
+import signal
+import threading
+from pathlib import Path
+from typing import List, Optional, TextIO
+
+from talos_tui.core.state import StateStore, TuiEvent, iter_events
+from talos_tui.core.telemetry import TELEMETRY
+from talos_tui.hub import Hub
+from talos_tui.runtime import Runtime
+from talos_tui.sockets import serve_unix
+
+logger = logging.getLogger(__name__)
+
+
+class NdjsonSink:
+    """
+    Store listener that streams one JSON object per reduced event
+    (batches are flattened):
+    - Events are encoded on the loop and queued; a writer thread writes
+      and flushes whatever has queued up in one go, so a slow output
+      never blocks the loop.
+    - If the queue is full, lines are dropped and counted.
+    - `close()` writes what is queued and stops the thread.
+    """
+
+    def __init__(self, stream: TextIO, max_queue: int = 10_000):
+        self.stream = stream
+        self.written = 0
+        self.dropped = 0
+        self.closed = False
+        self._queue: queue.Queue[Optional[str]] = queue.Queue(max_queue)
+        self._thread = threading.Thread(
+            target=self._drain, name="ndjson-sink", daemon=True
+        )
+        self._thread.start()
+
+    def __call__(self, event: TuiEvent) -> None:
+        if self.closed:
+            return
+        for e in iter_events(event):
+            line = json.dumps(e.to_dict(), separators=(",", ":"), default=str)
+            try:
+                self._queue.put_nowait(line + "\n")
+            except queue.Full:
+                self.dropped += 1
+                TELEMETRY.counter("ndjson.dropped").inc()
+
+    def _drain(self) -> None:
+        done = False
+        while not done:
+            batch: List[str] = []
+            line = self._queue.get()
+            while line is not None:
+                batch.append(line)
+                try:
+                    line = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            done = line is None
+            if not batch or self.closed:
+                continue
+            try:
+                self.stream.write("".join(batch))
+                self.stream.flush()
+            except (BrokenPipeError, ValueError):
+                # Reader went away (e.g. piped into `head`); keep collecting
+                logger.warning("NDJSON output closed; no longer streaming")
+                self.closed = True
+                continue
+            self.written += len(batch)
+
+    def close(self) -> None:
+        """Write the lines queued so far and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self.closed = True
+
+
+class SnapshotServer:
+    """
+    Serves the current state on a Unix socket: every connection receives
+    one JSON snapshot line and is closed, e.g.
+    `socat - UNIX-CONNECT:/run/talos-tui.sock`.
+    """
+
+    def __init__(self, store: StateStore, path: Path, audit_limit: int = 50):
+        self.store = store
+        self.path = path
+        self.audit_limit = audit_limit
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """
+        Bind the socket owner-only (see `serve_unix`). Raises TuiError if
+        another server is running on the path.
+        """
+        self._server = await serve_unix(self._handle, self.path, 0o600)
+        logger.info("Serving snapshots on %s", self.path)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            snapshot = self.store.snapshot(audit_limit=self.audit_limit)
+            writer.write(json.dumps(snapshot, default=str).encode() + b"\n")
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def stop(self) -> None:
+        """Stop serving and remove the socket file."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self.path.exists():
+            self.path.unlink()
+
+
+async def run_headless(
+    runtime: Runtime,
+    output: Optional[TextIO] = None,
+    socket_path: Optional[Path] = None,
+    stop: Optional[asyncio.Event] = None,
+    hub_path: Optional[Path] = None,
+) -> None:
+    """
+    Collect until SIGINT/SIGTERM (or `stop` is set). With `hub_path`,
+    also publish the state to attached TUI clients.
+    """
+    stop = stop or asyncio.Event()
+    loop = asyncio.get_running_loop()
+    signals = (signal.SIGINT, signal.SIGTERM)
+    for sig in signals:
+        loop.add_signal_handler(sig, stop.set)
+
+    sink = NdjsonSink(output) if output else None
+    unsubscribe = runtime.store.subscribe(sink) if sink else None
+    server = (
+        SnapshotServer(runtime.store, socket_path) if socket_path else None
+    )
+    hub = (
+        Hub(runtime.store, hub_path, runtime.config.hub_max_queue)
+        if hub_path
+        else None
+    )
+    try:
+        if server is not None:
+            await server.start()
+        if hub is not None:
+            await hub.start()
+        await runtime.start()
+        await stop.wait()
+    finally:
+        await runtime.stop()
+        if unsubscribe is not None:
+            unsubscribe()
+        if sink is not None:
+            await asyncio.to_thread(sink.close)
+        if server is not None:
+            await server.stop()
+        if hub is not None:
+            await hub.stop()
+        for sig in signals:
+            loop.remove_signal_handler(sig)
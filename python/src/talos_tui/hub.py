@@ -0,0 +1,212 @@
+"""
+Local hub: one process owns the coordinator and adapters and publishes
+StateStore deltas over a Unix socket to any number of thin TUI clients,
+so upstream polling does not grow with the number of viewers.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from talos_tui.core.state import (
+    LifecycleChanged,
+    StateStore,
+    TuiEvent,
+    event_from_dict,
+)
+from talos_tui.core.telemetry import TELEMETRY
+from talos_tui.sockets import serve_unix
+
+logger = logging.getLogger(__name__)
+
+
+def _runtime_dir() -> Path:
+    """
+    Per-user directory for the hub socket: $XDG_RUNTIME_DIR, else a
+    `talos-tui-<uid>` directory in the temp dir, never the shared temp
+    dir itself.
+    """
+    runtime = os.getenv("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime)
+    return Path(tempfile.gettempdir()) / f"talos-tui-{os.getuid()}"
+
+
+DEFAULT_HUB_SOCKET = _runtime_dir() / "talos-tui-hub.sock"
+# Snapshots carry up to 1000 audit events; lines can be large
+MAX_LINE_BYTES = 64 * 1024 * 1024
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return json.dumps(
+        message, separators=(",", ":"), default=str
+    ).encode() + b"\n"
+
+
+class _Subscriber:
+    """One attached client: a bounded queue drained by its own task."""
+
+    def __init__(self, writer: asyncio.StreamWriter, max_queue: int):
+        self.writer = writer
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(max_queue)
+        self.task: Optional[asyncio.Task[Any]] = None
+
+    def offer(self, line: bytes) -> bool:
+        """Queue a line; False if the client is too far behind."""
+        try:
+            self.queue.put_nowait(line)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def run(self) -> None:
+        while True:
+            self.writer.write(await self.queue.get())
+            # Coalesce whatever queued up meanwhile into one drain
+            while not self.queue.empty():
+                self.writer.write(self.queue.get_nowait())
+            await self.writer.drain()
+
+
+class Hub:
+    """
+    Publishes a StateStore to local subscribers over a Unix socket.
+    The protocol is NDJSON, hub to client only:
+    - `{"op": "snapshot", "state": {...}}` once on connect, then
+    - `{"op": "event", "event": {...}}` for every reduced event.
+    Each event is encoded once and the same bytes are queued for every
+    subscriber. A subscriber whose queue fills up is disconnected; it
+    gets a fresh snapshot when it reconnects.
+    """
+
+    def __init__(self, store: StateStore, path: Path, max_queue: int = 1000):
+        self.store = store
+        self.path = path
+        self.max_queue = max_queue
+        self.subscribers: Set[_Subscriber] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._unsubscribe: Optional[Any] = None
+
+    async def start(self) -> None:
+        """
+        Bind the socket (see `serve_unix`) and start publishing. Raises
+        TuiError if another hub is running on the path.
+        """
+        # Owner and group: operators sharing a group can attach
+        self._server = await serve_unix(self._handle, self.path, 0o660)
+        self._unsubscribe = self.store.subscribe(self._publish)
+        logger.info("Hub publishing on %s", self.path)
+
+    def _publish(self, event: TuiEvent) -> None:
+        if not self.subscribers:
+            return
+        line = _encode({"op": "event", "event": event.to_dict()})
+        TELEMETRY.counter("hub.events").inc()
+        for sub in tuple(self.subscribers):
+            if not sub.offer(line):
+                logger.warning("Dropping hub subscriber that fell behind")
+                TELEMETRY.counter("hub.slow_subscribers").inc()
+                self.subscribers.discard(sub)
+                if sub.task is not None:
+                    sub.task.cancel()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        sub = _Subscriber(writer, self.max_queue)
+        sub.offer(
+            _encode({"op": "snapshot", "state": self.store.snapshot(None)})
+        )
+        sub.task = asyncio.current_task()
+        self.subscribers.add(sub)
+        try:
+            await sub.run()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.subscribers.discard(sub)
+            writer.close()
+
+    async def stop(self) -> None:
+        """Disconnect subscribers and remove the socket file."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._server is not None:
+            self._server.close()
+            for sub in tuple(self.subscribers):
+                if sub.task is not None:
+                    sub.task.cancel()
+            await self._server.wait_closed()
+            self._server = None
+        if self.path.exists():
+            self.path.unlink()
+
+
+class HubClient:
+    """
+    Mirrors a hub's state into a local StateStore. Listeners on the local
+    store (screens, navigation) see the same events as on the hub.
+    Reconnects with exponential backoff; on reconnect the state is
+    replaced from a fresh snapshot.
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        path: Path,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 5.0,
+    ):
+        self.store = store
+        self.path = path
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.connected = asyncio.Event()
+        self.applied = 0
+
+    def apply(self, message: Dict[str, Any]) -> None:
+        """Apply one hub message to the local store."""
+        op = message.get("op")
+        if op == "snapshot":
+            previous = self.store.lifecycle
+            self.store.restore(message["state"])
+            # Let listeners catch up with the restored state
+            self.store.reduce(
+                LifecycleChanged(previous=previous, state=self.store.lifecycle)
+            )
+        elif op == "event":
+            self.store.reduce(event_from_dict(message["event"]))
+        else:
+            logger.warning("Ignoring unknown hub message %r", op)
+            return
+        self.applied += 1
+
+    async def run(self) -> None:
+        """Stay attached until cancelled."""
+        delay = self.reconnect_delay
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(
+                    str(self.path), limit=MAX_LINE_BYTES
+                )
+            except OSError as e:
+                logger.warning("Hub %s unavailable: %s", self.path, e)
+            else:
+                delay = self.reconnect_delay
+                self.connected.set()
+                try:
+                    while line := await reader.readline():
+                        self.apply(json.loads(line))
+                except (ConnectionError, ValueError) as e:
+                    logger.warning("Hub connection lost: %s", e)
+                finally:
+                    self.connected.clear()
+                    writer.close()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
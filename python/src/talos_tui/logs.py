@@ -0,0 +1,127 @@
+"""Non-blocking logging pipeline for the Talos TUI."""
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict
+
+from talos_tui.core.telemetry import TELEMETRY
+
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+_TRACEBACKS = logging.Formatter()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; `extra={"fields": {...}}` is merged in."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if isinstance(fields, dict):
+            entry.update(fields)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep 1 in `every` records flagged with `extra={"sample": True}`
+    (high-volume per-request lines). Warnings and errors always pass.
+    """
+
+    def __init__(self, every: int = 1):
+        super().__init__()
+        self.every = max(1, every)
+        self._seen = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.every == 1 or record.levelno >= logging.WARNING:
+            return True
+        if not getattr(record, "sample", False):
+            return True
+        self._seen += 1
+        if self._seen % self.every == 0:
+            return True
+        TELEMETRY.counter("log.sampled_out").inc()
+        return False
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when full."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge the message args and render any traceback now, on the
+        logging thread, as both may change once the call returns. Unlike
+        the stock `prepare`, the traceback is kept in `exc_text` rather
+        than folded into the message, so the JSON formatter still gets
+        its `exc` field.
+        """
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _TRACEBACKS.formatException(
+                    record.exc_info
+                )
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            TELEMETRY.counter("log.dropped").inc()
+
+
+def configure_logging(
+    path: str = "talos-tui.log",
+    level: int = logging.INFO,
+    json_format: bool = False,
+    sample_every: int = 1,
+    max_bytes: int = 5_000_000,
+    backup_count: int = 3,
+    queue_size: int = 10_000,
+) -> QueueListener:
+    """
+    Route all logging through a bounded queue to a listener thread that
+    owns a size-bounded rotating file. The event loop pays for merging
+    the message (and rendering a traceback, if any) and the enqueue;
+    line formatting and file I/O happen on the listener thread.
+    Returns the started listener; call `stop()` on shutdown to flush.
+    """
+    file_handler = RotatingFileHandler(
+        path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
+    if json_format:
+        file_handler.setFormatter(JsonFormatter())
+    else:
+        file_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(queue_size)
+    queue_handler = DroppingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(sample_every))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    return listener
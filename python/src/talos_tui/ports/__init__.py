@@ -1,7 +1,8 @@
 from __future__ import annotations
 from typing import Protocol, Sequence, Optional, Mapping
 from talos_tui.domain.models import (
-    Health, MetricsSummary, Peer, Session, VersionInfo, AuditPage
+    Health, MetricsSummary, Peer, Session, VersionInfo, AuditEvent,
+    AuditPage,
 )
 
 
@@ -24,6 +25,8 @@ class AuditPort(Protocol):
         self, limit: int, before: Optional[str]
     ) -> AuditPage: ...
 
+    async def get_event(self, event_id: str) -> AuditEvent: ...
+
 
 class ConfigPort(Protocol):
     def load_config_readonly(self) -> Mapping[str, str]: ...
@@ -33,3 +36,7 @@ class ConfigPort(Protocol):
 
 class AuthPort(Protocol):
     def auth_headers(self) -> Mapping[str, str]: ...
+
+    async def acquire_headers(self) -> Mapping[str, str]: ...
+
+    def invalidate(self, headers: Mapping[str, str]) -> None: ...
@@ -14,6 +14,7 @@ ErrorKind = Literal[
     "NOT_READY",
     "CONTRACT",
     "RATE_LIMIT",
+    "CIRCUIT_OPEN",
     "UNKNOWN",
 ]
 
@@ -0,0 +1,272 @@
+"""
+UI-independent wiring of the store, adapters and coordinator.
+Shared by the Textual app and the headless collector; must not import
+Textual or Rich.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from talos_tui.core.state import (
+    ErrorOccurred,
+    LifecycleChanged,
+    StateStore,
+)
+from talos_tui.core.telemetry import TELEMETRY
+from talos_tui.core.coordinator import Coordinator
+from talos_tui.core.contracts import (
+    ContractValidator,
+    ValidationPolicy,
+    find_contracts_root,
+    preload_contracts,
+)
+from talos_tui.core.rollups import AuditRollups
+from talos_tui.core.snapshots import SnapshotWriter, warm_start
+from talos_tui.core.watchdog import LoopWatchdog
+
+from talos_tui.adapters.gateway_http import HttpGatewayAdapter
+from talos_tui.adapters.audit_http import HttpAuditAdapter
+from talos_tui.adapters.auth import auth_from_config
+from talos_tui.adapters.config import TuiConfig
+from talos_tui.adapters.mock import LoadProfile, mock_adapters
+from talos_tui.adapters.resilience import RetryBudget
+from talos_tui.adapters.recording import (
+    RecordingAuditAdapter,
+    RecordingGatewayAdapter,
+    ReplayAuditAdapter,
+    ReplayGatewayAdapter,
+    TrafficRecorder,
+    TrafficReplay,
+)
+from talos_tui.ports import AuditPort, GatewayPort
+from talos_tui.ports.errors import TuiError
+
+logger = logging.getLogger(__name__)
+
+
+class Runtime:
+    """
+    Owns the adapters and the coordinator that feed a StateStore,
+    tuned by a `TuiConfig`.
+    Adapter selection, in order of precedence:
+    - `replay_path`: serve a recording (poll cadence scaled by the speed).
+    - `config.use_mock` or a `load_profile`: the synthetic load generator.
+    - otherwise live HTTP against `config.gateway_url` / `audit_url`.
+    With `record_path`, whichever adapters are selected are recorded.
+    With `config.state_path` (ignored for replays), the store is
+    warm-started from the last snapshot and saved periodically.
+    """
+
+    def __init__(
+        self,
+        config: Optional[TuiConfig] = None,
+        store: Optional[StateStore] = None,
+        load_profile: Optional[LoadProfile] = None,
+        record_path: Optional[Path] = None,
+        replay_path: Optional[Path] = None,
+        replay_speed: float = 1.0,
+    ):
+        self.config = config = config or TuiConfig()
+        self.store = store or StateStore()
+        self.store.max_audit_events = config.audit_ring_size
+        self.store.max_metrics_history = config.metrics_history
+        self.store.audit_rollups = AuditRollups(
+            config.rollup_window, config.rollup_windows
+        )
+        self.use_mock = config.use_mock or load_profile is not None
+        self.load_profile = load_profile
+        self.record_path = record_path
+        self.replay_path = replay_path
+        self.replay_speed = replay_speed
+        self.validator: Optional[ContractValidator] = None
+        self.snapshots = (
+            SnapshotWriter(
+                self.store,
+                Path(config.state_path),
+                config.snapshot_interval,
+                config.snapshot_audit_limit,
+            )
+            if config.state_path and replay_path is None
+            else None
+        )
+        self._warm_start_done = False
+
+        self.gateway: Optional[GatewayPort] = None
+        self.audit: Optional[AuditPort] = None
+        # The same adapters when live, for their circuit and stats hooks
+        self._http_gateway: Optional[HttpGatewayAdapter] = None
+        self._http_audit: Optional[HttpAuditAdapter] = None
+        self.coordinator: Optional[Coordinator] = None
+        self.recorder: Optional[TrafficRecorder] = None
+        # Type hint for mypy, though we import aiohttp later
+        self._session: Any = None
+
+    async def _load_contracts(self) -> ContractValidator:
+        """Preload the contract bundle off the loop; fails fast."""
+        config = self.config
+        root = find_contracts_root(config.contracts_root)
+        if root is None:
+            raise TuiError(
+                kind="CONTRACT",
+                message="talos-contracts not found; set contracts_root "
+                        "(TALOS_TUI_CONTRACTS_ROOT) to its checkout",
+            )
+        cache_dir = config.contracts_cache_dir
+        with TELEMETRY.timer("contracts.load"):
+            return await preload_contracts(
+                root, Path(cache_dir) if cache_dir else None
+            )
+
+    async def _build_adapters(self) -> float:
+        """Create the adapters; returns the poll interval scale."""
+        if self.replay_path is not None:
+            replay = TrafficReplay(self.replay_path, self.replay_speed)
+            # Windows follow the recording's time, not today's
+            self.store.audit_rollups.clock = replay.clock
+            self.gateway = ReplayGatewayAdapter(replay)
+            self.audit = ReplayAuditAdapter(replay)
+            return 1.0 / self.replay_speed
+
+        if self.use_mock:
+            self.gateway, self.audit = mock_adapters(
+                self.load_profile or LoadProfile.from_env()
+            )
+            return 1.0
+
+        self.validator = await self._load_contracts()
+        import aiohttp  # pylint: disable=import-outside-toplevel
+        config = self.config
+        # Shared session, connection pool and retry budget for all adapters
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=config.pool_limit,
+                limit_per_host=config.pool_limit_per_host,
+                keepalive_timeout=config.keepalive_timeout,
+            )
+        )
+        retry_budget = RetryBudget(
+            max_tokens=config.retry_budget_tokens,
+            token_ratio=config.retry_budget_ratio,
+        )
+        http_options: Dict[str, Any] = {
+            "validator": self.validator,
+            # One token cache for both services: refreshes are shared
+            "auth": auth_from_config(config, self._session),
+            "retry_budget": retry_budget,
+            "max_attempts": config.max_attempts,
+            "connect_timeout": config.connect_timeout,
+            "total_timeout": config.total_timeout,
+            "max_response_size": config.max_response_size,
+            "circuit_failure_threshold": config.circuit_failure_threshold,
+            "circuit_reset_timeout": config.circuit_reset_timeout,
+            "rate_limit": config.rate_limit or None,
+            "rate_burst": config.rate_burst,
+            "max_rate_limit_wait": config.max_rate_limit_wait,
+            "memo_ttl": config.memo_ttl,
+            "backoff_base": config.backoff_base,
+            "backoff_max": config.backoff_max,
+        }
+        self.gateway = self._http_gateway = HttpGatewayAdapter(
+            config.gateway_url, self._session, **http_options
+        )
+        self.audit = self._http_audit = HttpAuditAdapter(
+            config.audit_url,
+            self._session,
+            validation_policy=ValidationPolicy(
+                config.validation_mode,
+                sample_every=config.validation_sample_every,
+                escalation_seconds=config.validation_escalation,
+            ),
+            **http_options,
+        )
+        return 1.0
+
+    def warm_start(self) -> bool:
+        """Restore the last snapshot, if any; True if state was loaded."""
+        if self.snapshots is None or self._warm_start_done:
+            return False
+        self._warm_start_done = True
+        return warm_start(self.store, self.snapshots.path)
+
+    async def start(self) -> Coordinator:
+        """
+        Build the adapters and start the coordinator. A startup failure
+        (e.g. missing contracts) is published to the store as a fatal
+        error before the TuiError is raised.
+        """
+        self.warm_start()
+        try:
+            interval_scale = await self._build_adapters()
+        except TuiError as e:
+            logger.error("Startup failed: %s", e)
+            self.store.reduce_many([
+                ErrorOccurred(
+                    source="audit",
+                    kind=e.kind,
+                    message=e.message,
+                    is_fatal=True,
+                ),
+                LifecycleChanged(previous=self.store.lifecycle, state="FATAL"),
+            ])
+            raise
+        gateway, audit = self._http_gateway, self._http_audit
+
+        if self.record_path is not None:
+            self.recorder = TrafficRecorder(self.record_path)
+            self.gateway = RecordingGatewayAdapter(
+                self.gateway, "gateway", self.recorder
+            )
+            self.audit = RecordingAuditAdapter(
+                self.audit, "audit", self.recorder
+            )
+
+        config = self.config
+        self.coordinator = Coordinator(
+            self.store,
+            self.gateway,
+            self.audit,
+            contracts_version_gate=config.contracts_major,
+            max_handshake_attempts=config.max_handshake_attempts,
+            watchdog=LoopWatchdog(
+                interval=config.watchdog_interval,
+                threshold=config.watchdog_threshold,
+                profile_path=(
+                    Path(config.profile_path) if config.profile_path else None
+                ),
+            ),
+            # Replay runs the poll cadence at the same speed as responses
+            poll_interval=config.poll_interval * interval_scale,
+            handshake_interval=config.handshake_interval * interval_scale,
+            max_resume_pages=config.max_resume_pages,
+            audit_page_size=config.audit_page_size,
+            validation_stats=(
+                audit.validation_stats if audit is not None else None
+            ),
+        )
+        if gateway is not None and audit is not None:
+            gateway.add_circuit_listener(
+                partial(self.coordinator.on_circuit_change, "gateway")
+            )
+            audit.add_circuit_listener(
+                partial(self.coordinator.on_circuit_change, "audit")
+            )
+
+        await self.coordinator.start()
+        if self.snapshots is not None:
+            self.coordinator.spawn(self.snapshots.run())
+        return self.coordinator
+
+    async def stop(self) -> None:
+        """Stop polling and release the adapters' resources."""
+        if self.coordinator:
+            await self.coordinator.stop()
+        if self.snapshots is not None and self.coordinator:
+            await self.snapshots.save()
+        if self.recorder is not None:
+            await asyncio.to_thread(self.recorder.close)
+        if self._session is not None:
+            await self._session.close()
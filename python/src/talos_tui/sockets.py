@@ -0,0 +1,85 @@
+"""Unix sockets for the local servers (hub, snapshots)."""
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import socket
+import stat
+import tempfile
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from talos_tui.ports.errors import TuiError
+
+Handler = Callable[
+    [asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]
+]
+
+
+async def claim_socket_path(path: Path) -> None:
+    """
+    Make way for a server at `path`:
+    - Its directory is created 0o750 if missing, and must belong to
+      this user (or root).
+    - A stale socket (nothing listening) is removed. Raises TuiError if
+      a server answers on it, or if something other than a socket is
+      there, rather than taking the path over.
+    """
+    parent = path.parent
+    parent.mkdir(mode=0o750, parents=True, exist_ok=True)
+    owner = parent.stat().st_uid
+    if owner not in (os.getuid(), 0):
+        raise TuiError(
+            kind="UNKNOWN",
+            message=f"{parent} belongs to another user (uid {owner}); "
+                    "choose another socket path",
+        )
+    try:
+        mode = path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise TuiError(kind="UNKNOWN", message=f"{path} is not a socket")
+    try:
+        _, writer = await asyncio.open_unix_connection(str(path))
+    except OSError:
+        # Nothing listening: left behind by a server that died
+        path.unlink()
+        return
+    writer.close()
+    raise TuiError(
+        kind="UNKNOWN", message=f"another server is running on {path}"
+    )
+
+
+def bind_unix_socket(path: Path, mode: int) -> socket.socket:
+    """
+    A stream socket bound at `path`, with permissions `mode` from the
+    start: it is bound in a private (0o700) directory next to `path`,
+    chmod'ed, then renamed into place. The process umask, shared with
+    every other thread, is left alone.
+    """
+    private = Path(tempfile.mkdtemp(prefix=".tt-", dir=path.parent))
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        staged = private / "s"
+        sock.bind(str(staged))
+        os.chmod(staged, mode)
+        os.replace(staged, path)
+    except BaseException:
+        sock.close()
+        raise
+    finally:
+        shutil.rmtree(private, ignore_errors=True)
+    return sock
+
+
+async def serve_unix(
+    handler: Handler, path: Path, mode: int
+) -> asyncio.AbstractServer:
+    """Claim `path` and serve `handler` on a socket with `mode` there."""
+    await claim_socket_path(path)
+    return await asyncio.start_unix_server(
+        handler, sock=bind_unix_socket(path, mode)
+    )
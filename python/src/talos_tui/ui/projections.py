@@ -0,0 +1,191 @@
+"""Pure projections from the StateStore to screen view models."""
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from talos_tui.core.rollups import AuditRollups
+from talos_tui.core.state import SourceState, StateStore
+from talos_tui.domain.timestamps import format_ts
+
+STALE_AFTER_SECONDS = 5.0
+SPARK_BARS = "▁▂▃▄▅▆▇█"
+# Outcome columns of the analytics table, in order
+ANALYTICS_OUTCOMES = ("OK", "DENY", "ERROR")
+
+
+@dataclass(frozen=True)
+class HealthView:
+    """Rendered state of one health indicator."""
+
+    text: str
+    color: str
+
+
+@dataclass(frozen=True)
+class DashboardView:
+    """
+    Everything the dashboard displays, already formatted.
+    Two equal views render identically, so the screen only touches
+    widgets whose field changed.
+    """
+
+    peers: str
+    sessions: str
+    p50: str
+    p95: str
+    gateway: HealthView
+    audit: HealthView
+    stale_banner: Optional[str]
+    validation: Optional[HealthView] = None
+
+
+@dataclass(frozen=True)
+class AnalyticsRow:
+    """Counts of one event type over the windows shown."""
+
+    schema_id: str
+    counts: Tuple[int, ...]  # per ANALYTICS_OUTCOMES, then any other
+    deny_trend: str
+
+
+@dataclass(frozen=True)
+class AnalyticsView:
+    """Everything the analytics screen displays, already aggregated."""
+
+    caption: str
+    total: Tuple[int, ...]  # events per window, oldest first
+    deny: Tuple[int, ...]
+    error: Tuple[int, ...]
+    rows: Tuple[AnalyticsRow, ...]
+    peers: Tuple[Tuple[str, int], ...]  # most failures first
+
+
+def project_health(state: SourceState) -> HealthView:
+    """Project a source's health and circuit state to its indicator."""
+    circuit = state.circuit_state
+    if circuit == "OPEN":
+        return HealthView("OFFLINE [CIRCUIT OPEN]", "red")
+    if circuit == "HALF_OPEN":
+        return HealthView("PROBING [HALF-OPEN]", "yellow")
+    if state.health_ok:
+        return HealthView("ONLINE", "green")
+    return HealthView("OFFLINE" if state.error else "PENDING", "red")
+
+
+def project_validation(stats: Dict[str, Any]) -> Optional[HealthView]:
+    """Project audit validation counters; None before any were reported."""
+    if not stats:
+        return None
+    mode = stats["mode"]
+    label = (
+        f"SAMPLED 1/{stats['sample_every']}"
+        if mode == "sampled" else mode.upper()
+    )
+    if stats["effective_mode"] != mode:
+        label += " -> FULL (ESCALATED)"
+    text = (
+        f"{label} | {stats['validated']:,} validated"
+        f" | {stats['skipped']:,} skipped | {stats['failed']:,} failed"
+    )
+    return HealthView(text, "red" if stats["failed"] else "green")
+
+
+def project_dashboard(store: StateStore) -> DashboardView:
+    """Project the store to the dashboard view model."""
+    m = store.metrics
+    gw_age = store.get_stale_since("gateway")
+    banners = []
+    if store.lifecycle == "DEGRADED":
+        banners.append("DEGRADED")
+    if store.restored_at is not None:
+        age = int(time.time() - store.restored_at)
+        banners.append(f"LAST SESSION SNAPSHOT ({age}s old)")
+    elif gw_age > STALE_AFTER_SECONDS and gw_age != float("inf"):
+        banners.append(f"STALE DATA ({int(gw_age)}s old)")
+    stale_banner = " | ".join(banners) or None
+
+    return DashboardView(
+        peers=str(m.get("connected_peers", 0)),
+        sessions=str(m.get("active_sessions", 0)),
+        p50=f"{m.get('latency_p50_ms', 0.0):.1f}",
+        p95=f"{m.get('latency_p95_ms', 0.0):.1f}",
+        gateway=project_health(store.gateway),
+        audit=project_health(store.audit),
+        stale_banner=stale_banner,
+        validation=project_validation(store.validation),
+    )
+
+
+def project_audit_detail(detail: Dict[str, Any]) -> str:
+    """Render a materialized (redacted) audit event for the detail pane."""
+    header = (
+        f"ID:      {detail['event_id']}\n"
+        f"Time:    {detail['ts']}\n"
+        f"Type:    {detail['schema_id']}\n"
+        f"Outcome: {detail['outcome']}\n"
+    )
+    body = json.dumps(detail["payload"], indent=2, sort_keys=True)
+    return f"{header}\nPayload:\n{body}"
+
+
+def spark(values: Sequence[int]) -> str:
+    """Values as a one-line bar chart, scaled to the largest."""
+    top = max(values, default=0)
+    if not top:
+        return SPARK_BARS[0] * len(values)
+    last = len(SPARK_BARS) - 1
+    return "".join(
+        SPARK_BARS[-(-v * last // top)] if v else SPARK_BARS[0]
+        for v in values
+    )
+
+
+def project_analytics(
+    rollups: AuditRollups, top_peers: int = 5
+) -> AnalyticsView:
+    """Project the audit rollups to the analytics view model."""
+    by_series = rollups.by_series()
+    total = [0] * rollups.windows
+    by_outcome: Dict[str, List[int]] = {}
+    by_type: Dict[str, Dict[str, List[int]]] = {}
+    for (schema_id, outcome), counts in by_series.items():
+        total = [a + b for a, b in zip(total, counts, strict=True)]
+        summed = by_outcome.setdefault(outcome, [0] * rollups.windows)
+        by_outcome[outcome] = [
+            a + b for a, b in zip(summed, counts, strict=True)
+        ]
+        by_type.setdefault(schema_id, {})[outcome] = counts
+    rows = []
+    for schema_id, outcomes in by_type.items():
+        known = [sum(outcomes.get(o, ())) for o in ANALYTICS_OUTCOMES]
+        other = sum(
+            sum(c) for o, c in outcomes.items()
+            if o not in ANALYTICS_OUTCOMES
+        )
+        rows.append(AnalyticsRow(
+            schema_id=schema_id,
+            counts=(*known, other),
+            deny_trend=spark(outcomes.get("DENY", [0] * rollups.windows)),
+        ))
+    if rollups.head < 0:
+        caption = "No audit events yet"
+    else:
+        caption = (
+            f"Per {rollups.window:g}s window, last {rollups.windows}"
+            f" to {format_ts(rollups.starts()[-1])[11:19]}Z"
+            f" | {rollups.counted:,} counted"
+        )
+        if rollups.dropped:
+            caption += f" | {rollups.dropped:,} too old"
+    empty = (0,) * rollups.windows
+    return AnalyticsView(
+        caption=caption,
+        total=tuple(total),
+        deny=tuple(by_outcome.get("DENY", empty)),
+        error=tuple(by_outcome.get("ERROR", empty)),
+        rows=tuple(rows),
+        peers=tuple(rollups.top_peers(top_peers)),
+    )
@@ -0,0 +1,111 @@
+"""Memoized rendering helpers for the audit table."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Tuple
+
+from rich.style import Style
+from rich.text import Text
+
+# Severity char, colour and the interned styles used for each cell.
+SEVERITY_ERROR = ("E", "#FF007A")
+SEVERITY_WARN = ("W", "#F1FA8C")
+SEVERITY_INFO = ("I", "#00FF9C")
+
+DIM_STYLE = Style(dim=True)
+
+AuditRow = Tuple[Text, Text, Text, Text]
+
+
+class SeverityStyles:
+    """Interned `Style` objects for one severity level."""
+
+    __slots__ = ("char", "color", "marker", "cell", "marker_text")
+
+    def __init__(self, char: str, color: str):
+        self.char = char
+        self.color = color
+        self.marker = Style(color=color, bold=True)
+        self.cell = Style(color=color)
+        # Cells are never mutated by the table, so one instance is shared
+        self.marker_text = Text(char, style=self.marker)
+
+
+_SEVERITIES: Dict[str, SeverityStyles] = {
+    "ERROR": SeverityStyles(*SEVERITY_ERROR),
+    "DENY": SeverityStyles(*SEVERITY_WARN),
+}
+_DEFAULT_SEVERITY = SeverityStyles(*SEVERITY_INFO)
+
+
+def severity_for(outcome: str) -> SeverityStyles:
+    """Return the interned styles for an outcome (case-insensitive)."""
+    sev = _SEVERITIES.get(outcome)
+    if sev is None:
+        sev = _SEVERITIES.get(outcome.upper(), _DEFAULT_SEVERITY)
+    return sev
+
+
+class AuditRowRenderer:
+    """
+    Renders audit events into DataTable rows and memoizes the result.
+    - Display-type strings are cached per schema_id.
+    - Severity marker and type cells are shared per (schema_id, outcome).
+    - Rendered rows are cached per event id with LRU eviction, so
+      re-populating the table (clear, resync) reuses the same Text objects.
+    """
+
+    def __init__(self, max_rows: int = 2000):
+        self.max_rows = max_rows
+        self._rows: OrderedDict[str, AuditRow] = OrderedDict()
+        self._display_types: Dict[str, str] = {}
+        self._type_cells: Dict[Tuple[str, str], Text] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def display_type(self, schema_id: str) -> str:
+        """Return the display label for a schema_id (memoized)."""
+        label = self._display_types.get(schema_id)
+        if label is None:
+            label = schema_id.replace("talos.", "")
+            self._display_types[schema_id] = label
+        return label
+
+    def render(self, event: Mapping[str, Any]) -> AuditRow:
+        """Return the (cached) row cells for an event."""
+        eid = event.get("event_id") or event.get("id") or "unknown"
+        row = self._rows.get(eid)
+        if row is not None:
+            self.hits += 1
+            self._rows.move_to_end(eid)
+            return row
+
+        self.misses += 1
+        outcome = event.get("outcome", "OK")
+        sev = severity_for(outcome)
+        schema_id = (
+            event.get("event_type") or event.get("schema_id") or "unknown"
+        )
+        type_cell = self._type_cells.get((schema_id, outcome))
+        if type_cell is None:
+            type_cell = Text(
+                f"{self.display_type(schema_id)} ({outcome})", style=sev.cell
+            )
+            self._type_cells[(schema_id, outcome)] = type_cell
+        row = (
+            sev.marker_text,
+            Text(event.get("ts") or "unknown", style=sev.cell),
+            type_cell,
+            Text(eid, style=DIM_STYLE),
+        )
+        self._rows[eid] = row
+        if len(self._rows) > self.max_rows:
+            self._rows.popitem(last=False)
+        return row
+
+    def clear(self) -> None:
+        """Drop all cached rows."""
+        self._rows.clear()
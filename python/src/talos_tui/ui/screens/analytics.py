@@ -0,0 +1,116 @@
+"""Audit analytics: event rates and top failing peers, from rollups."""
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from rich.table import Table
+from textual.app import ComposeResult
+from textual.containers import Container, Horizontal, Vertical
+from textual.widgets import Footer, Header, Label, Sparkline, Static
+
+from talos_tui.core.state import StateStore, TuiEvent
+from talos_tui.ui.projections import (
+    ANALYTICS_OUTCOMES, AnalyticsView, project_analytics
+)
+from talos_tui.ui.screens.base import TimedScreen
+
+
+def render_types(view: AnalyticsView) -> Table:
+    """Per event type counts, with a DENY trend, as a rich table."""
+    table = Table(expand=True, box=None, header_style="bold")
+    table.add_column("Event type")
+    for outcome in (*ANALYTICS_OUTCOMES, "Other"):
+        table.add_column(outcome, justify="right")
+    table.add_column("DENY per window")
+    for row in view.rows:
+        table.add_row(
+            row.schema_id,
+            *(f"{count:,}" for count in row.counts),
+            row.deny_trend,
+        )
+    return table
+
+
+def render_peers(view: AnalyticsView) -> Table:
+    """The peers with the most DENY/ERROR events, as a rich table."""
+    table = Table(expand=True, box=None, header_style="bold")
+    table.add_column("Peer")
+    table.add_column("Failures", justify="right")
+    for peer, failures in view.peers:
+        table.add_row(peer, f"{failures:,}")
+    return table
+
+
+class AuditAnalytics(TimedScreen):
+    """
+    Projection of the store's audit rollups: events, DENY and ERROR per
+    window as sparklines, counts per event type and the top failing
+    peers. The rollups are kept up to date as events are ingested, so a
+    refresh reads a few fixed-size series, never the events themselves;
+    refreshes are coalesced and skipped if nothing changed.
+    """
+
+    def __init__(self, store: StateStore):
+        super().__init__()
+        self.store = store
+        self._view: Optional[AnalyticsView] = None
+        self._refresh_pending = False
+        self._unsubscribe: Optional[Callable[[], None]] = None
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        with Container(id="analytics_container"):
+            with Horizontal(id="analytics-title-bar"):
+                yield Label("AUDIT ANALYTICS", classes="title")
+                yield Label("", id="analytics-caption")
+            for name, title in (
+                ("total", "EVENTS"), ("deny", "DENY"), ("error", "ERROR")
+            ):
+                with Horizontal(classes="analytics-rate"):
+                    yield Label(title, classes="health-label")
+                    yield Sparkline([], id=f"spark-{name}")
+                    yield Label("", id=f"last-{name}")
+            with Horizontal(id="analytics-body"):
+                with Vertical(id="analytics-types"):
+                    yield Static(id="analytics-table")
+                with Vertical(id="analytics-peers"):
+                    yield Label("TOP FAILING PEERS", classes="title")
+                    yield Static(id="analytics-peer-table")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        self._unsubscribe = self.store.subscribe(self._on_store_event)
+        self.refresh_view()
+        # Windows roll over with the clock, not only on store events
+        self.set_interval(1.0, self.refresh_view)
+
+    def on_unmount(self) -> None:
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def _on_store_event(self, event: TuiEvent) -> None:
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.call_later(self.refresh_view)
+
+    def refresh_view(self) -> None:
+        """Project the current rollups to the widgets."""
+        self._refresh_pending = False
+        view = project_analytics(self.store.audit_rollups)
+        if view == self._view:
+            return
+        self._view = view
+        self.query_one("#analytics-caption", Label).update(view.caption)
+        for name in ("total", "deny", "error"):
+            series = getattr(view, name)
+            self.query_one(f"#spark-{name}", Sparkline).data = list(series)
+            self.query_one(f"#last-{name}", Label).update(
+                f"{series[-1]:,}" if series else ""
+            )
+        self.query_one("#analytics-table", Static).update(
+            render_types(view)
+        )
+        self.query_one("#analytics-peer-table", Static).update(
+            render_peers(view)
+        )
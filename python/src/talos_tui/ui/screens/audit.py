@@ -1,77 +1,323 @@
 """Module for the AuditViewer screen in the Talos TUI."""
 from __future__ import annotations
 
+import asyncio
+import time
+from typing import Any, Dict, List, Mapping, Optional
+
 from textual.app import ComposeResult
-from textual.screen import Screen
-from textual.widgets import Header, Footer, DataTable, Label
-from textual.containers import Container
-from rich.text import Text
+from textual.binding import Binding
+from textual.widgets import (
+    Header, Footer, DataTable, Input, Label, Static
+)
+from textual.containers import Container, Horizontal, VerticalScroll
+from textual.timer import Timer
+from textual.worker import Worker
 
+from talos_tui.core.details import AuditDetailCache, event_id_of
+from talos_tui.core.export import AuditExport, export_path
 from talos_tui.core.state import StateStore
+from talos_tui.core.timeline import AuditHistory, TimeWindow, ts_key
+from talos_tui.domain.timestamps import NS, format_ts, parse_ts
+from talos_tui.ports.errors import TuiError
+from talos_tui.ui.projections import project_audit_detail
+from talos_tui.ui.render_cache import AuditRowRenderer
+from talos_tui.ui.screens.base import TimedScreen
+
+
+# Events shown either side of a scrubbed-to time
+WINDOW_RADIUS = 50
+
+
+class AuditViewer(TimedScreen):
+    """
+    Screen for viewing audit events logs.
+    - The highlighted row is shown in full in the detail pane; its
+      neighbours (`prefetch` rows either side) are fetched ahead.
+    - Scrubbing (`[`/`]` by `scrub_step` seconds, `{`/`}` by 60 steps,
+      `g` for a time) pauses the live tail and shows the events around
+      that time from `history`; `l` returns to the live tail.
+    - `x` exports every event held (the ring and older history) in the
+      background, with progress in the title bar; `x` again cancels.
+    """
 
+    BINDINGS = [
+        Binding("left_square_bracket", "scrub(-1)", "Back"),
+        Binding("right_square_bracket", "scrub(1)", "Forward"),
+        Binding("left_curly_bracket", "scrub(-60)", "Back x60", show=False),
+        Binding(
+            "right_curly_bracket", "scrub(60)", "Forward x60", show=False
+        ),
+        Binding("g", "go_to_time", "Go to time"),
+        Binding("l", "live", "Live"),
+        Binding("x", "export", "Export"),
+    ]
 
-class AuditViewer(Screen[None]):
-    """Screen for viewing audit events logs."""
-    def __init__(self, store: StateStore):
+    def __init__(
+        self,
+        store: StateStore,
+        details: Optional[AuditDetailCache] = None,
+        prefetch: int = 2,
+        history: Optional[AuditHistory] = None,
+        scrub_step: float = 60.0,
+        export_dir: str = "",
+        export_format: str = "ndjson.gz",
+        export_chunk_size: int = 5000,
+    ):
         super().__init__()
         self.store = store
         self._last_event_count = 0
+        self._last_late = 0
+        self.rows = AuditRowRenderer()
+        self.details = (
+            details if details is not None else AuditDetailCache()
+        )
+        self.prefetch = prefetch
+        self.history = (
+            history if history is not None else AuditHistory(store)
+        )
+        self.scrub_step = scrub_step
+        # Scrubbed-to time (epoch-ns); None while following the live tail
+        self.at: Optional[int] = None
+        # Store items in table row order
+        self._row_items: List[Dict[str, Any]] = []
+        self._selected: Optional[str] = None
+        self.export_dir = export_dir
+        self.export_format = export_format
+        self.export_chunk_size = export_chunk_size
+        self._export: Optional[AuditExport] = None
+        self._export_worker: Optional[Worker[None]] = None
+        self._export_timer: Optional[Timer] = None
 
     def compose(self) -> ComposeResult:
         """Compose the screen interface."""
         yield Header()
         with Container(id="audit_container"):
-            yield Label("AUDIT EVENT LOG", classes="title")
-            yield DataTable(cursor_type="row", zebra_stripes=True)
+            with Horizontal(id="audit-title-bar"):
+                yield Label("AUDIT EVENT LOG", classes="title")
+                yield Label("LIVE", id="audit-position")
+                yield Label("", id="audit-export")
+            yield Input(
+                placeholder="Go to time: ISO 8601 or HH:MM[:SS] (UTC)",
+                id="audit-seek",
+            )
+            with Horizontal(id="audit-body"):
+                yield DataTable(cursor_type="row", zebra_stripes=True)
+                with VerticalScroll(id="audit-detail-pane"):
+                    yield Static(
+                        "Select an event", id="audit-detail", markup=False
+                    )
         yield Footer()
 
     def on_mount(self) -> None:
         """Initialize the data table columns and start the refresh interval."""
         table = self.query_one(DataTable)
         table.add_columns("!", "Timestamp", "Type", "ID")
+        # Shown on demand by `g`; keep it out of the focus chain until then
+        self.query_one("#audit-seek", Input).display = False
+        table.focus()
         self.set_interval(1.0, self.refresh_view)
 
     def refresh_view(self) -> None:
         """Project current StateStore audit events to UI"""
+        if self.at is not None:
+            # Scrubbing: the live tail is paused
+            return
         events = self.store.audit_events
-        if len(events) == self._last_event_count:
+        late = getattr(events, "late", 0)
+        if (
+            len(events) == self._last_event_count
+            and late == self._last_late
+        ):
             return
 
         table = self.query_one(DataTable)
         # For simplicity in this redraw, we check if we need to sync
-        # In a real app we might only append, but since store is the truth:
-        if len(events) < self._last_event_count:
+        # In a real app we might only append, but since store is the truth.
+        # A late arrival lands mid-log, so it redraws the whole table.
+        if len(events) < self._last_event_count or late != self._last_late:
             table.clear()
+            self._row_items.clear()
             self._last_event_count = 0
 
         # Add only new events (events are sorted newest first in store)
         new_events = events[:len(events) - self._last_event_count]
         # Reverse to add to table (which appends)
+        render = self.rows.render
         for e in reversed(new_events):
-            sev_char, color = self._get_severity(e.get("outcome", "OK"))
-
-            display_type = (
-                e.get("event_type") or e.get("schema_id") or "unknown"
-            ).replace("talos.", "")
-            eid = e.get("event_id") or e.get("id") or "unknown"
-            ts = e.get("ts") or "unknown"
-
-            table.add_row(
-                Text(sev_char, style=f"bold {color}"),
-                Text(ts, style=color),
-                Text(
-                    f"{display_type} ({e.get('outcome', 'OK')})", style=color
-                ),
-                Text(eid, style="dim")
-            )
+            table.add_row(*render(e))
+            self._row_items.append(e)
 
         self._last_event_count = len(events)
+        self._last_late = late
         table.scroll_end(animate=False)
 
-    def _get_severity(self, outcome: str) -> tuple[str, str]:
-        outcome = outcome.upper()
-        if outcome == "ERROR":
-            return "E", "#FF007A"
-        if outcome == "DENY":
-            return "W", "#F1FA8C"
-        return "I", "#00FF9C"
+    def on_data_table_row_highlighted(
+        self, event: DataTable.RowHighlighted
+    ) -> None:
+        """Show the highlighted event in the detail pane."""
+        self.show_detail(event.cursor_row)
+
+    def show_detail(self, row: int) -> None:
+        """
+        Show the event at `row`: immediately if held in full or cached,
+        else once fetched. Then warm the rows around it.
+        """
+        if not 0 <= row < len(self._row_items):
+            return
+        item = self._row_items[row]
+        self._selected = event_id_of(item)
+        pane = self.query_one("#audit-detail", Static)
+        detail = self.details.resolve(item)
+        if detail is not None:
+            pane.update(project_audit_detail(detail))
+        else:
+            pane.update(f"Loading {self._selected}...")
+            self.run_worker(
+                self._load_detail(item), group="audit-detail", exclusive=True
+            )
+        k = self.prefetch
+        self.details.prefetch(self._row_items[max(0, row - k):row + k + 1])
+
+    async def _load_detail(self, item: Mapping[str, Any]) -> None:
+        eid = event_id_of(item)
+        try:
+            text = project_audit_detail(await self.details.get(item))
+        except TuiError as e:
+            text = f"Cannot load {eid}: {e.message}"
+        if self._selected == eid:
+            self.query_one("#audit-detail", Static).update(text)
+
+    def _current_ts(self) -> int:
+        if self.at is not None:
+            return self.at
+        events = self.store.audit_events
+        return ts_key(events[0]) if events else time.time_ns()
+
+    def action_scrub(self, steps: int) -> None:
+        """Move `steps` scrub steps back (negative) or forward in time."""
+        self.seek(self._current_ts() + int(steps * self.scrub_step * NS))
+
+    def action_go_to_time(self) -> None:
+        """Prompt for a time to scrub to."""
+        seek_input = self.query_one("#audit-seek", Input)
+        seek_input.display = True
+        seek_input.focus()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Scrub to the entered time."""
+        event.input.display = False
+        event.input.value = ""
+        self.query_one(DataTable).focus()
+        text = event.value.strip()
+        ts_ns = parse_ts(text)
+        if not ts_ns:
+            # A time of day on the day currently shown
+            day = format_ts(self._current_ts())[:10]
+            clock = f"{text}:00" if text.count(":") == 1 else text
+            ts_ns = parse_ts(f"{day}T{clock}")
+        if ts_ns:
+            self.seek(ts_ns)
+        else:
+            self.notify(f"Not a time: {text!r}", severity="warning")
+
+    def action_live(self) -> None:
+        """Return to the live tail."""
+        if self.at is None:
+            return
+        self.at = None
+        self.query_one(DataTable).clear()
+        self._row_items.clear()
+        self._last_event_count = 0
+        self.query_one("#audit-position", Label).update("LIVE")
+        self.refresh_view()
+
+    def seek(self, ts_ns: int) -> None:
+        """
+        Show the events around `ts_ns`: those held at once, then the
+        window again once any missing older pages are loaded.
+        """
+        self.at = ts_ns
+        window = self.history.window(ts_ns, WINDOW_RADIUS)
+        self._show_window(window)
+        if not window.complete:
+            self.run_worker(
+                self._load_window(ts_ns), group="audit-seek", exclusive=True
+            )
+
+    async def _load_window(self, ts_ns: int) -> None:
+        try:
+            window = await self.history.seek(ts_ns, WINDOW_RADIUS)
+        except TuiError as e:
+            self.notify(
+                f"Cannot load older events: {e.message}", severity="warning"
+            )
+            return
+        if self.at == ts_ns:
+            self._show_window(window)
+
+    def _show_window(self, window: TimeWindow) -> None:
+        table = self.query_one(DataTable)
+        table.clear()
+        # Oldest first, as in the live table
+        self._row_items = window.items[::-1]
+        render = self.rows.render
+        for e in self._row_items:
+            table.add_row(*render(e))
+        if self._row_items:
+            row = max(0, len(self._row_items) - 1 - window.anchor)
+            table.move_cursor(row=row, animate=False)
+        position = f"AT {format_ts(window.at)}"
+        if not window.complete:
+            position += " (older history not loaded)"
+        self.query_one("#audit-position", Label).update(position)
+
+    def action_export(self) -> None:
+        """Export the events held in the background, or cancel it."""
+        if self._export_worker is not None:
+            self._export_worker.cancel()
+            return
+        try:
+            export = AuditExport(
+                self.history.held(),
+                export_path(self.export_dir, self.export_format),
+                chunk_size=self.export_chunk_size,
+            )
+        except ValueError as e:
+            self.notify(str(e), severity="error")
+            return
+        self._export = export
+        self._export_timer = self.set_interval(
+            0.25, self._show_export_progress
+        )
+        self._export_worker = self.run_worker(
+            self._run_export(export), group="audit-export", exclusive=True
+        )
+
+    async def _run_export(self, export: AuditExport) -> None:
+        label = self.query_one("#audit-export", Label)
+        try:
+            path = await export.run()
+        except asyncio.CancelledError:
+            label.update("EXPORT CANCELLED")
+            raise
+        except (OSError, ValueError) as e:
+            label.update("EXPORT FAILED")
+            self.notify(f"Export failed: {e}", severity="error")
+        else:
+            label.update(f"EXPORTED {export.written:,}")
+            self.notify(f"Exported {export.written:,} events to {path}")
+        finally:
+            if self._export_timer is not None:
+                self._export_timer.stop()
+            self._export = None
+            self._export_timer = None
+            self._export_worker = None
+
+    def _show_export_progress(self) -> None:
+        export = self._export
+        if export is not None:
+            self.query_one("#audit-export", Label).update(
+                f"EXPORT {export.progress:.0%}"
+                f" ({export.done:,}/{export.total:,}) x cancels"
+            )
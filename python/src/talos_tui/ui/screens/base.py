@@ -0,0 +1,23 @@
+"""Shared screen base classes."""
+from __future__ import annotations
+
+from textual.screen import ModalScreen, Screen
+
+from talos_tui.core.telemetry import TELEMETRY
+
+
+class TimedScreen(Screen[None]):
+    """Screen that records its frame render time in telemetry."""
+
+    def _compositor_refresh(self) -> None:
+        # Textual's per-frame render + write for this screen (<1.0 API)
+        with TELEMETRY.timer("ui.frame"):
+            super()._compositor_refresh()
+
+
+class TimedModalScreen(ModalScreen[None]):
+    """Modal variant of TimedScreen."""
+
+    def _compositor_refresh(self) -> None:
+        with TELEMETRY.timer("ui.frame"):
+            super()._compositor_refresh()
@@ -1,11 +1,16 @@
 from __future__ import annotations
+from typing import Callable, Optional
+
 from textual.app import ComposeResult
-from textual.screen import Screen
 from textual.widgets import Header, Footer, Label, Digits
 from textual.containers import Grid, Container, Vertical, Horizontal
 from textual.reactive import reactive
 
-from talos_tui.core.state import StateStore, SourceState
+from talos_tui.core.state import StateStore, TuiEvent
+from talos_tui.ui.projections import (
+    DashboardView, HealthView, project_dashboard
+)
+from talos_tui.ui.screens.base import TimedScreen
 
 
 class MetricCard(Container):
@@ -33,10 +38,26 @@ class MetricCard(Container):
         self.value = val
 
 
-class StatusDashboard(Screen[None]):
+class StatusDashboard(TimedScreen):
+    """
+    Projection of the StateStore onto the dashboard widgets.
+    - Widget references are resolved once and cached.
+    - Refreshes are driven by store change notifications, coalesced to
+      one per message-loop turn.
+    - Only widgets whose projected value changed are touched.
+    """
+
     def __init__(self, store: StateStore):
         super().__init__()
         self.store = store
+        self.widget_updates = 0
+        self._view: Optional[DashboardView] = None
+        self._cards: dict[str, MetricCard] = {}
+        self._health: dict[str, Label] = {}
+        self._banner: Optional[Label] = None
+        self._validation: Optional[Label] = None
+        self._refresh_pending = False
+        self._unsubscribe: Optional[Callable[[], None]] = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -57,49 +78,78 @@ class StatusDashboard(Screen[None]):
                 yield Label(" | AUDIT: ", classes="health-label")
                 yield Label("UNKNOWN", id="audit-health-status")
 
+            with Horizontal(id="validation-bar"):
+                yield Label("VALIDATION: ", classes="health-label")
+                yield Label("", id="validation-status")
+
         yield Footer()
 
     def on_mount(self) -> None:
+        self._unsubscribe = self.store.subscribe(self._on_store_event)
+        self.refresh_view()
+        # Staleness depends on the clock, not on store events
         self.set_interval(1.0, self.refresh_view)
 
-    def refresh_view(self) -> None:
-        """Project current StateStore to UI"""
-        m = self.store.metrics
-        try:
-            self.query_one("#peers", MetricCard).update_value(
-                str(m.get("connected_peers", 0))
-            )
-            self.query_one("#sessions", MetricCard).update_value(
-                str(m.get("active_sessions", 0))
-            )
-            self.query_one("#p50", MetricCard).update_value(
-                f"{m.get('latency_p50_ms', 0.0):.1f}"
-            )
-            self.query_one("#p95", MetricCard).update_value(
-                f"{m.get('latency_p95_ms', 0.0):.1f}"
-            )
+    def on_unmount(self) -> None:
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
 
-            # Health indicators
-            self._update_health("gw-health-status", self.store.gateway)
-            self._update_health("audit-health-status", self.store.audit)
+    def _on_store_event(self, event: TuiEvent) -> None:
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.call_later(self.refresh_view)
 
-            # Stale banner
-            gw_age = self.store.get_stale_since("gateway")
-            if gw_age > 5.0 and gw_age != float('inf'):
-                banner = self.query_one("#stale-banner", Label)
-                banner.update(f"STALE DATA ({int(gw_age)}s old)")
-                banner.display = True
-            else:
-                self.query_one("#stale-banner", Label).display = False
+    def _bind_widgets(self) -> None:
+        for card_id in ("peers", "sessions", "p50", "p95"):
+            self._cards[card_id] = self.query_one(f"#{card_id}", MetricCard)
+        self._health["gateway"] = self.query_one("#gw-health-status", Label)
+        self._health["audit"] = self.query_one("#audit-health-status", Label)
+        self._validation = self.query_one("#validation-status", Label)
+        self._banner = self.query_one("#stale-banner", Label)
 
+    def refresh_view(self) -> None:
+        """Project current StateStore to UI"""
+        self._refresh_pending = False
+        try:
+            if self._banner is None:
+                self._bind_widgets()
         except Exception:
-            pass
-
-    def _update_health(self, widget_id: str, state: SourceState) -> None:
-        w = self.query_one(f"#{widget_id}", Label)
-        if state.health_ok:
-            w.update("ONLINE")
-            w.styles.color = "green"
-        else:
-            w.update("OFFLINE" if state.error else "PENDING")
-            w.styles.color = "red"
+            return
+
+        view = project_dashboard(self.store)
+        prev = self._view
+        if view == prev:
+            return
+        self._view = view
+
+        for card_id in ("peers", "sessions", "p50", "p95"):
+            value = getattr(view, card_id)
+            if prev is None or getattr(prev, card_id) != value:
+                self._cards[card_id].update_value(value)
+                self.widget_updates += 1
+
+        for source in ("gateway", "audit"):
+            health = getattr(view, source)
+            if prev is None or getattr(prev, source) != health:
+                self._update_health(self._health[source], health)
+
+        if prev is None or prev.stale_banner != view.stale_banner:
+            assert self._banner is not None
+            if view.stale_banner:
+                self._banner.update(view.stale_banner)
+            self._banner.display = view.stale_banner is not None
+            self.widget_updates += 1
+
+        if prev is None or prev.validation != view.validation:
+            assert self._validation is not None
+            bar = self._validation.parent
+            if view.validation is not None:
+                self._update_health(self._validation, view.validation)
+            if bar is not None:
+                bar.display = view.validation is not None
+
+    def _update_health(self, label: Label, health: HealthView) -> None:
+        label.update(health.text)
+        label.styles.color = health.color
+        self.widget_updates += 1
@@ -0,0 +1,115 @@
+"""Live performance overlay for the Talos TUI."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from rich.table import Table
+from rich.text import Text
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Container
+from textual.widgets import Label, Static
+
+from talos_tui.core.telemetry import TELEMETRY, Telemetry
+from talos_tui.ui.screens.base import TimedModalScreen
+
+PERF_DUMP_PATH = Path("talos-tui-perf.json")
+
+
+def render_telemetry(telemetry: Telemetry) -> Table:
+    """Render histograms and counters as a rich table."""
+    snap = telemetry.snapshot()
+    table = Table(expand=True, box=None, header_style="bold")
+    table.add_column("Metric")
+    table.add_column("Count", justify="right")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("p99 ms", justify="right")
+    table.add_column("Max ms", justify="right")
+
+    for name, h in snap["histograms"].items():
+        table.add_row(
+            name,
+            str(h["count"]),
+            f"{h['p50_ms']:.2f}",
+            f"{h['p95_ms']:.2f}",
+            f"{h['p99_ms']:.2f}",
+            f"{h['max_ms']:.2f}",
+        )
+    for name, value in snap["counters"].items():
+        table.add_row(name, str(value), "", "", "", "", style="dim")
+    return table
+
+
+def render_stalls(telemetry: Telemetry, limit: int = 5) -> Text:
+    """Summarize the most recent event-loop stalls, newest first."""
+    stalls = [e for e in telemetry.events if e["kind"] == "loop.stall"]
+    if not stalls:
+        return Text("No event-loop stalls recorded.")
+    lines = []
+    for stall in reversed(stalls[-limit:]):
+        frames = [f for f in stall["stack"].strip().splitlines() if f]
+        where = frames[-2].strip() if len(frames) >= 2 else stall["stack"]
+        lines.append(f"STALL {stall['duration_ms']:.0f}ms  {where}")
+    # Plain Text: stack lines may contain markup-like brackets
+    return Text("\n".join(lines))
+
+
+class PerfOverlay(TimedModalScreen):
+    """Overlay with live timings and recent event-loop stalls."""
+
+    DEFAULT_CSS = """
+    PerfOverlay {
+        align: center middle;
+    }
+    #perf-panel {
+        width: 90%;
+        height: 80%;
+        border: thick $primary;
+        background: $surface;
+        padding: 0 1;
+    }
+    #perf-table {
+        height: 1fr;
+    }
+    #perf-stalls {
+        height: auto;
+        max-height: 7;
+        color: $warning;
+    }
+    """
+
+    BINDINGS = [
+        Binding("escape,p", "dismiss", "Close"),
+        Binding("s", "dump", "Save JSON"),
+    ]
+
+    def __init__(self, telemetry: Telemetry = TELEMETRY):
+        super().__init__()
+        self.telemetry = telemetry
+
+    def compose(self) -> ComposeResult:
+        with Container(id="perf-panel"):
+            yield Label("PERFORMANCE  [p] close  [s] save JSON", classes="title")
+            yield Static(id="perf-table")
+            yield Static(id="perf-stalls")
+            yield Label("", id="perf-status")
+
+    def on_mount(self) -> None:
+        """Render now and then once per second."""
+        self.refresh_view()
+        self.set_interval(1.0, self.refresh_view)
+
+    def refresh_view(self) -> None:
+        """Re-render the metrics table."""
+        self.query_one("#perf-table", Static).update(
+            render_telemetry(self.telemetry)
+        )
+        self.query_one("#perf-stalls", Static).update(
+            render_stalls(self.telemetry)
+        )
+
+    def action_dump(self) -> None:
+        """Write a JSON snapshot for offline analysis."""
+        path = self.telemetry.dump_json(PERF_DUMP_PATH)
+        self.query_one("#perf-status", Label).update(f"Saved {path}")
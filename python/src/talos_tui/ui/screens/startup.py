@@ -2,15 +2,17 @@
 Startup screen for Talos TUI.
 """
 from __future__ import annotations
+from typing import Callable, Optional
+
 from textual.app import ComposeResult
-from textual.screen import Screen
 from textual.widgets import Label, LoadingIndicator, Button
 from textual.containers import Vertical, Horizontal, Container
 
-from talos_tui.core.state import StateStore, SourceState
+from talos_tui.core.state import StateStore, SourceState, TuiEvent
+from talos_tui.ui.screens.base import TimedScreen
 
 
-class StartupScreen(Screen[None]):
+class StartupScreen(TimedScreen):
     """
     StartupScreen:
     - Real-time status for Gateway and Audit.
@@ -53,6 +55,8 @@ class StartupScreen(Screen[None]):
     def __init__(self, store: StateStore):
         super().__init__()
         self.store = store
+        self._refresh_pending = False
+        self._unsubscribe: Optional[Callable[[], None]] = None
 
     def compose(self) -> ComposeResult:
         with Container(classes="startup-panel"):
@@ -82,11 +86,24 @@ class StartupScreen(Screen[None]):
                 yield Button("Quit", id="quit-btn", variant="error")
 
     def on_mount(self) -> None:
-        """Start status polling."""
-        self.set_interval(0.5, self.update_status)
+        """Follow store changes."""
+        self._unsubscribe = self.store.subscribe(self._on_store_event)
+        self.update_status()
+
+    def on_unmount(self) -> None:
+        """Stop following store changes."""
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def _on_store_event(self, event: TuiEvent) -> None:
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.call_later(self.update_status)
 
     def update_status(self) -> None:
         """Refresh UI from store state"""
+        self._refresh_pending = False
         self._update_source("gw-status", self.store.gateway)
         self._update_source("audit-status", self.store.audit)
 
@@ -5,6 +5,19 @@ import time
 import json
 import asyncio
 from pathlib import Path
+from typing import Any
+
+from talos_tui.core.state import (
+    AuditEventsReceived,
+    CircuitChanged,
+    ErrorOccurred,
+    HealthUpdated,
+    MetricsUpdated,
+    StateStore,
+    TuiEvent,
+    VersionUpdated,
+)
+from talos_tui.ui.screens.audit import AuditViewer
 
 
 # Mock Ingestion & Rendering
@@ -19,6 +32,375 @@ async def ingestion_simulation(rate_hz: int, duration_sec: int) -> float:
     return count / (time.time() - start)
 
 
+class _NullTable:
+    """DataTable stand-in so only the projection cost is measured."""
+
+    def add_row(self, *cells: Any, **kwargs: Any) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def scroll_end(self, **kwargs: Any) -> None:
+        pass
+
+
+def measure_audit_render(rows: int = 1000, resyncs: int = 20) -> dict[str, float]:
+    """Measure audit rows/sec for incremental appends and full resyncs."""
+    store = StateStore()
+    viewer = AuditViewer(store)
+    table = _NullTable()
+    viewer.query_one = lambda *a, **k: table  # type: ignore[method-assign]
+
+    outcomes = ["OK", "DENY", "ERROR"]
+    newest_first = [
+        {
+            "event_id": f"evt-{i}",
+            "ts": "2023-01-01T00:00:00Z",
+            "schema_id": "talos.login",
+            "outcome": outcomes[i % 3],
+        }
+        for i in reversed(range(rows))
+    ]
+
+    start = time.perf_counter()
+    for i in range(0, rows, 10):
+        store.audit_events = newest_first[rows - i - 10:]
+        viewer.refresh_view()
+    append_rate = rows / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(resyncs):
+        store.audit_events = []
+        viewer.refresh_view()
+        store.audit_events = newest_first
+        viewer.refresh_view()
+    resync_rate = rows * resyncs / (time.perf_counter() - start)
+
+    return {
+        "audit_append_rows_sec": append_rate,
+        "audit_resync_rows_sec": resync_rate,
+    }
+
+
+def _mixed_events(count: int) -> list[TuiEvent]:
+    """A poll-shaped event mix: mostly audit pages, some health/metrics."""
+    events: list[TuiEvent] = []
+    for i in range(count):
+        kind = i % 8
+        if kind == 0:
+            events.append(HealthUpdated(source="gateway", is_ok=True))
+        elif kind == 1:
+            events.append(VersionUpdated(
+                source="audit", version="1", contracts_version="1.0.0"
+            ))
+        elif kind == 2:
+            events.append(MetricsUpdated(metrics={"connected_peers": i}))
+        elif kind == 6:
+            events.append(CircuitChanged(
+                source="gateway",
+                endpoint="peers",
+                state="OPEN" if i % 16 == 6 else "CLOSED",
+            ))
+        elif kind == 7:
+            events.append(ErrorOccurred(
+                source="audit", kind="NETWORK", message="timeout"
+            ))
+        else:
+            events.append(AuditEventsReceived(
+                items=[{"event_id": f"evt-{i}-{j}"} for j in range(5)]
+            ))
+    return events
+
+
+def measure_reduce_throughput(
+    count: int = 100_000, batch: int = 100
+) -> dict[str, float]:
+    """Measure reduced events/sec, one at a time and in bursts."""
+    events = _mixed_events(count)
+
+    store = StateStore()
+    store.subscribe(lambda event: None)
+    start = time.perf_counter()
+    for event in events:
+        store.reduce(event)
+    single_rate = count / (time.perf_counter() - start)
+
+    store = StateStore()
+    store.subscribe(lambda event: None)
+    start = time.perf_counter()
+    for i in range(0, count, batch):
+        store.reduce_many(events[i:i + batch])
+    batch_rate = count / (time.perf_counter() - start)
+
+    return {
+        "reduce_events_sec": single_rate,
+        "reduce_many_events_sec": batch_rate,
+    }
+
+
+def _audit_page_items(count: int) -> list[dict[str, Any]]:
+    """Served audit items with a small, nested payload each."""
+    return [
+        {
+            "event_id": f"evt-{i}",
+            "ts": "2023-01-01T00:00:00Z",
+            "schema_id": "talos.session.open",
+            "outcome": "OK",
+            "payload": {
+                "peer_id": f"peer-{i % 500}",
+                "session": f"sess-{i}",
+                "capabilities": ["read", "write"],
+                "meta": {"region": "eu-west-1", "attempt": i % 3},
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def measure_audit_retention(count: int = 100_000) -> dict[str, float]:
+    """
+    Ingest and retain `count` audit events the eager way (payload
+    redacted and parsed into the model) and the lazy way (payload kept
+    raw), and compare the retained memory and ingest rate.
+    """
+    import tracemalloc
+    from pydantic import Field
+    from talos_tui.core.redaction import redact_dict, redact_value
+    from talos_tui.domain.models import AuditEvent, ViewModel
+
+    class EagerAuditEvent(ViewModel):
+        id: str = Field(alias="event_id")
+        ts: str
+        event_type: str = Field(alias="schema_id")
+        outcome: str = "OK"
+        payload: dict[str, Any] = Field(default_factory=dict)
+
+    served = _audit_page_items(count)
+    results: dict[str, float] = {}
+    for name, ingest in (
+        ("eager", lambda i: EagerAuditEvent(**redact_value(i)).model_dump()),
+        ("lazy", lambda i: AuditEvent(
+            **redact_dict(i, keep=("payload",))
+        ).model_dump()),
+    ):
+        start = time.perf_counter()
+        retained = [ingest(i) for i in served]
+        elapsed = time.perf_counter() - start
+        results[f"audit_ingest_events_sec_{name}"] = count / elapsed
+        del retained
+
+        tracemalloc.start()
+        retained = [ingest(i) for i in served]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[f"audit_retained_bytes_per_event_{name}"] = size / count
+        del retained
+    return results
+
+
+def measure_audit_ordering(
+    count: int = 100_000, late_every: int = 10
+) -> dict[str, float]:
+    """
+    Measure time-ordered audit inserts/sec when one event in
+    `late_every` arrives late (up to a minute behind), for the chunked
+    AuditLog and for a flat newest-first list kept sorted by insertion.
+    """
+    import bisect
+    import random
+    from talos_tui.core.auditlog import AuditLog, event_key
+
+    rng = random.Random(0)
+    items = []
+    for i in range(count):
+        late = rng.randrange(60_000) if i % late_every == 0 else 0
+        items.append({"event_id": f"evt-{i}", "ts_ns": (i - late) * 10**6})
+
+    results: dict[str, float] = {}
+    log = AuditLog()
+    start = time.perf_counter()
+    for item in items:
+        log.add((item,))
+    results["audit_ordered_inserts_sec_chunked"] = count / (
+        time.perf_counter() - start
+    )
+
+    flat: list[dict[str, Any]] = []
+    start = time.perf_counter()
+    for item in items:
+        flat.insert(bisect.bisect_left(flat, event_key(item), key=event_key),
+                    item)
+    results["audit_ordered_inserts_sec_flat"] = count / (
+        time.perf_counter() - start
+    )
+    assert list(log) == flat
+    return results
+
+
+def measure_rollups(count: int = 100_000) -> dict[str, float]:
+    """
+    Measure audit rollup ingest (events/sec, one failure in five) and
+    the cost of one analytics refresh, which reads only the rollups.
+    """
+    from talos_tui.core.rollups import AuditRollups
+    from talos_tui.ui.projections import project_analytics
+
+    outcomes = ("OK", "OK", "OK", "OK", "DENY")
+    items = [
+        {
+            "event_id": f"evt-{i}",
+            "ts_ns": i * 10**8,  # ten per second
+            "event_type": ("login", "logout", "config_change")[i % 3],
+            "outcome": outcomes[i % 5],
+            "payload_raw": f'{{"actor":"peer-{i % 50}","data":"x"}}',
+        }
+        for i in range(count)
+    ]
+    rollups = AuditRollups()
+    start = time.perf_counter()
+    rollups.add(items)
+    rate = count / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(100):
+        project_analytics(rollups)
+    refresh_ms = (time.perf_counter() - start) * 1000 / 100
+    return {
+        "rollup_ingest_events_sec": rate,
+        "analytics_refresh_ms": refresh_ms,
+    }
+
+
+async def measure_export(count: int = 100_000) -> dict[str, float]:
+    """
+    Measure a background gzip NDJSON export of `count` retained events:
+    events/sec, and the worst event-loop lag seen while it runs.
+    """
+    import tempfile
+    from talos_tui.core.auditlog import AuditLog
+    from talos_tui.core.export import AuditExport
+    from talos_tui.core.redaction import redact_dict
+    from talos_tui.domain.models import AuditEvent
+
+    log = AuditLog(
+        AuditEvent(**redact_dict(i, keep=("payload",))).model_dump()
+        for i in _audit_page_items(count)
+    )
+    worst = 0.0
+    running = True
+
+    async def ticker() -> None:
+        nonlocal worst
+        while running:
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            worst = max(worst, time.perf_counter() - start - 0.005)
+
+    tick = asyncio.create_task(ticker())
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        await AuditExport(log, Path(tmp) / "audit.ndjson.gz").run()
+        elapsed = time.perf_counter() - start
+    running = False
+    await tick
+    return {
+        "export_events_sec": count / elapsed,
+        "export_max_loop_lag_ms": worst * 1000,
+    }
+
+
+async def measure_running_to_dashboard(timeout: float = 30.0) -> float:
+    """Measure ms from the RUNNING transition to the dashboard being shown."""
+    from talos_tui.adapters.config import TuiConfig
+    from talos_tui.app import TalosTuiApp
+    from talos_tui.core.state import LifecycleChanged, TuiEvent
+    from talos_tui.ui.screens.dashboard import StatusDashboard
+
+    # Cold start (no snapshot) against the mock services
+    app = TalosTuiApp(TuiConfig(use_mock=True, state_path=""))
+    running_at: list[float] = []
+
+    def on_event(event: TuiEvent) -> None:
+        if isinstance(event, LifecycleChanged) and event.state == "RUNNING":
+            running_at.append(time.perf_counter())
+
+    app.store.subscribe(on_event)
+    async with app.run_test():
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if running_at and isinstance(app.screen, StatusDashboard):
+                return (time.perf_counter() - running_at[0]) * 1000
+            await asyncio.sleep(0)
+    raise TimeoutError("Dashboard was not shown after RUNNING")
+
+
+async def measure_hub_fanout(
+    clients: int = 50, events: int = 200, batch: int = 50
+) -> dict[str, float]:
+    """
+    Publish audit batches through a hub to `clients` attached subscribers
+    and measure delivery. Upstream polling happens once, in the hub,
+    whatever the number of clients.
+    """
+    import tempfile
+    from talos_tui.core.state import AuditEventsReceived, TuiEvent
+    from talos_tui.hub import Hub, HubClient
+
+    hub_store = StateStore()
+    with tempfile.TemporaryDirectory() as tmp:
+        hub = Hub(hub_store, Path(tmp) / "hub.sock", max_queue=events * 2)
+        await hub.start()
+        subs = [HubClient(StateStore(), hub.path) for _ in range(clients)]
+        tasks = [asyncio.create_task(c.run()) for c in subs]
+        await asyncio.gather(*(c.connected.wait() for c in subs))
+        while len(hub.subscribers) < clients or any(
+            c.applied < 1 for c in subs
+        ):
+            await asyncio.sleep(0.01)
+
+        sent: dict[float, float] = {}
+        latencies: list[float] = []
+
+        def on_event(event: TuiEvent) -> None:
+            latencies.append(time.perf_counter() - sent[event.timestamp])
+
+        for c in subs:
+            c.store.subscribe(on_event)
+
+        start = time.perf_counter()
+        for n in range(events):
+            event = AuditEventsReceived(
+                items=[
+                    {
+                        "event_id": f"evt-{n}-{i}",
+                        "ts": "2023-01-01T00:00:00Z",
+                        "schema_id": "talos.login",
+                        "payload": {"data": "x" * 256},
+                    }
+                    for i in range(batch)
+                ]
+            )
+            sent[event.timestamp] = time.perf_counter()
+            hub_store.reduce(event)
+            await asyncio.sleep(0)
+        while any(c.applied < events + 1 for c in subs):
+            await asyncio.sleep(0.005)
+        elapsed = time.perf_counter() - start
+
+        for t in tasks:
+            t.cancel()
+        await hub.stop()
+
+    latencies.sort()
+    return {
+        "hub_clients": clients,
+        "hub_deliveries_sec": clients * events / elapsed,
+        "hub_delivery_p50_ms": latencies[len(latencies) // 2] * 1000,
+        "hub_delivery_p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+    }
+
+
 async def measure_perf() -> dict[str, float | str]:
     """Run performance simulation and output metrics."""
     print("Running TUI Performance Budget Check...")
@@ -40,6 +422,30 @@ async def measure_perf() -> dict[str, float | str]:
         "status": "PASS" if p95_latency_ms < 100 else "FAIL"
     }
 
+    # 4. Audit table projection
+    metrics.update(measure_audit_render())
+
+    # 5. Reducer throughput
+    metrics.update(measure_reduce_throughput())
+
+    # 6. Audit payload retention
+    metrics.update(measure_audit_retention())
+
+    # 7. Late audit arrivals
+    metrics.update(measure_audit_ordering())
+
+    # 8. Audit analytics rollups
+    metrics.update(measure_rollups())
+
+    # 9. Background audit export
+    metrics.update(await measure_export())
+
+    # 10. Startup navigation
+    metrics["running_to_dashboard_ms"] = await measure_running_to_dashboard()
+
+    # 11. Shared collector fan-out
+    metrics.update(await measure_hub_fanout())
+
     # Output artifact
     artifact_dir = Path(__file__).parent.parent / "artifacts" / "perf"
     artifact_dir.mkdir(parents=True, exist_ok=True)
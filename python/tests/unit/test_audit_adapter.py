@@ -2,6 +2,8 @@ import pytest
 from unittest.mock import AsyncMock
 from aiohttp import ClientSession, ClientResponse
 from talos_tui.adapters.audit_http import HttpAuditAdapter
+from talos_tui.core.redaction import audit_payload
+from talos_tui.core.state import AuditEventsReceived, StateStore
 from talos_tui.ports.errors import TuiError
 
 @pytest.mark.asyncio
@@ -35,7 +37,7 @@ async def test_audit_list_events_success() -> None:
 
 @pytest.mark.asyncio
 async def test_audit_redaction_applied() -> None:
-    """Verify secrets are redacted before domain model creation."""
+    """Verify payload secrets are redacted whenever the payload is read."""
     mock_resp = AsyncMock(spec=ClientResponse)
     mock_resp.status = 200
     mock_resp.content_length = 1000
@@ -56,4 +58,39 @@ async def test_audit_redaction_applied() -> None:
     adapter = HttpAuditAdapter("http://test", mock_session)
     page = await adapter.list_events(limit=10, before=None)
     
-    assert page.items[0].payload["token"] == "***REDACTED***"
+    item = page.items[0].model_dump()
+    # Kept raw (unparsed) in memory, redacted on access
+    assert "sensitive_value" in item["payload_raw"]
+    assert audit_payload(item) == {"token": "***REDACTED***"}
+
+    # ...and whenever it leaves the process
+    event = AuditEventsReceived(items=[item])
+    assert "sensitive_value" not in str(event.to_dict())
+    store = StateStore()
+    store.reduce(event)
+    assert "sensitive_value" not in str(store.snapshot())
+
+
+@pytest.mark.asyncio
+async def test_event_details_share_one_route() -> None:
+    mock_resp = AsyncMock(spec=ClientResponse)
+    mock_resp.status = 503
+    mock_resp.headers = {}
+    mock_session = AsyncMock(spec=ClientSession)
+    mock_session.request.return_value.__aenter__.return_value = mock_resp
+
+    adapter = HttpAuditAdapter(
+        "http://test", mock_session, max_attempts=1,
+        circuit_failure_threshold=3,
+    )
+    for i in range(3):
+        with pytest.raises(TuiError):
+            await adapter.get_event(f"evt_{i}")
+    # Each id is fetched from its own URL...
+    urls = [str(c.args[1]) for c in mock_session.request.call_args_list]
+    assert urls[-1] == "http://test/api/events/evt_2"
+    # ...but they share one breaker, which their failures trip
+    assert list(adapter.circuit_states()) == ["api/events/{id}"]
+    with pytest.raises(TuiError) as exc:
+        await adapter.get_event("evt_3")
+    assert exc.value.kind == "CIRCUIT_OPEN"
@@ -0,0 +1,85 @@
+import random
+
+from talos_tui.core import auditlog
+from talos_tui.core.auditlog import AuditLog
+from talos_tui.core.state import AuditEventsReceived, StateStore
+from talos_tui.domain.models import AuditEvent
+from talos_tui.domain.timestamps import NS, format_ts, parse_ts
+
+BASE = parse_ts("2024-03-01T12:00:00Z")
+
+
+def item(i: int, ts_ns: int = 0) -> dict:
+    return {"event_id": f"e{i}", "ts_ns": ts_ns or BASE + i * NS}
+
+
+def ids(log: AuditLog) -> list:
+    return [e["event_id"] for e in log]
+
+
+def test_audit_event_parses_ts_and_interns_labels() -> None:
+    a, b = (
+        AuditEvent(
+            event_id=eid, ts="2024-03-01T14:00:00+02:00",
+            schema_id="".join(["log", "in"]),
+        )
+        for eid in ("a", "b")
+    )
+    assert a.ts_ns == BASE
+    assert a.event_type is b.event_type
+    assert AuditEvent(event_id="c", ts="soon", schema_id="x").ts_ns == 0
+
+
+def test_late_arrivals_land_in_time_order(monkeypatch) -> None:
+    monkeypatch.setattr(auditlog, "CHUNK_SIZE", 4)
+    order = list(range(100))
+    random.Random(7).shuffle(order)
+    log = AuditLog()
+    for i in order:
+        log.add([item(i)])
+    assert ids(log) == [f"e{i}" for i in range(99, -1, -1)]
+    assert len(log._chunks) > 1
+    assert log.late > 0
+    assert log[0]["event_id"] == "e99" and log[-1]["event_id"] == "e0"
+    assert log[10:13] == [item(i) for i in (89, 88, 87)]
+    assert log.index_at(BASE + 50 * NS + 1) == 49
+    assert log.index_at(BASE - 1) == 100
+    assert log.index_at(BASE + 200 * NS) == 0
+
+
+def test_ties_keep_arrival_order_and_ids_are_unique() -> None:
+    log = AuditLog([item(1, BASE), item(2, BASE)])
+    assert log.add([item(3, BASE), item(1, BASE)]) == [item(3, BASE)]
+    # A later batch comes first; within a batch, the order received
+    assert ids(log) == ["e3", "e1", "e2"]
+    assert log == [item(3, BASE), item(1, BASE), item(2, BASE)]
+
+
+def test_trim_bounds_the_id_index(monkeypatch) -> None:
+    monkeypatch.setattr(auditlog, "CHUNK_SIZE", 2)
+    log = AuditLog([item(i) for i in range(9, -1, -1)])
+    log.trim(3)
+    assert ids(log) == ["e9", "e8", "e7"]
+    assert len(log._ids) == 3 and not log.has("e0")
+    # A trimmed id is accepted again
+    log.add([item(0)])
+    assert ids(log) == ["e9", "e8", "e7", "e0"]
+
+
+def test_store_orders_out_of_order_pages() -> None:
+    store = StateStore(max_audit_events=3)
+
+    def page(*seconds: int) -> AuditEventsReceived:
+        return AuditEventsReceived(items=[
+            AuditEvent(
+                event_id=f"e{s}", ts=format_ts(BASE + s * NS),
+                schema_id="login",
+            ).model_dump()
+            for s in seconds
+        ])
+
+    store.reduce(page(5, 1))
+    store.reduce(page(3))  # late
+    store.reduce(page(9))
+    assert [e["id"] for e in store.audit_events] == ["e9", "e5", "e3"]
+    assert store.has_audit_event("e3") and not store.has_audit_event("e1")
@@ -0,0 +1,102 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from aiohttp import ClientResponse, ClientSession
+
+from talos_tui.adapters.auth import CachedTokenAuth, Token, command_source
+from talos_tui.adapters.gateway_http import HttpGatewayAdapter
+from talos_tui.ports.errors import TuiError
+
+
+class _Issuer:
+    """Token source that counts calls and can be told to fail."""
+
+    def __init__(self, lifetime: float = 100.0) -> None:
+        self.calls = 0
+        self.lifetime = lifetime
+        self.fail = False
+
+    async def __call__(self) -> Token:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise ConnectionError("issuer down")
+        return Token(f"t{self.calls}", self.lifetime)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_refresh() -> None:
+    issuer = _Issuer()
+    auth = CachedTokenAuth(issuer)
+
+    results = await asyncio.gather(
+        *(auth.acquire_headers() for _ in range(10))
+    )
+
+    assert issuer.calls == 1
+    assert all(r == {"Authorization": "Bearer t1"} for r in results)
+    await auth.acquire_headers()
+    assert issuer.calls == 1  # cached
+
+
+@pytest.mark.asyncio
+async def test_refresh_ahead_serves_cached_token() -> None:
+    now = [0.0]
+    issuer = _Issuer(lifetime=100.0)
+    auth = CachedTokenAuth(issuer, refresh_ahead=10.0, clock=lambda: now[0])
+    await auth.acquire_headers()
+
+    now[0] = 95.0  # inside the refresh-ahead window
+    assert await auth.acquire_headers() == {"Authorization": "Bearer t1"}
+    await asyncio.sleep(0.02)
+    assert issuer.calls == 2
+    assert auth.auth_headers() == {"Authorization": "Bearer t2"}
+
+    # A failed background refresh keeps the valid token
+    now[0] = 190.0
+    issuer.fail = True
+    assert auth.auth_headers() == {"Authorization": "Bearer t2"}
+    await asyncio.sleep(0.02)
+    assert issuer.calls == 3
+    assert auth.auth_headers() == {"Authorization": "Bearer t2"}
+
+    now[0] = 200.0  # expired: callers wait and see the failure
+    with pytest.raises(TuiError) as exc:
+        await auth.acquire_headers()
+    assert exc.value.kind == "NETWORK"
+
+
+@pytest.mark.asyncio
+async def test_adapter_sends_token_and_refreshes_after_401() -> None:
+    denied = AsyncMock(spec=ClientResponse)
+    denied.status = 401
+    denied.headers = {}
+    ok = AsyncMock(spec=ClientResponse)
+    ok.status = 200
+    ok.content_length = 100
+    ok.headers = {}
+    ok.json.return_value = {"status": "ok"}
+    session = AsyncMock(spec=ClientSession)
+    session.request.return_value.__aenter__.side_effect = [denied, ok]
+
+    issuer = _Issuer()
+    adapter = HttpGatewayAdapter(
+        "http://test", session, auth=CachedTokenAuth(issuer)
+    )
+    health = await adapter.get_health()
+
+    assert health.ok()
+    assert issuer.calls == 2
+    sent = [c.kwargs["headers"] for c in session.request.call_args_list]
+    assert sent[0]["Authorization"] == "Bearer t1"
+    assert sent[1]["Authorization"] == "Bearer t2"
+    assert sent[1]["User-Agent"].startswith("talos-tui/")
+
+
+@pytest.mark.asyncio
+async def test_command_source_parses_json() -> None:
+    fetch = command_source(
+        "echo '{\"access_token\": \"abc\", \"expires_in\": 30}'"
+    )
+    assert await fetch() == Token("abc", 30.0)
@@ -0,0 +1,63 @@
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+import pytest
+
+from talos_tui.adapters.config import LayeredConfig, TuiConfig
+from talos_tui.cli import main
+
+
+def test_layers_apply_in_order(tmp_path: Path) -> None:
+    path = tmp_path / "config.toml"
+    path.write_text(
+        'poll_interval = 5.0\naudit_ring_size = 500\n'
+        'gateway_url = "http://file:8000"\n'
+    )
+    env = {
+        "TALOS_TUI_POLL_INTERVAL": "0.5",
+        "TALOS_GATEWAY_URL": "http://env:8000",
+        "TALOS_TUI_MOCK": "1",
+    }
+    layered = LayeredConfig(
+        path, environ=env, overrides={"gateway_url": "http://cli:8000"}
+    )
+    config = layered.config
+
+    assert config.audit_ring_size == 500  # file
+    assert config.poll_interval == 0.5  # env beats file
+    assert config.gateway_url == "http://cli:8000"  # CLI beats env
+    assert config.use_mock is True
+    assert config.total_timeout == TuiConfig().total_timeout
+    assert layered.config is config  # resolved once
+
+    assert layered.sources["poll_interval"] == "env TALOS_TUI_POLL_INTERVAL"
+    assert layered.load_config_readonly()["audit_ring_size"] == "500"
+    presence = layered.inspect_env_presence()
+    assert presence["TALOS_GATEWAY_URL"] is True
+    assert presence["TALOS_AUDIT_URL"] is False
+
+    with pytest.raises(FrozenInstanceError):
+        config.poll_interval = 1.0  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        layered.load_config_readonly()["poll_interval"] = "1"  # type: ignore
+
+
+def test_invalid_settings_fail_fast(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unknown config field"):
+        TuiConfig().with_overrides({"pol_interval": "1"})
+    with pytest.raises(ValueError, match="poll_interval"):
+        TuiConfig().with_overrides({"poll_interval": "fast"})
+    with pytest.raises(ValueError, match="must be positive"):
+        TuiConfig(audit_page_size=0)
+    with pytest.raises(ValueError, match="Cannot read config"):
+        _ = LayeredConfig(tmp_path / "missing.toml", environ={}).config
+
+
+def test_print_config(capsys: pytest.CaptureFixture[str]) -> None:
+    main([
+        "--print-config", "--set", "pool_limit=8", "--set", "auth_token=s3"
+    ])
+    out = capsys.readouterr().out
+    assert "pool_limit = 8  # cli" in out
+    assert 'auth_token = "***REDACTED***"  # cli' in out
+    assert "max_response_size = 1000000  # " in out
@@ -0,0 +1,127 @@
+import json
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+from talos_tui.adapters.config import TuiConfig
+from talos_tui.core.contracts import (
+    ContractBundle,
+    ContractValidator,
+    ValidationPolicy,
+    find_contracts_root,
+    preload_contracts,
+)
+from talos_tui.ports.errors import TuiError
+from talos_tui.runtime import Runtime
+from talos_tui.ui.projections import project_validation
+
+
+def _write_contracts(root: Path) -> Path:
+    schemas = root / "contracts" / "schemas"
+    (schemas / "common").mkdir(parents=True)
+    (schemas / "audit").mkdir()
+    (schemas / "common" / "id.schema.json").write_text(json.dumps({
+        "type": "string", "minLength": 1,
+    }))
+    (schemas / "audit" / "audit_event.schema.json").write_text(json.dumps({
+        "type": "object",
+        "required": ["event_id"],
+        "properties": {"event_id": {"$ref": "../common/id.schema.json"}},
+    }))
+    return schemas.parent
+
+
+@pytest.mark.asyncio
+async def test_bundle_preloads_and_validates(tmp_path: Path) -> None:
+    root = _write_contracts(tmp_path)
+    assert find_contracts_root(start=[root / "schemas" / "audit"]) == root
+
+    validator = await preload_contracts(root, tmp_path / "cache")
+    validator.validate("audit/audit_event.schema.json", {"event_id": "e1"})
+    with pytest.raises(jsonschema.ValidationError):
+        validator.validate("audit/audit_event.schema.json", {"event_id": ""})
+
+
+def test_bundle_cache_is_reused_until_schemas_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    schemas = _write_contracts(tmp_path) / "schemas"
+    cache = tmp_path / "cache"
+    first = ContractBundle.load(schemas, cache)
+
+    parses = []
+    original = ContractBundle._parse.__func__  # type: ignore[attr-defined]
+
+    def counting(cls, *args):  # type: ignore[no-untyped-def]
+        parses.append(1)
+        return original(cls, *args)
+
+    monkeypatch.setattr(ContractBundle, "_parse", classmethod(counting))
+    assert ContractBundle.load(schemas, cache).digest == first.digest
+    assert not parses
+
+    (schemas / "common" / "id.schema.json").write_text(
+        json.dumps({"type": "string", "maxLength": 64})
+    )
+    assert ContractBundle.load(schemas, cache).digest != first.digest
+    assert parses == [1]
+
+
+def test_missing_or_invalid_schemas_fail_fast(tmp_path: Path) -> None:
+    schemas = _write_contracts(tmp_path) / "schemas"
+    with pytest.raises(TuiError, match="Required schemas missing"):
+        ContractBundle.load(schemas, required=["gateway/peer.schema.json"])
+
+    (schemas / "audit" / "broken.schema.json").write_text("{")
+    with pytest.raises(TuiError) as exc:
+        ContractBundle.load(schemas)
+    assert exc.value.kind == "CONTRACT"
+
+
+@pytest.mark.asyncio
+async def test_live_runtime_without_contracts_is_fatal(tmp_path: Path) -> None:
+    runtime = Runtime(TuiConfig(
+        contracts_root=str(tmp_path / "missing"), state_path=""
+    ))
+    with pytest.raises(TuiError):
+        await runtime.start()
+    await runtime.stop()
+    assert runtime.store.lifecycle == "FATAL"
+    assert "schemas not found" in (runtime.store.global_error or "")
+
+
+def test_sampled_policy_validates_new_schemas_and_escalates(
+    tmp_path: Path,
+) -> None:
+    schemas = _write_contracts(tmp_path) / "schemas"
+    validator = ContractValidator.from_bundle(ContractBundle.load(schemas))
+    now = [0.0]
+    policy = ValidationPolicy(
+        "sampled", sample_every=10, escalation_seconds=60,
+        clock=lambda: now[0],
+    )
+    path = "audit/audit_event.schema.json"
+
+    for n in range(20):
+        schema_id = "logout" if n == 14 else "login"
+        item = {"event_id": f"e{n}", "schema_id": schema_id}
+        policy.check(validator, path, item)
+    # First "login", every 10th item, and the first "logout"
+    assert (policy.validated, policy.skipped) == (4, 16)
+
+    # The structural check still catches a missing field...
+    with pytest.raises(jsonschema.ValidationError):
+        policy.check(validator, path, {"schema_id": "login"})
+    assert policy.failed == 1 and policy.effective_mode == "full"
+    # ...and full validation catches what it cannot
+    with pytest.raises(jsonschema.ValidationError):
+        policy.check(validator, path, {"event_id": "", "schema_id": "login"})
+
+    now[0] = 61.0
+    assert policy.effective_mode == "sampled"
+    stats = policy.stats()
+    assert stats["failed"] == 2 and stats["validated"] == 4
+    view = project_validation(stats)
+    assert view is not None and view.color == "red"
+    assert "SAMPLED 1/10" in view.text and "2 failed" in view.text
@@ -1,7 +1,16 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 
-from talos_tui.core.state import StateStore, HealthUpdated, ErrorOccurred # type: ignore[import-not-found, import-untyped]
+from talos_tui.core.state import (  # type: ignore[import-not-found, import-untyped]
+    StateStore,
+    HealthUpdated,
+    ErrorOccurred,
+    AuditEventsReceived,
+    EventBatch,
+    MetricsUpdated,
+    TuiEvent,
+    event_from_dict,
+)
 from talos_tui.core.coordinator import Coordinator, TuiState # type: ignore[import-not-found, import-untyped]
 from talos_tui.ports.errors import TuiError # type: ignore[import-not-found, import-untyped]
 
@@ -25,6 +34,49 @@ class TestStateStore:
         assert store.is_fatal is True
         assert store.global_error and "403 Forbidden" in store.global_error
 
+    def test_listeners_notified_after_reduce(self) -> None:
+        store = StateStore()
+        seen = []
+        unsubscribe = store.subscribe(
+            lambda e: seen.append((e, store.gateway.health_ok))
+        )
+        event = HealthUpdated(source="gateway", is_ok=True)
+        store.reduce(event)
+        assert seen == [(event, True)]
+
+        unsubscribe()
+        store.reduce(event)
+        assert len(seen) == 1
+
+    def test_audit_items_are_deduplicated(self) -> None:
+        store = StateStore()
+        store.reduce(AuditEventsReceived(items=[{"id": "b"}, {"id": "a"}]))
+        store.reduce(AuditEventsReceived(items=[{"id": "c"}, {"id": "b"}]))
+        assert [e["id"] for e in store.audit_events] == ["c", "b", "a"]
+
+    def test_reduce_many_notifies_once(self) -> None:
+        store = StateStore()
+        seen = []
+        store.subscribe(seen.append)
+        store.reduce_many([
+            AuditEventsReceived(items=[{"id": "a"}], next_cursor="a"),
+            MetricsUpdated(metrics={"connected_peers": 3}),
+            HealthUpdated(source="audit", is_ok=True),
+            AuditEventsReceived(items=[{"id": "b"}], next_cursor="b"),
+        ])
+
+        assert len(seen) == 1 and isinstance(seen[0], EventBatch)
+        assert event_from_dict(seen[0].to_dict()) == seen[0]
+        assert [e["id"] for e in store.audit_events] == ["b", "a"]
+        assert store.audit_cursor == "b"
+        assert store.metrics == {"connected_peers": 3}
+        assert store.audit.health_ok is True
+
+    def test_unknown_events_are_ignored(self) -> None:
+        store = StateStore()
+        store.reduce(TuiEvent())
+        assert store.lifecycle == "BOOT"
+
 @pytest.mark.asyncio
 class TestCoordinator:
     async def test_max_attempts_leads_to_fatal(self) -> None:
@@ -0,0 +1,156 @@
+import asyncio
+import json
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import ClientResponse, ClientSession
+
+from talos_tui.adapters.audit_http import HttpAuditAdapter
+from talos_tui.adapters.mock import (
+    LoadGenerator, LoadProfile, MockAuditAdapter
+)
+from talos_tui.core.details import AuditDetailCache, is_complete
+from talos_tui.core.state import StateStore
+from talos_tui.domain.models import AuditEvent
+from talos_tui.ports.errors import TuiError
+from talos_tui.ui.screens.audit import AuditViewer
+
+
+def _summary(eid: str) -> dict:
+    # As the coordinator stores an event listed without its payload
+    return AuditEvent(event_id=eid, ts="2023", schema_id="login").model_dump()
+
+
+def _fetcher(calls: List[str], delay: float = 0.0):
+    async def fetch(event_id: str) -> AuditEvent:
+        calls.append(event_id)
+        await asyncio.sleep(delay)
+        return AuditEvent(
+            event_id=event_id, ts="2023", schema_id="login",
+            payload={"password": "hunter2", "peer": "p1"},
+        )
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_local_events_are_materialized_without_fetching() -> None:
+    calls: List[str] = []
+    cache = AuditDetailCache(_fetcher(calls))
+    item = AuditEvent(
+        event_id="e1", ts="2023", schema_id="login",
+        payload={"token": "abc", "peer": "p1"},
+    ).model_dump()
+
+    detail = cache.resolve(item)
+    assert detail is not None
+    assert detail["payload"] == {"token": "***REDACTED***", "peer": "p1"}
+    assert cache.resolve(item) is detail  # LRU hit, not re-parsed
+    assert await cache.get(item) is detail
+    cache.prefetch([item])
+    assert calls == []
+
+    # An event served with an empty payload is complete too
+    empty = AuditEvent(
+        event_id="e2", ts="2023", schema_id="login", payload={}
+    ).model_dump()
+    assert is_complete(empty) and not is_complete(_summary("e3"))
+    detail = cache.resolve(empty)
+    assert detail is not None and detail["payload"] == {}
+
+
+@pytest.mark.asyncio
+async def test_summaries_are_fetched_once_and_prefetched() -> None:
+    calls: List[str] = []
+    cache = AuditDetailCache(_fetcher(calls, delay=0.01), max_entries=2)
+
+    # Concurrent requests share one fetch
+    first, second = await asyncio.gather(
+        cache.get(_summary("e1")), cache.get(_summary("e1"))
+    )
+    assert first is second and calls == ["e1"]
+    assert first["payload"]["password"] == "***REDACTED***"
+
+    # Neighbours are warmed in the background
+    cache.prefetch([_summary("e1"), _summary("e2"), _summary("e3")])
+    await asyncio.sleep(0.05)
+    assert calls == ["e1", "e2", "e3"]
+    assert cache.resolve(_summary("e3")) is not None
+    # ...within the LRU bound
+    assert len(cache) == 2 and cache.resolve(_summary("e1")) is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_failures_surface_and_are_not_prefetched_again() -> None:
+    fetch = AsyncMock(side_effect=TuiError(kind="NETWORK", message="down"))
+    cache = AuditDetailCache(fetch)
+    cache.prefetch([_summary("e1")])
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    cache.prefetch([_summary("e1")])
+    assert fetch.await_count == 1
+    with pytest.raises(TuiError):
+        await cache.get(_summary("e1"))
+    assert fetch.await_count == 2
+
+    with pytest.raises(TuiError) as e:
+        await AuditDetailCache().get(_summary("e1"))
+    assert e.value.kind == "NOT_READY"
+
+
+@pytest.mark.asyncio
+async def test_http_get_event_keeps_payload_raw() -> None:
+    mock_resp = AsyncMock(spec=ClientResponse)
+    mock_resp.status = 200
+    mock_resp.content_length = 100
+    mock_resp.json.return_value = {
+        "event_id": "evt 1", "ts": "2023", "schema_id": "login",
+        "payload": {"secret": "s3"},
+    }
+    session = AsyncMock(spec=ClientSession)
+    session.request.return_value.__aenter__.return_value = mock_resp
+
+    adapter = HttpAuditAdapter("http://test", session)
+    event = await adapter.get_event("evt 1")
+    assert str(session.request.call_args[0][1]).endswith("api/events/evt%201")
+    assert json.loads(event.payload_raw) == {"secret": "s3"}
+    with pytest.raises(TuiError):
+        await adapter.get_event("../peers")
+
+
+@pytest.mark.asyncio
+async def test_mock_get_event() -> None:
+    now = [0.0]
+    generator = LoadGenerator(
+        LoadProfile(event_rate=10, seed=1), clock=lambda: now[0]
+    )
+    adapter = MockAuditAdapter(generator)
+    now[0] = 1.0
+    page = await adapter.list_events(limit=5)
+    event = await adapter.get_event(page.items[2].id)
+    assert event == page.items[2]
+    with pytest.raises(TuiError):
+        await adapter.get_event("evt-999999999999")
+
+
+def test_audit_viewer_shows_local_detail_immediately() -> None:
+    store = StateStore()
+    store.audit_events = [
+        AuditEvent(
+            event_id=f"e{i}", ts="2023", schema_id="login",
+            payload={"n": i},
+        ).model_dump()
+        for i in range(3)
+    ]
+    details = AuditDetailCache(AsyncMock())
+    audit = AuditViewer(store, details)
+    assert audit.details is details
+    widget = MagicMock()
+    audit.query_one = MagicMock(return_value=widget)  # type: ignore[method-assign]
+    audit.refresh_view()
+
+    # Rows are oldest first; row 0 is e2
+    audit.show_detail(0)
+    text = widget.update.call_args[0][0]
+    assert "e2" in text and '"n": 2' in text
+    details.fetch.assert_not_called()
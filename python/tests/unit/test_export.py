@@ -0,0 +1,95 @@
+import asyncio
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from talos_tui.adapters.config import TuiConfig
+from talos_tui.core.export import AuditExport, export_format, export_path
+from talos_tui.domain.models import AuditEvent
+
+
+def _items(count: int) -> list:
+    return [
+        AuditEvent(
+            event_id=f"e{i}", ts=f"2024-03-01T12:00:{i % 60:02d}Z",
+            schema_id="login", outcome="DENY" if i % 2 else "OK",
+            payload={"password": "hunter2", "peer": f"p{i}"},
+        ).model_dump()
+        for i in range(count, 0, -1)
+    ]
+
+
+def test_export_format_from_suffix(tmp_path: Path) -> None:
+    assert export_format(tmp_path / "a.ndjson.gz") == "ndjson.gz"
+    assert export_format(tmp_path / "a.parquet") == "parquet"
+    with pytest.raises(ValueError):
+        export_format(tmp_path / "a.csv")
+    assert export_path("out", "ndjson.zst").name.endswith(".ndjson.zst")
+    with pytest.raises(ValueError):
+        TuiConfig(export_format="csv")
+
+
+@pytest.mark.asyncio
+async def test_export_writes_redacted_ndjson_in_chunks(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "audit.ndjson.gz"
+    export = AuditExport(
+        _items(25), path, chunk_size=10,
+        match=lambda item: item["outcome"] == "DENY",
+    )
+    assert await export.run() == path
+    assert (export.done, export.total, export.written) == (25, 25, 13)
+    assert export.progress == 1.0
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["event_id"] for r in records[:2]] == ["e25", "e23"]
+    assert records[0]["payload"] == {
+        "password": "***REDACTED***", "peer": "p25"
+    }
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.asyncio
+async def test_cancelled_export_leaves_no_file(tmp_path: Path) -> None:
+    export = AuditExport(
+        _items(5000), tmp_path / "audit.ndjson.gz", chunk_size=10
+    )
+    task = asyncio.ensure_future(export.run())
+    # The loop runs between chunks
+    while export.done < 20:
+        await asyncio.sleep(0.001)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert 0 < export.done < export.total
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_missing_optional_codec_is_reported(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    with pytest.raises(ValueError, match="zstandard"):
+        await AuditExport(_items(1), tmp_path / "a.ndjson.zst").run()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_parquet_export_has_one_column_per_field(
+    tmp_path: Path,
+) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "audit.parquet"
+    await AuditExport(_items(3), path, chunk_size=2).run()
+    table = pq.read_table(path)
+    assert table.column_names == [
+        "event_id", "ts", "schema_id", "outcome", "payload"
+    ]
+    assert table.column("event_id").to_pylist() == ["e3", "e2", "e1"]
+    assert "hunter2" not in table.column("payload").to_pylist()[0]
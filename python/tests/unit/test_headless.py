@@ -0,0 +1,123 @@
+import asyncio
+import io
+import json
+import stat
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from talos_tui.adapters.config import TuiConfig
+from talos_tui.adapters.mock import LoadProfile
+from talos_tui.core.state import HealthUpdated, StateStore
+from talos_tui.headless import NdjsonSink, SnapshotServer, run_headless
+from talos_tui.ports.errors import TuiError
+from talos_tui.runtime import Runtime
+
+
+def test_headless_entry_point_does_not_import_textual() -> None:
+    code = (
+        "import sys, talos_tui.cli, talos_tui.headless; "
+        "bad = [m for m in sys.modules if m.split('.')[0] in "
+        "('textual', 'rich')]; "
+        "assert not bad, bad"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_ndjson_sink_writes_one_line_per_event() -> None:
+    store = StateStore()
+    out = io.StringIO()
+    sink = NdjsonSink(out)
+    store.subscribe(sink)
+    store.reduce(HealthUpdated(source="gateway", is_ok=True, status_msg="OK"))
+    sink.close()
+
+    line = json.loads(out.getvalue())
+    assert line["type"] == "HealthUpdated"
+    assert line["source"] == "gateway" and line["is_ok"] is True
+
+
+class _BlockedStream(io.StringIO):
+    """An output the loop must never wait on: blocks until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.entered.set()
+        self.release.wait(5)
+        self.writes += 1
+        return super().write(s)
+
+
+def test_ndjson_sink_writes_off_the_caller_in_batches() -> None:
+    out = _BlockedStream()
+    sink = NdjsonSink(out, max_queue=5)
+    event = HealthUpdated(source="gateway", is_ok=True, status_msg="OK")
+    sink(event)
+    assert out.entered.wait(5)
+    for _ in range(8):
+        sink(event)  # returns at once though the output is stuck
+    out.release.set()
+    sink.close()
+
+    # The writer was stuck on the first line; 5 more queued, 3 dropped
+    assert (sink.written, sink.dropped) == (6, 3)
+    assert out.writes == 2
+    assert len(out.getvalue().splitlines()) == 6
+
+
+@pytest.mark.asyncio
+async def test_snapshot_server_never_takes_over_its_path(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "talos.sock"
+    path.write_text("keep me")
+    with pytest.raises(TuiError, match="not a socket"):
+        await SnapshotServer(StateStore(), path).start()
+    assert path.read_text() == "keep me"
+
+    path.unlink()
+    server = SnapshotServer(StateStore(), path)
+    await server.start()
+    try:
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        with pytest.raises(TuiError, match="another server"):
+            await SnapshotServer(StateStore(), path).start()
+    finally:
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_collector_streams_and_serves_snapshots(tmp_path: Path) -> None:
+    out = io.StringIO()
+    sock = tmp_path / "talos.sock"
+    runtime = Runtime(
+        TuiConfig(state_path=""),
+        load_profile=LoadProfile(event_rate=1000, seed=1),
+    )
+    stop = asyncio.Event()
+    task = asyncio.create_task(run_headless(runtime, out, sock, stop))
+
+    for _ in range(100):
+        if runtime.store.lifecycle == "RUNNING" and runtime.store.metrics:
+            break
+        await asyncio.sleep(0.05)
+
+    reader, writer = await asyncio.open_unix_connection(str(sock))
+    snapshot = json.loads(await reader.readline())
+    writer.close()
+    assert snapshot["lifecycle"] == "RUNNING"
+    assert snapshot["gateway"]["version"] == "1.2.3-mock"
+
+    stop.set()
+    await task
+    types = [json.loads(line)["type"] for line in out.getvalue().splitlines()]
+    assert "LifecycleChanged" in types and "MetricsUpdated" in types
+    assert not sock.exists()
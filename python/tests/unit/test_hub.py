@@ -0,0 +1,137 @@
+import asyncio
+import os
+import socket
+import stat
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from talos_tui.core.state import (
+    AuditEventsReceived,
+    CircuitChanged,
+    LifecycleChanged,
+    MetricsUpdated,
+    StateStore,
+    event_from_dict,
+)
+from talos_tui.hub import Hub, HubClient, _Subscriber
+from talos_tui.ports.errors import TuiError
+
+
+def _audit(n: int, start: int = 0) -> AuditEventsReceived:
+    return AuditEventsReceived(
+        items=[
+            {"event_id": f"evt-{i}", "ts": "t", "schema_id": "login"}
+            for i in range(start + n - 1, start - 1, -1)
+        ],
+        next_cursor=f"evt-{start}",
+    )
+
+
+def test_events_and_snapshots_round_trip() -> None:
+    event = CircuitChanged(source="gateway", endpoint="peers", state="OPEN")
+    assert event_from_dict(event.to_dict()) == event
+    with pytest.raises(ValueError):
+        event_from_dict({"type": "Nope"})
+
+    store = StateStore()
+    store.reduce(event)
+    store.reduce(_audit(3))
+    copy = StateStore()
+    copy.restore(store.snapshot(None))
+    assert copy.snapshot(None) == store.snapshot(None)
+    assert copy.gateway.circuit_state == "OPEN"
+
+
+@pytest.mark.asyncio
+async def test_clients_mirror_hub_state(tmp_path: Path) -> None:
+    hub_store = StateStore()
+    hub_store.reduce(LifecycleChanged(previous="BOOT", state="RUNNING"))
+    hub_store.reduce(_audit(5))
+    hub = Hub(hub_store, tmp_path / "hub.sock")
+    await hub.start()
+
+    clients = [
+        HubClient(StateStore(), hub.path, reconnect_delay=0.01)
+        for _ in range(3)
+    ]
+    tasks = [asyncio.create_task(c.run()) for c in clients]
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(c.connected.wait() for c in clients)), 2
+        )
+        for _ in range(100):
+            if len(hub.subscribers) == 3:
+                break
+            await asyncio.sleep(0.01)
+
+        hub_store.reduce(MetricsUpdated(metrics={"connected_peers": 7}))
+        hub_store.reduce(_audit(5, start=5))
+        for _ in range(100):
+            if all(c.applied == 3 for c in clients):
+                break
+            await asyncio.sleep(0.01)
+
+        for c in clients:
+            assert c.store.lifecycle == "RUNNING"
+            assert c.store.metrics == {"connected_peers": 7}
+            assert c.store.audit_events == hub_store.audit_events
+    finally:
+        for t in tasks:
+            t.cancel()
+        await hub.stop()
+    assert not hub.path.exists()
+
+
+@pytest.mark.asyncio
+async def test_hub_replaces_only_a_stale_socket(tmp_path: Path) -> None:
+    path = tmp_path / "run" / "hub.sock"
+    path.parent.mkdir()
+    # Left behind by a hub that died: bound, nobody listening
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(str(path))
+    stale.close()
+
+    hub = Hub(StateStore(), path)
+    umask = os.umask(0o022)
+    try:
+        await hub.start()
+    finally:
+        # Never changed by the hub: other threads create files meanwhile
+        assert os.umask(umask) == 0o022
+    try:
+        assert stat.S_IMODE(path.stat().st_mode) == 0o660
+        assert list(path.parent.iterdir()) == [path]
+        with pytest.raises(TuiError, match="another server"):
+            await Hub(StateStore(), path).start()
+        assert path.exists()  # still the first hub's
+    finally:
+        await hub.stop()
+
+    path.write_text("not a socket")
+    with pytest.raises(TuiError, match="not a socket"):
+        await Hub(StateStore(), path).start()
+
+
+@pytest.mark.asyncio
+async def test_hub_creates_a_private_socket_dir(tmp_path: Path) -> None:
+    hub = Hub(StateStore(), tmp_path / "talos-tui-1000" / "hub.sock")
+    await hub.start()
+    await hub.stop()
+    mode = stat.S_IMODE((tmp_path / "talos-tui-1000").stat().st_mode)
+    assert not mode & 0o027
+
+
+def test_slow_subscriber_is_dropped() -> None:
+    hub = Hub(StateStore(), Path("unused.sock"))
+    sub = _Subscriber(MagicMock(), max_queue=1)
+    sub.task = MagicMock()
+    hub.subscribers.add(sub)
+
+    hub._publish(MetricsUpdated(metrics={}))
+    assert sub in hub.subscribers
+    hub._publish(MetricsUpdated(metrics={}))  # queue full
+
+    assert sub not in hub.subscribers
+    sub.task.cancel.assert_called_once()
@@ -0,0 +1,78 @@
+import json
+import logging
+import queue
+import sys
+from pathlib import Path
+
+from talos_tui.logs import (
+    DroppingQueueHandler, JsonFormatter, SamplingFilter, configure_logging
+)
+
+
+def _record(level: int = logging.INFO, **extra: object) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "talos_tui.test", level, __file__, 1, "HTTP %s", ("GET",), None
+    )
+    for k, v in extra.items():
+        setattr(record, k, v)
+    return record
+
+
+def test_sampling_keeps_one_in_n_flagged_records() -> None:
+    f = SamplingFilter(every=5)
+    kept = sum(f.filter(_record(sample=True)) for _ in range(100))
+    assert kept == 20
+    assert f.filter(_record())  # unflagged lines always pass
+    assert f.filter(_record(logging.WARNING, sample=True))
+
+
+def test_json_formatter_merges_fields() -> None:
+    line = JsonFormatter().format(_record(fields={"status": 200}))
+    entry = json.loads(line)
+    assert entry["msg"] == "HTTP GET"
+    assert entry["status"] == 200
+    assert entry["level"] == "INFO"
+
+
+def test_full_queue_drops_instead_of_blocking() -> None:
+    handler = DroppingQueueHandler(queue.Queue(1))
+    handler.handle(_record())
+    handler.handle(_record())  # must not raise or block
+    assert handler.queue.qsize() == 1
+
+
+def test_configure_logging_writes_via_listener(tmp_path: Path) -> None:
+    path = tmp_path / "tui.log"
+    root = logging.getLogger()
+    saved = root.handlers[:], root.level
+    listener = configure_logging(str(path), json_format=True)
+    try:
+        logger = logging.getLogger("talos_tui.test")
+        logger.info("hello %s", "world", extra={"fields": {"k": 1}})
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed %d", 1)
+    finally:
+        listener.stop()
+        root.handlers[:], root.level = saved[0], saved[1]
+
+    hello, failed = (json.loads(line) for line in path.read_text()
+                     .splitlines()[-2:])
+    assert hello["msg"] == "hello world"
+    assert hello["k"] == 1
+    assert "exc" not in hello
+    # The traceback survives the queue, apart from the message
+    assert failed["msg"] == "failed 1"
+    assert "ValueError: boom" in failed["exc"]
+
+
+def test_text_lines_keep_the_traceback() -> None:
+    handler = DroppingQueueHandler(queue.Queue())
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = _record(logging.ERROR, exc_info=sys.exc_info())
+    line = logging.Formatter("%(message)s").format(handler.prepare(record))
+    assert line.startswith("HTTP GET\nTraceback")
+    assert line.endswith("ValueError: boom")
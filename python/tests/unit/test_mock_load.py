@@ -0,0 +1,128 @@
+import pytest
+import aiohttp
+from aiohttp.test_utils import TestServer
+
+from talos_tui.adapters.audit_http import HttpAuditAdapter
+from talos_tui.adapters.gateway_http import HttpGatewayAdapter
+from talos_tui.adapters.mock import (
+    LoadGenerator,
+    LoadProfile,
+    MockAuditAdapter,
+    MockGatewayAdapter,
+    mock_adapters,
+)
+from talos_tui.adapters.mock_server import create_app
+from talos_tui.ports.errors import TuiError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_profile_from_env_and_overrides() -> None:
+    profile = LoadProfile.from_env(
+        {"TALOS_MOCK_EVENT_RATE": "500", "TALOS_MOCK_PEERS": "100000"}
+    )
+    assert profile.event_rate == 500.0 and profile.peers == 100_000
+
+    profile = profile.with_overrides(
+        LoadProfile.parse_pairs(["error_rate=0.1", "seed=7"])
+    )
+    assert profile.error_rate == 0.1 and profile.seed == 7
+
+    with pytest.raises(ValueError):
+        profile.with_overrides({"bogus": "1"})
+    with pytest.raises(ValueError):
+        LoadProfile(peers=100_001)
+    with pytest.raises(ValueError):
+        LoadProfile(error_rate=1.5)
+
+
+def test_events_accrue_at_rate_with_bursts_and_paging() -> None:
+    clock = FakeClock()
+    gen = LoadGenerator(
+        LoadProfile(event_rate=100, burst_size=30, burst_every=1.0, seed=1),
+        clock=clock,
+    )
+    clock.now += 2.0
+    page = gen.events(limit=50)
+
+    # 2s at 100/s plus two bursts of 30
+    assert gen.generated == 260
+    ids = [e["event_id"] for e in page["items"]]
+    assert ids[0] == "evt-000000000260"
+    assert ids == sorted(ids, reverse=True)
+    assert page["has_more"] is True
+
+    older = gen.events(limit=50, before=page["next_cursor"])
+    assert older["items"][0]["event_id"] == "evt-000000000210"
+    assert not set(ids) & {e["event_id"] for e in older["items"]}
+
+
+def test_payload_sizes_and_duplicates() -> None:
+    clock = FakeClock()
+    gen = LoadGenerator(
+        LoadProfile(
+            event_rate=1000,
+            payload_bytes=10_000,
+            duplicate_ratio=1.0,
+            seed=3,
+        ),
+        clock=clock,
+    )
+    clock.now += 1.0
+    page = gen.events(limit=100)
+
+    assert all(len(e["payload"]["data"]) == 10_000 for e in page["items"])
+    # Every slot re-delivered an already generated event
+    assert len({e["event_id"] for e in page["items"]}) < 100
+
+
+@pytest.mark.asyncio
+async def test_large_peer_lists_are_built_once() -> None:
+    gateway, _ = mock_adapters(LoadProfile(peers=100_000, sessions=10))
+    peers = await gateway.list_peers()
+    assert len(peers) == 100_000
+    assert await gateway.list_peers() is peers
+    metrics = await gateway.get_metrics_summary()
+    assert metrics.connected_peers == 100_000
+
+
+@pytest.mark.asyncio
+async def test_injected_faults() -> None:
+    failing = MockGatewayAdapter(LoadGenerator(LoadProfile(error_rate=1.0)))
+    with pytest.raises(TuiError) as exc:
+        await failing.get_health()
+    assert exc.value.status_code == 503
+
+    limited = MockAuditAdapter(LoadGenerator(LoadProfile(rate_limit_rate=1.0)))
+    with pytest.raises(TuiError) as exc:
+        await limited.list_events(limit=10)
+    assert exc.value.kind == "RATE_LIMIT"
+
+
+@pytest.mark.asyncio
+async def test_http_adapters_against_stand_in_server() -> None:
+    clock = FakeClock()
+    gen = LoadGenerator(LoadProfile(event_rate=50, peers=20), clock=clock)
+    clock.now += 1.0
+    server = TestServer(create_app(gen))
+    await server.start_server()
+    try:
+        async with aiohttp.ClientSession() as session:
+            base = str(server.make_url("/"))
+            audit = HttpAuditAdapter(base, session)
+            gateway = HttpGatewayAdapter(base, session)
+
+            assert (await audit.get_health()).ok()
+            page = await audit.list_events(limit=20)
+            assert len(page.items) == 20 and page.has_more
+            older = await audit.list_events(limit=20, before=page.next_cursor)
+            assert older.items[0].id < page.items[-1].id
+            assert len(await gateway.list_peers()) == 20
+    finally:
+        await server.close()
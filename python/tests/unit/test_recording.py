@@ -0,0 +1,208 @@
+import asyncio
+import gzip
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from talos_tui.adapters.mock import MockAuditAdapter, MockGatewayAdapter
+from talos_tui.adapters.recording import (
+    RecordingAuditAdapter,
+    RecordingGatewayAdapter,
+    ReplayAuditAdapter,
+    ReplayGatewayAdapter,
+    TrafficRecorder,
+    TrafficReplay,
+)
+from talos_tui.cli import build_parser
+from talos_tui.core.coordinator import Coordinator
+from talos_tui.core.state import LifecycleChanged, StateStore
+from talos_tui.domain.models import AuditEvent, AuditPage, Health
+from talos_tui.ports.errors import TuiError
+
+
+async def _record(path: Path) -> None:
+    recorder = TrafficRecorder(path)
+    gateway = RecordingGatewayAdapter(MockGatewayAdapter(), "gateway", recorder)
+    audit = RecordingAuditAdapter(MockAuditAdapter(), "audit", recorder)
+
+    await gateway.get_health()
+    await gateway.get_version()
+    await audit.get_health()
+    await audit.get_version()
+    for _ in range(3):
+        await gateway.get_metrics_summary()
+        await audit.list_events(limit=50)
+    recorder.close()
+
+
+@pytest.mark.asyncio
+async def test_recorded_responses_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.ndjson.gz"
+    await _record(path)
+
+    replay = TrafficReplay(path, speed=1000)
+    assert replay.remaining() == 10
+    gateway = ReplayGatewayAdapter(replay)
+
+    health = await gateway.get_health()
+    assert isinstance(health, Health) and health.ok()
+    version = await gateway.get_version()
+    assert version.service_version == "1.2.3-mock"
+
+    await gateway.get_metrics_summary()
+    await gateway.get_metrics_summary()
+    await gateway.get_metrics_summary()
+    with pytest.raises(TuiError, match="exhausted"):
+        await gateway.get_metrics_summary()
+
+
+@pytest.mark.asyncio
+async def test_recorded_audit_payloads_are_redacted(tmp_path: Path) -> None:
+    event = AuditEvent(
+        event_id="e1", ts="2024-03-01T12:00:00Z", schema_id="login",
+        payload={"password": "hunter2", "nested": {"token": "t0ps3cret"}},
+    )
+    inner = AsyncMock()
+    inner.list_events.return_value = AuditPage(items=[event])
+    inner.get_event.return_value = event
+    path = tmp_path / "traffic.ndjson.gz"
+    recorder = TrafficRecorder(path)
+    audit = RecordingAuditAdapter(inner, "audit", recorder)
+    await audit.list_events(limit=50)
+    await audit.get_event("e1")
+    recorder.close()
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        recorded = f.read()
+    assert "hunter2" not in recorded and "t0ps3cret" not in recorded
+    assert recorded.count("REDACTED") == 4
+
+    # Redacted, not dropped: replay still returns the events
+    replay = ReplayAuditAdapter(TrafficReplay(path, speed=1000))
+    page = await replay.list_events(limit=50)
+    assert page.items[0].id == "e1"
+    assert "***REDACTED***" in page.items[0].payload_raw
+
+
+@pytest.mark.asyncio
+async def test_replay_matches_calls_on_their_arguments(
+    tmp_path: Path,
+) -> None:
+    def event(event_id: str) -> AuditEvent:
+        return AuditEvent(
+            event_id=event_id, ts="2024-03-01T12:00:00Z", schema_id="login"
+        )
+
+    inner = AsyncMock()
+    inner.get_event.side_effect = event
+    inner.list_events.side_effect = lambda limit, before: AuditPage(
+        items=[event(f"{before or 'head'}-1")]
+    )
+    path = tmp_path / "traffic.ndjson.gz"
+    recorder = TrafficRecorder(path)
+    audit = RecordingAuditAdapter(inner, "audit", recorder)
+    await audit.list_events(limit=50)
+    await audit.list_events(limit=50, before="c1")
+    await audit.list_events(limit=50, before="c2")
+    await audit.get_event("e1")
+    await audit.get_event("e2")
+    recorder.close()
+
+    replay = ReplayAuditAdapter(TrafficReplay(path, speed=1000))
+    assert (await replay.get_event("e2")).id == "e2"
+    with pytest.raises(TuiError, match="no audit.get_event recorded"):
+        await replay.get_event("e3")  # not e1's details instead
+    assert (await replay.get_event("e1")).id == "e1"
+    page = await replay.list_events(limit=20, before="c2")
+    assert page.items[0].id == "c2-1"
+    assert (await replay.list_events()).items[0].id == "head-1"
+    assert (await replay.list_events(before="c1")).items[0].id == "c1-1"
+
+
+@pytest.mark.asyncio
+async def test_errors_are_recorded_and_replayed(tmp_path: Path) -> None:
+    path = tmp_path / "errors.ndjson.gz"
+    inner = AsyncMock()
+    inner.get_health.side_effect = TuiError(
+        kind="NETWORK", message="boom", retryable=True
+    )
+    recorder = TrafficRecorder(path)
+    with pytest.raises(TuiError):
+        await RecordingGatewayAdapter(inner, "gateway", recorder).get_health()
+    recorder.close()
+
+    replay = ReplayGatewayAdapter(TrafficReplay(path))
+    with pytest.raises(TuiError) as exc:
+        await replay.get_health()
+    assert exc.value.kind == "NETWORK"
+    assert exc.value.retryable is True
+
+
+@pytest.mark.asyncio
+async def test_replay_drives_coordinator_and_store(tmp_path: Path) -> None:
+    path = tmp_path / "session.ndjson.gz"
+    await _record(path)
+
+    replay = TrafficReplay(path, speed=1000)
+    store = StateStore()
+    coord = Coordinator(
+        store,
+        ReplayGatewayAdapter(replay),
+        ReplayAuditAdapter(replay),
+        contracts_version_gate="1",
+        poll_interval=0.001,
+        handshake_interval=0.001,
+    )
+    lifecycle: list[LifecycleChanged] = []
+    store.subscribe(
+        lambda e: lifecycle.append(e)
+        if isinstance(e, LifecycleChanged) else None
+    )
+    await coord.start()
+    for _ in range(200):
+        if any(e.state == "DEGRADED" for e in lifecycle):
+            break
+        await asyncio.sleep(0.005)
+    await coord.stop()
+
+    assert replay.served == 10
+    assert store.gateway.version == "1.2.3-mock"
+    assert store.metrics["connected_peers"] > 0
+    assert store.audit.last_updated_at > 0
+    # Running off the end of the recording degrades instead of crashing
+    assert "DEGRADED" in {e.state for e in lifecycle}
+
+
+def test_cli_rejects_record_with_replay() -> None:
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["--record", "a", "--replay", "b"])
+    args = build_parser().parse_args(["--replay", "a.gz", "--speed", "100"])
+    assert args.replay == Path("a.gz") and args.speed == 100
+
+
+@pytest.mark.asyncio
+async def test_recorder_writes_off_the_loop(
+    tmp_path: Path, monkeypatch
+) -> None:
+    path = tmp_path / "traffic.ndjson.gz"
+    recorder = TrafficRecorder(path)
+    loop_thread = threading.get_ident()
+    writers: set[int] = set()
+    file = recorder._file
+    assert file is not None
+    write = file.write
+    monkeypatch.setattr(
+        file, "write",
+        lambda data: writers.add(threading.get_ident()) or write(data),
+    )
+    gateway = RecordingGatewayAdapter(
+        MockGatewayAdapter(), "gateway", recorder
+    )
+    for _ in range(5):
+        await gateway.get_health()
+    recorder.close()
+
+    assert writers and loop_thread not in writers
+    assert TrafficReplay(path).remaining() == 5
@@ -1,4 +1,6 @@
 from talos_tui.adapters.base import redact_dict
+from talos_tui.core.redaction import redact_audit_items
+from talos_tui.domain.models import AuditEvent
 
 def test_redact_denylist_keys() -> None:
     data = {"secret": "my_password", "public": "visible"}
@@ -23,3 +25,13 @@ def test_truncate_large_string() -> None:
     redacted = redact_dict(data)
     assert "TRUNCATED" in redacted["blob"]
     assert len(redacted["blob"]) < 1000
+
+def test_audit_items_leave_with_their_peer_redacted() -> None:
+    pem = "-----BEGIN KEY-----abc-----END KEY-----"
+    item = AuditEvent(
+        event_id="e1", ts="2024-03-01T12:00:00Z", schema_id="login",
+        payload={"actor": pem},
+    ).model_dump()
+    assert item["peer"] == pem  # raw in memory, like the payload
+    safe, = redact_audit_items([item])
+    assert pem not in str(safe)
@@ -0,0 +1,46 @@
+from talos_tui.ui.render_cache import AuditRowRenderer, severity_for
+
+
+def _event(eid: str, outcome: str = "OK") -> dict[str, str]:
+    return {
+        "event_id": eid,
+        "ts": "2023-01-01T00:00:00Z",
+        "schema_id": "talos.login",
+        "outcome": outcome,
+    }
+
+
+def test_row_cached_per_event_id() -> None:
+    renderer = AuditRowRenderer()
+    first = renderer.render(_event("1"))
+    second = renderer.render(_event("1"))
+
+    assert first is second
+    assert renderer.hits == 1
+    assert renderer.misses == 1
+    assert str(first[2]) == "login (OK)"
+
+
+def test_styles_interned_per_severity() -> None:
+    renderer = AuditRowRenderer()
+    a = renderer.render(_event("1", "deny"))
+    b = renderer.render(_event("2", "DENY"))
+
+    assert str(a[0]) == "W"
+    assert a[1].style is b[1].style
+    assert severity_for("error").char == "E"
+    assert severity_for("whatever").char == "I"
+
+
+def test_lru_eviction() -> None:
+    renderer = AuditRowRenderer(max_rows=2)
+    renderer.render(_event("1"))
+    renderer.render(_event("2"))
+    renderer.render(_event("1"))  # refresh 1, so 2 is now oldest
+    renderer.render(_event("3"))
+
+    assert len(renderer) == 2
+    renderer.render(_event("1"))
+    assert renderer.misses == 3
+    renderer.render(_event("2"))
+    assert renderer.misses == 4
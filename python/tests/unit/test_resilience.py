@@ -0,0 +1,207 @@
+import asyncio
+import time
+from email.utils import formatdate
+from functools import partial
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from aiohttp import ClientResponse, ClientSession
+
+from talos_tui.adapters.gateway_http import HttpGatewayAdapter
+from talos_tui.adapters.resilience import (
+    CircuitBreaker, CircuitState, RateLimiter, RetryBudget, parse_retry_after
+)
+from talos_tui.core.coordinator import Coordinator
+from talos_tui.core.state import StateStore
+from talos_tui.ports.errors import TuiError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_and_half_opens() -> None:
+    clock = FakeClock()
+    changes: list[tuple[str, CircuitState]] = []
+    breaker = CircuitBreaker(
+        "health", failure_threshold=2, reset_timeout=10.0, clock=clock,
+        on_change=lambda name, state: changes.append((name, state)),
+    )
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+
+    clock.now = 10.0
+    assert breaker.allow()  # the single half-open probe
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+    clock.now = 20.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert [s for _, s in changes] == [
+        CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.OPEN,
+        CircuitState.HALF_OPEN, CircuitState.CLOSED,
+    ]
+
+
+def test_retry_budget_throttles_and_recovers() -> None:
+    budget = RetryBudget(max_tokens=4, token_ratio=0.5)
+    budget.record_failure()
+    assert budget.can_retry()
+    budget.record_failure()
+    assert not budget.can_retry()
+    budget.record_success()
+    assert budget.can_retry()
+
+
+def _failing_session() -> AsyncMock:
+    session = AsyncMock(spec=ClientSession)
+    session.request.return_value.__aenter__.side_effect = asyncio.TimeoutError
+    return session
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast() -> None:
+    session = _failing_session()
+    adapter = HttpGatewayAdapter(
+        "http://test", session, max_attempts=3, circuit_failure_threshold=3
+    )
+
+    with patch("asyncio.sleep", return_value=None):
+        with pytest.raises(TuiError) as exc:
+            await adapter.get_health()
+    assert exc.value.kind == "TIMEOUT"
+    assert session.request.call_count == 3
+
+    with pytest.raises(TuiError) as exc:
+        await adapter.get_health()
+    assert exc.value.kind == "CIRCUIT_OPEN"
+    assert session.request.call_count == 3
+    assert adapter.circuit_states() == {"health/ready": CircuitState.OPEN}
+
+
+@pytest.mark.asyncio
+async def test_shared_budget_stops_retries_across_adapters() -> None:
+    budget = RetryBudget(max_tokens=6)
+    session = _failing_session()
+    a = HttpGatewayAdapter("http://a", session, retry_budget=budget)
+    b = HttpGatewayAdapter("http://b", session, retry_budget=budget)
+
+    with patch("asyncio.sleep", return_value=None):
+        with pytest.raises(TuiError):
+            await a.get_health()
+        calls_a = session.request.call_count
+        with pytest.raises(TuiError):
+            await b.get_health()
+
+    # Budget allows two retries in total, then every call is a single try
+    assert calls_a == 3
+    assert session.request.call_count == 4
+
+
+def test_circuit_changes_reach_source_state() -> None:
+    store = StateStore()
+    gateway = HttpGatewayAdapter("http://test", MagicMock())
+    coord = Coordinator(store, gateway, MagicMock())
+    gateway.add_circuit_listener(partial(coord.on_circuit_change, "gateway"))
+
+    gateway._notify_circuit("metrics/summary", CircuitState.OPEN)
+    assert store.gateway.circuit_state == "OPEN"
+    gateway._notify_circuit("metrics/summary", CircuitState.CLOSED)
+    assert store.gateway.circuit_state == "CLOSED"
+
+
+def test_parse_retry_after_forms() -> None:
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    # HTTP-date, 30s after "now"
+    assert parse_retry_after(
+        "Thu, 01 Jan 2026 00:00:30 GMT", now=1767225600.0
+    ) == 30.0
+
+
+def test_rate_limiter_paces_and_follows_headers() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2.0, burst=1.0, clock=clock)
+    assert limiter.delay() == 0.0
+    limiter.tokens -= 1
+    assert limiter.delay() == pytest.approx(0.5)
+
+    clock.now = 1.0
+    limiter.update_from_headers(
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "20"}
+    )
+    assert limiter.delay() == pytest.approx(20.0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_queue_for_tokens() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2.0, burst=1.0, clock=clock)
+    waits: list[float] = []
+    yield_once = asyncio.sleep
+
+    async def sleep(seconds: float) -> None:
+        waits.append(seconds)
+        await yield_once(0)  # let the other callers run meanwhile
+
+    with patch("asyncio.sleep", side_effect=sleep):
+        await asyncio.gather(*(limiter.acquire(10.0) for _ in range(4)))
+    # The first takes the burst; the rest are paced one slot apart
+    assert waits == pytest.approx([0.5, 1.0, 1.5])
+    clock.now = 1.5
+    assert limiter.delay() == pytest.approx(0.5)
+
+    with pytest.raises(TuiError):
+        await limiter.acquire(0.1)
+    assert limiter.delay() == pytest.approx(0.5)  # nothing reserved
+
+
+def _rate_limited_session(headers: dict[str, str]) -> AsyncMock:
+    resp = AsyncMock(spec=ClientResponse)
+    resp.status = 429
+    resp.headers = headers
+    session = AsyncMock(spec=ClientSession)
+    session.request.return_value.__aenter__.return_value = resp
+    return session
+
+
+@pytest.mark.asyncio
+async def test_persistent_429_is_bounded() -> None:
+    session = _rate_limited_session({"Retry-After": "0"})
+    adapter = HttpGatewayAdapter("http://test", session, max_attempts=3)
+
+    with pytest.raises(TuiError) as exc:
+        await adapter.get_health()
+    assert exc.value.kind == "RATE_LIMIT"
+    assert exc.value.status_code == 429
+    assert session.request.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_long_retry_after_date_fails_without_sleeping() -> None:
+    later = formatdate(time.time() + 3600, usegmt=True)
+    session = _rate_limited_session({"Retry-After": later})
+    adapter = HttpGatewayAdapter("http://test", session)
+
+    with pytest.raises(TuiError) as exc:
+        await adapter.get_health()
+    assert exc.value.kind == "RATE_LIMIT"
+    assert session.request.call_count == 1
+
+    # The bucket stays blocked, so the next call never hits the network
+    with pytest.raises(TuiError) as exc:
+        await adapter.get_health()
+    assert exc.value.kind == "RATE_LIMIT"
+    assert session.request.call_count == 1
@@ -0,0 +1,136 @@
+import json
+
+from talos_tui.core.rollups import AuditRollups, failing_peer
+from talos_tui.core.state import AuditEventsReceived, StateStore
+from talos_tui.domain.models import AuditEvent
+from talos_tui.domain.timestamps import NS, parse_ts
+from talos_tui.ui.projections import project_analytics, spark
+
+BASE = parse_ts("2024-03-01T12:00:00Z")
+
+
+class Clock:
+    def __init__(self, second: float) -> None:
+        self.now = BASE + int(second * NS)
+
+    def __call__(self) -> int:
+        return self.now
+
+
+def item(i: int, second: float, schema: str = "login", outcome: str = "OK",
+         peer: str = "") -> dict:
+    return {
+        "id": f"e{i}",
+        "ts_ns": BASE + int(second * NS),
+        "event_type": schema,
+        "outcome": outcome,
+        "payload_raw": json.dumps({"actor": peer}) if peer else "",
+        "peer": peer,
+    }
+
+
+def test_tumbling_windows_roll_over() -> None:
+    clock = Clock(29)
+    rollups = AuditRollups(window=10.0, windows=3, clock=clock)
+    rollups.add([
+        item(1, 0, outcome="DENY", peer="peer-1"),
+        item(2, 5, outcome="DENY", peer="peer-1"),
+        item(3, 12),
+        item(4, 25, schema="logout", outcome="DENY", peer="peer-2"),
+    ])
+    assert rollups.series() == [2, 1, 1]
+    assert rollups.series(outcome="DENY") == [2, 0, 1]
+    assert rollups.series("logout", "DENY") == [0, 0, 1]
+    assert rollups.top_peers() == [("peer-1", 2), ("peer-2", 1)]
+    assert rollups.starts()[0] == BASE
+
+    # Late, but within the windows kept
+    rollups.add([item(5, 1, outcome="ERROR", peer="peer-2")])
+    assert rollups.series(outcome="ERROR") == [1, 0, 0]
+
+    # Two windows on: the first two are recycled, and their peers go
+    clock.now += 20 * NS
+    rollups.add([item(6, 41)])
+    assert rollups.series() == [1, 0, 1]
+    assert rollups.top_peers() == [("peer-2", 1)]
+    assert rollups.totals() == {("login", "OK"): 1, ("logout", "DENY"): 1}
+
+    rollups.add([item(7, 3)])  # older than every window kept
+    assert rollups.dropped == 1
+    assert rollups.counted == 6
+
+
+def test_windows_roll_over_while_quiet() -> None:
+    clock = Clock(5)
+    rollups = AuditRollups(window=10.0, windows=3, clock=clock)
+    rollups.add([item(1, 0), item(2, 5)])
+    assert rollups.series() == [0, 0, 2]
+
+    # No events for a window, then two: read from the clock
+    clock.now += 10 * NS
+    assert rollups.series() == [0, 2, 0]
+    assert rollups.starts()[-1] == BASE + 10 * NS
+    clock.now += 20 * NS
+    assert rollups.series() == [0, 0, 0]
+    assert rollups.totals() == {}
+
+
+def test_far_future_events_do_not_recycle_windows() -> None:
+    rollups = AuditRollups(
+        window=10.0, windows=3, clock=lambda: BASE + 30 * NS
+    )
+    rollups.add([item(1, 25), item(2, 45)])  # within a window of now
+    rollups.add([item(3, 3600)])  # a bad timestamp, an hour ahead
+    assert rollups.dropped == 1
+    assert rollups.series() == [1, 0, 1]
+    rollups.add([item(4, 28)])
+    assert rollups.series() == [2, 0, 1]
+
+
+def test_failing_peer_is_picked_out_at_ingest() -> None:
+    event = AuditEvent(
+        event_id="e1", ts="2024-03-01T12:00:00Z", schema_id="login",
+        payload={"peer_id": "p1", "actor": "a"},
+    )
+    assert event.peer == "p1"
+    assert failing_peer(event.model_dump()) == "p1"
+    # Never parses the raw payload
+    assert failing_peer({"payload_raw": '{"actor":"a"}', "peer": ""}) is None
+    assert failing_peer({"payload": {"actor": "a"}}) == "a"
+    assert failing_peer({}) is None
+
+
+def test_store_counts_each_event_once() -> None:
+    store = StateStore(max_audit_events=2)
+    page = [item(i, i, outcome="DENY", peer="p") for i in range(3, 0, -1)]
+    store.reduce(AuditEventsReceived(items=page))
+    store.reduce(AuditEventsReceived(items=page[:1]))  # re-delivered
+    # Trimmed from the ring, still counted
+    assert len(store.audit_events) == 2
+    assert store.audit_rollups.counted == 3
+
+    restored = StateStore()
+    restored.restore(store.snapshot())
+    assert restored.audit_rollups.counted == 2
+
+
+def test_project_analytics() -> None:
+    rollups = AuditRollups(window=60.0, windows=4, clock=Clock(120))
+    assert project_analytics(rollups).caption == "No audit events yet"
+    rollups.add([
+        item(1, 0, outcome="DENY", peer="peer-1"),
+        item(2, 60, outcome="DENY", peer="peer-1"),
+        item(3, 60, schema="logout", outcome="ERROR"),
+        item(4, 120, outcome="REVOKED"),
+    ])
+    view = project_analytics(rollups, top_peers=1)
+    assert view.total == (0, 1, 2, 1)
+    assert view.deny == (0, 1, 1, 0)
+    assert view.error == (0, 0, 1, 0)
+    login, logout = view.rows
+    assert (login.schema_id, login.counts) == ("login", (0, 2, 0, 1))
+    assert login.deny_trend == "▁██▁"
+    assert logout.counts == (0, 0, 1, 0)
+    assert view.peers == (("peer-1", 2),)
+    assert "Per 60s window, last 4" in view.caption
+    assert spark([0, 1, 7]) == "▁▂█"
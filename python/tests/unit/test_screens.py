@@ -1,16 +1,30 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from talos_tui.app import TalosTuiApp
+from talos_tui.core.coordinator import TuiState
+from talos_tui.ui.screens.perf import PerfOverlay
+from talos_tui.ui.screens.startup import StartupScreen
 from talos_tui.ui.screens.dashboard import StatusDashboard
 from talos_tui.ui.screens.audit import AuditViewer
-from talos_tui.core.state import StateStore
+from talos_tui.core.state import HealthUpdated, MetricsUpdated, StateStore
+
+
+def _mock_widgets(dash: StatusDashboard) -> dict[str, MagicMock]:
+    widgets: dict[str, MagicMock] = {}
+
+    def query_one(selector: str, *args: object) -> MagicMock:
+        return widgets.setdefault(selector, MagicMock())
+
+    dash.query_one = MagicMock(side_effect=query_one)  # type: ignore[method-assign]
+    return widgets
 
 
 def test_dashboard_update_metrics() -> None:
     store = StateStore()
     dash = StatusDashboard(store)
-
-    # Mock query_one to return a mock widget that accepts update_value
-    mock_widget = MagicMock()
-    dash.query_one = MagicMock(return_value=mock_widget)  # type: ignore[method-assign]
+    widgets = _mock_widgets(dash)
 
     # Update store directly
     store.metrics = {
@@ -22,12 +36,51 @@ def test_dashboard_update_metrics() -> None:
 
     dash.refresh_view()
 
-    # Verify calls
-    assert dash.query_one.call_count == 7
-    # Check calls
+    # Widgets are resolved once and cached
+    assert dash.query_one.call_count == 8
     calls = dash.query_one.call_args_list
     assert calls[0][0][0] == "#peers"
     assert calls[1][0][0] == "#sessions"
+    widgets["#peers"].update_value.assert_called_once_with("10")
+    widgets["#p50"].update_value.assert_called_once_with("12.5")
+
+    # Only the changed metric is pushed on the next refresh
+    store.metrics = {**store.metrics, "connected_peers": 11}
+    dash.refresh_view()
+    assert dash.query_one.call_count == 8
+    widgets["#peers"].update_value.assert_called_with("11")
+    widgets["#sessions"].update_value.assert_called_once()
+
+
+def test_dashboard_idle_minute_has_no_widget_refreshes() -> None:
+    store = StateStore()
+    dash = StatusDashboard(store)
+    widgets = _mock_widgets(dash)
+    metrics = {
+        "connected_peers": 10,
+        "active_sessions": 5,
+        "latency_p50_ms": 12.5,
+        "latency_p95_ms": 40.2
+    }
+    store.reduce(HealthUpdated(source="gateway", is_ok=True))
+    store.reduce(MetricsUpdated(metrics=metrics))
+    dash.refresh_view()
+
+    initial = dash.widget_updates
+    for w in widgets.values():
+        w.reset_mock()
+
+    # One minute of 1s ticks with the pollers re-reporting identical data
+    for second in range(60):
+        if second % 2 == 0:
+            store.reduce(HealthUpdated(source="gateway", is_ok=True))
+            store.reduce(MetricsUpdated(metrics=dict(metrics)))
+        dash.refresh_view()
+
+    assert dash.widget_updates == initial
+    for w in widgets.values():
+        assert w.update.call_count == 0
+        assert w.update_value.call_count == 0
 
 
 def test_audit_refresh_view() -> None:
@@ -53,3 +106,26 @@ def test_audit_refresh_view() -> None:
     assert "2023" in str(call_args[1])
     assert "login" in str(call_args[2])
     assert "1" in str(call_args[3])
+
+
+@pytest.mark.parametrize("state", [TuiState.RUNNING, TuiState.DEGRADED])
+def test_lifecycle_navigates_from_under_the_perf_overlay(
+    state: TuiState,
+) -> None:
+    store = StateStore()
+    app = MagicMock(store=store)
+    app.screen = PerfOverlay()
+    app.screen_stack = [MagicMock(), StartupScreen(store), app.screen]
+
+    TalosTuiApp._on_lifecycle(app, state)
+    assert app.mock_calls == [
+        call.pop_screen(), call.switch_screen("dashboard")
+    ]
+
+    # Already past startup: FATAL brings it back, above the dashboard
+    app.reset_mock()
+    app.screen_stack = [MagicMock(), StatusDashboard(store), app.screen]
+    TalosTuiApp._on_lifecycle(app, TuiState.FATAL)
+    assert app.pop_screen.call_count == 1
+    pushed, = app.push_screen.call_args.args
+    assert isinstance(pushed, StartupScreen)
@@ -0,0 +1,81 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from aiohttp import ClientResponse, ClientSession
+
+from talos_tui.adapters.gateway_http import HttpGatewayAdapter
+
+
+def _slow_session(body: dict[str, str]) -> AsyncMock:
+    resp = AsyncMock(spec=ClientResponse)
+    resp.status = 200
+    resp.content_length = 100
+    resp.headers = {}
+
+    async def slow_json() -> dict[str, str]:
+        await asyncio.sleep(0.01)
+        return body
+
+    resp.json.side_effect = slow_json
+    session = AsyncMock(spec=ClientSession)
+    session.request.return_value.__aenter__.return_value = resp
+    return session
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call() -> None:
+    session = _slow_session({"status": "ok"})
+    adapter = HttpGatewayAdapter("http://test", session)
+
+    results = await asyncio.gather(*(adapter.get_health() for _ in range(5)))
+
+    assert all(r.ok() for r in results)
+    assert session.request.call_count == 1
+    assert adapter.dedup_stats == {
+        "requests": 5, "coalesced": 4, "memo_hits": 0
+    }
+
+    # Once landed, the next call goes to the network again
+    await adapter.get_health()
+    assert session.request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_flight() -> None:
+    session = _slow_session({"status": "ok"})
+    adapter = HttpGatewayAdapter("http://test", session)
+
+    first = asyncio.ensure_future(adapter.get_health())
+    second = asyncio.ensure_future(adapter.get_health())
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert (await second).ok()
+    assert session.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_memo_ttl_serves_recent_result() -> None:
+    session = _slow_session({"status": "ok"})
+    adapter = HttpGatewayAdapter("http://test", session, memo_ttl=60.0)
+
+    await adapter.get_health()
+    await adapter.get_health()
+
+    assert session.request.call_count == 1
+    assert adapter.dedup_stats["memo_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memo_evicts_expired_results() -> None:
+    session = _slow_session({"status": "ok"})
+    adapter = HttpGatewayAdapter("http://test", session, memo_ttl=0.2)
+
+    for page in range(3):
+        await adapter._request("GET", "peers", params={"page": page})
+    assert len(adapter._memo) == 3
+    await asyncio.sleep(0.25)
+
+    # Landing a new result drops the expired ones, whatever their params
+    await adapter._request("GET", "peers", params={"page": 9})
+    assert list(adapter._memo) == [("peers", (("page", "9"),))]
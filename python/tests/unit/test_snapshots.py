@@ -0,0 +1,109 @@
+import os
+import stat
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from talos_tui.core.coordinator import Coordinator
+from talos_tui.core.snapshots import (
+    SnapshotWriter,
+    read_snapshot,
+    warm_start,
+    write_snapshot,
+)
+from talos_tui.core.state import (
+    AuditEventsReceived,
+    MetricsUpdated,
+    StateStore,
+    VersionUpdated,
+)
+from talos_tui.domain.models import AuditEvent, AuditPage
+from talos_tui.ui.projections import project_dashboard
+
+
+def _event(n: int) -> dict[str, str]:
+    return {"id": f"evt-{n}", "ts": "t", "event_type": "login"}
+
+
+def test_snapshot_file_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "state.snapshot"
+    assert read_snapshot(path) is None
+
+    write_snapshot(path, {"a": [1, 2]})
+    assert read_snapshot(path) == {"a": [1, 2]}
+
+    path.write_bytes(b"garbage")
+    assert read_snapshot(path) is None
+
+
+def test_snapshot_is_owner_only(tmp_path: Path) -> None:
+    path = tmp_path / "state.snapshot"
+    # A leftover, world-readable temp file is not reused as is
+    (tmp_path / "state.snapshot.tmp").write_bytes(b"")
+    os.chmod(tmp_path / "state.snapshot.tmp", 0o644)
+    old_umask = os.umask(0o022)
+    try:
+        write_snapshot(path, {"a": 1})
+    finally:
+        os.umask(old_umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert read_snapshot(path) == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_warm_start_restores_last_known_state(tmp_path: Path) -> None:
+    path = tmp_path / "state.snapshot"
+    store = StateStore()
+    store.reduce(VersionUpdated(
+        source="gateway", version="1.2.3", contracts_version="1.0.0"
+    ))
+    store.reduce(MetricsUpdated(metrics={"connected_peers": 42}))
+    store.reduce(AuditEventsReceived(
+        items=[_event(n) for n in (3, 2, 1)], next_cursor="evt-1"
+    ))
+    await SnapshotWriter(store, path).save()
+
+    fresh = StateStore()
+    assert warm_start(fresh, path) is True
+    assert fresh.lifecycle == "BOOT"
+    assert fresh.gateway.version == "1.2.3"
+    assert fresh.metrics_history[-1]["connected_peers"] == 42
+    assert fresh.audit_cursor == "evt-1"
+    assert fresh.has_audit_event("evt-2")
+    assert "LAST SESSION" in (project_dashboard(fresh).stale_banner or "")
+
+    # Fresh metrics clear the stale marker
+    fresh.reduce(MetricsUpdated(metrics={"connected_peers": 43}))
+    assert fresh.restored_at is None
+
+    assert warm_start(StateStore(), path, max_age=-1) is False
+
+
+@pytest.mark.asyncio
+async def test_audit_resume_fetches_only_the_gap() -> None:
+    store = StateStore()
+    store.reduce(AuditEventsReceived(items=[_event(n) for n in (5, 4, 3)]))
+
+    def page(ids: list[int], more: bool) -> AuditPage:
+        return AuditPage(
+            items=[
+                AuditEvent(event_id=f"evt-{i}", ts="t", schema_id="login")
+                for i in ids
+            ],
+            next_cursor=f"evt-{ids[-1]}",
+            has_more=more,
+        )
+
+    audit = AsyncMock()
+    audit.list_events.side_effect = [
+        page([9, 8, 7], True), page([6, 5, 4], True)
+    ]
+    coord = Coordinator(store, MagicMock(), audit)
+
+    await coord._resume_audit()
+
+    assert audit.list_events.await_count == 2
+    assert audit.list_events.await_args.kwargs["before"] == "evt-7"
+    ids = [e["id"] for e in store.audit_events]
+    assert ids == [f"evt-{n}" for n in range(9, 2, -1)]
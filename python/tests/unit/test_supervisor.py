@@ -1,8 +1,8 @@
 import pytest
 import asyncio
 from unittest.mock import MagicMock
-from talos_tui.core.coordinator import Coordinator
-from talos_tui.core.state import StateStore
+from talos_tui.core.coordinator import Coordinator, TuiState
+from talos_tui.core.state import LifecycleChanged, StateStore
 
 @pytest.mark.asyncio
 async def test_coordinator_lifecycle() -> None:
@@ -36,3 +36,22 @@ async def test_coordinator_task_management() -> None:
     
     await asyncio.sleep(0.02)
     assert task not in coord._tasks  # Should be discarded on done
+
+def test_transition_publishes_lifecycle_events() -> None:
+    store = StateStore()
+    coord = Coordinator(store, MagicMock(), MagicMock())
+    seen: list[LifecycleChanged] = []
+    store.subscribe(
+        lambda e: seen.append(e) if isinstance(e, LifecycleChanged) else None
+    )
+
+    coord.transition(TuiState.HANDSHAKE_GATEWAY)
+    coord.transition(TuiState.HANDSHAKE_GATEWAY)  # no-op, same state
+    coord.transition(TuiState.FATAL)
+
+    assert [(e.previous, e.state) for e in seen] == [
+        ("BOOT", "HANDSHAKE_GATEWAY"),
+        ("HANDSHAKE_GATEWAY", "FATAL"),
+    ]
+    assert store.lifecycle == "FATAL"
+    assert store.is_fatal is True
@@ -0,0 +1,38 @@
+import json
+from pathlib import Path
+
+from talos_tui.core.state import HealthUpdated, StateStore
+from talos_tui.core.telemetry import TELEMETRY, Histogram, Telemetry
+from talos_tui.ui.screens.perf import render_telemetry
+
+
+def test_histogram_percentiles() -> None:
+    h = Histogram()
+    for _ in range(90):
+        h.observe(0.8)
+    for _ in range(10):
+        h.observe(40.0)
+
+    assert h.count == 100
+    assert h.percentile(50) == 1
+    assert h.percentile(95) == 40.0  # capped at the observed max
+    assert h.snapshot()["max_ms"] == 40.0
+
+
+def test_timer_counter_and_json_dump(tmp_path: Path) -> None:
+    t = Telemetry()
+    with t.timer("work"):
+        pass
+    t.counter("hits").inc(3)
+
+    data = json.loads(t.dump_json(tmp_path / "perf.json").read_text())
+    assert data["counters"] == {"hits": 3}
+    assert data["histograms"]["work"]["count"] == 1
+    assert render_telemetry(t).row_count == 2
+
+
+def test_reduce_is_timed_per_event_type() -> None:
+    name = "store.reduce[HealthUpdated]"
+    before = TELEMETRY.histogram(name).count
+    StateStore().reduce(HealthUpdated(source="gateway", is_ok=True))
+    assert TELEMETRY.histogram(name).count == before + 1
@@ -0,0 +1,161 @@
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from talos_tui.core import timeline
+from talos_tui.core.state import AuditEventsReceived, StateStore
+from talos_tui.core.timeline import AuditHistory
+from talos_tui.domain.timestamps import NS, format_ts, parse_ts
+from talos_tui.domain.models import AuditEvent, AuditPage
+
+BASE = parse_ts("2024-03-01T12:00:00Z")
+
+
+def test_parse_ts() -> None:
+    assert BASE == 1709294400 * NS
+    assert parse_ts("2024-03-01T12:00:00.5Z") == BASE + NS // 2
+    assert parse_ts("2024-03-01T12:00:00.000000001Z") == BASE + 1
+    assert parse_ts("2024-03-01T14:00:00+02:00") == BASE
+    assert parse_ts("2024-03-01 12:00:00") == BASE
+    assert parse_ts("yesterday") == parse_ts(None) == 0
+    assert format_ts(BASE + 1_500_000) == "2024-03-01T12:00:00.001Z"
+
+
+def _event(i: int) -> AuditEvent:
+    return AuditEvent(
+        event_id=f"evt-{i:06d}", ts=format_ts(BASE + i * NS), schema_id="login"
+    )
+
+
+class FakeAudit:
+    """
+    Newest-first history of one event per second. Cursors are opaque
+    tokens: only those issued are accepted (event ids are not).
+    """
+
+    def __init__(self, count: int, cursors: bool = True):
+        self.events = [_event(i) for i in range(count - 1, -1, -1)]
+        self.cursors = cursors
+        self.issued: Dict[str, str] = {}  # token -> last event id of a page
+        self.calls: List[Tuple[int, Optional[str]]] = []
+
+    def grow(self, count: int) -> None:
+        newest = int(self.events[0].id[4:]) + 1
+        self.events[:0] = [
+            _event(i) for i in range(newest + count - 1, newest - 1, -1)
+        ]
+
+    async def list_events(
+        self, limit: int, before: Optional[str] = None
+    ) -> AuditPage:
+        self.calls.append((limit, before))
+        start = 0
+        if before is not None:
+            last = self.issued[before]
+            start = next(
+                i for i, e in enumerate(self.events) if e.id == last
+            ) + 1
+        items = self.events[start:start + limit]
+        cursor = None
+        if items and self.cursors:
+            cursor = f"tok-{len(self.issued)}"
+            self.issued[cursor] = items[-1].id
+        return AuditPage(
+            items=items,
+            next_cursor=cursor,
+            has_more=start + limit < len(self.events),
+        )
+
+
+async def _store_with_head(
+    audit: FakeAudit, count: int, ring: int
+) -> StateStore:
+    """A store that polled the newest `count` events, as the coordinator."""
+    store = StateStore(max_audit_events=ring)
+    page = await audit.list_events(count)
+    store.reduce(AuditEventsReceived(
+        items=[e.model_dump() for e in page.items],
+        next_cursor=page.next_cursor,
+    ))
+    audit.calls.clear()
+    return store
+
+
+@pytest.mark.asyncio
+async def test_seek_within_ring_is_local_and_logarithmic(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    audit = FakeAudit(4096)
+    store = await _store_with_head(audit, 4096, ring=4096)
+    history = AuditHistory(store, audit.list_events)
+
+    compared = []
+    real_key = timeline.ts_key
+    monkeypatch.setattr(
+        timeline, "ts_key",
+        lambda item: compared.append(1) or real_key(item),
+    )
+    window = await history.seek(BASE + 1000 * NS + NS // 2, radius=5)
+    # Two binary searches (load check, window) of log2(4096) + 2 each
+    assert len(compared) <= 2 * (12 + 2)
+    assert audit.calls == []
+    assert window.complete
+    assert window.items[window.anchor]["id"] == "evt-001000"
+    assert [i["id"] for i in window.items][4:7] == [
+        "evt-001001", "evt-001000", "evt-000999"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_seek_loads_older_pages_lazily() -> None:
+    audit = FakeAudit(1000)
+    store = await _store_with_head(audit, 100, ring=100)
+    history = AuditHistory(store, audit.list_events, page_size=50)
+
+    window = await history.seek(BASE + 700 * NS, radius=10)
+    assert window.items[window.anchor]["id"] == "evt-000700"
+    # Paged back from the poll's cursor, only as far as needed
+    assert audit.calls[0] == (50, store.audit_cursor)
+    assert len(audit.calls) == 5 and len(history.older) == 250
+
+    # Before the start of history: the window ends at the oldest event
+    window = await history.seek(BASE - NS, radius=10)
+    assert history.exhausted and window.complete
+    assert window.items[-1]["id"] == "evt-000000"
+
+
+@pytest.mark.asyncio
+async def test_events_trimmed_from_the_ring_are_bridged() -> None:
+    audit = FakeAudit(1000)
+    store = await _store_with_head(audit, 100, ring=100)
+    history = AuditHistory(store, audit.list_events, page_size=50)
+    await history.seek(BASE + 880 * NS, radius=10)
+    assert history.older[0]["id"] == "evt-000899"
+
+    # The ring moves on: a poll of 20 newer events trims 900..919
+    audit.grow(20)
+    page = await audit.list_events(20)
+    store.reduce(AuditEventsReceived(
+        items=[e.model_dump() for e in page.items],
+        next_cursor=page.next_cursor,
+    ))
+    assert store.audit_events[-1]["id"] == "evt-000920"
+
+    window = await history.seek(BASE + 910 * NS, radius=5)
+    assert window.items[window.anchor]["id"] == "evt-000910"
+    ids = [i["id"] for i in list(store.audit_events) + history.older]
+    assert ids == sorted(ids, reverse=True) and len(ids) == len(set(ids))
+    assert len(ids) == 170  # 1019..850, with no gap
+
+
+@pytest.mark.asyncio
+async def test_history_ends_where_no_cursor_is_issued() -> None:
+    audit = FakeAudit(1000, cursors=False)
+    store = await _store_with_head(audit, 100, ring=100)
+    history = AuditHistory(store, audit.list_events, page_size=50)
+
+    window = await history.seek(BASE + 700 * NS, radius=10)
+    # Nothing to page from: no event id is made up as a cursor
+    assert audit.calls == []
+    assert history.exhausted and window.complete
+    assert window.items[-1]["id"] == "evt-000900"
@@ -0,0 +1,41 @@
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from talos_tui.core.telemetry import Telemetry
+from talos_tui.core.watchdog import LoopWatchdog
+from talos_tui.ui.screens.perf import render_stalls
+
+
+def blocking_decode() -> None:
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_stall_is_reported_with_offending_stack(tmp_path: Path) -> None:
+    telemetry = Telemetry()
+    profile = tmp_path / "loop.collapsed"
+    watchdog = LoopWatchdog(
+        interval=0.02, threshold=0.1, profile_path=profile,
+        telemetry=telemetry,
+    )
+    watchdog.start()
+    beat = asyncio.ensure_future(watchdog.heartbeat())
+    try:
+        await asyncio.sleep(0.05)
+        blocking_decode()
+        await asyncio.sleep(0.1)
+    finally:
+        watchdog.stop()
+        await asyncio.wait_for(beat, 1.0)
+
+    assert telemetry.counters["loop.stalls"].value >= 1
+    stall = telemetry.events[0]
+    assert stall["duration_ms"] >= 100
+    assert "blocking_decode" in stall["stack"]
+    assert "blocking_decode" in render_stalls(telemetry)
+
+    collapsed = profile.read_text()
+    assert "test_watchdog:blocking_decode" in collapsed